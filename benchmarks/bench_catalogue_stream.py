@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the expanded TD catalogue versus the number of Things.
+Reports the time-to-first-byte and total time of a cold (not cached) and a warm
+request, and the peak RSS of the process. Each Thing count runs in a
+separate process so that the peak RSS values are independent.
+"""
+
+import asyncio
+import json
+import resource
+import socket
+import subprocess
+import sys
+import time
+import uuid
+
+import tornado.httpclient
+
+from wotpy.protocols.http.server import HTTPServer
+from wotpy.wot.servient import Servient
+
+THING_COUNTS = [100, 1000, 5000]
+NUM_PROPERTIES = 10
+
+
+def _find_free_port():
+    """Returns a free TCP port."""
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    return port
+
+
+async def _fetch_timed(url):
+    """Fetches the given URL without buffering the body.
+    Returns the time to the first chunk and the total time."""
+
+    time_first = None
+    time_start = time.perf_counter()
+
+    def on_chunk(chunk):
+        nonlocal time_first
+
+        if time_first is None:
+            time_first = time.perf_counter()
+
+    http_client = tornado.httpclient.AsyncHTTPClient()
+
+    await http_client.fetch(url, streaming_callback=on_chunk, request_timeout=600)
+
+    time_end = time.perf_counter()
+
+    return time_first - time_start, time_end - time_start
+
+
+async def _run(num_things):
+    """Exposes the given number of Things and requests the expanded catalogue."""
+
+    servient = Servient(hostname="localhost", catalogue_port=_find_free_port())
+    servient.add_server(HTTPServer(port=_find_free_port()))
+    wot = await servient.start()
+
+    properties = {
+        "prop{}".format(idx): {"type": "number", "observable": True}
+        for idx in range(NUM_PROPERTIES)
+    }
+
+    thing_ids = []
+
+    for idx in range(num_things):
+        thing_id = uuid.uuid4().urn
+        td = {"id": thing_id, "title": "Thing {}".format(idx), "properties": properties}
+        wot.produce(json.dumps(td))
+        thing_ids.append(thing_id)
+
+    servient.enable_exposed_things(thing_ids)
+
+    url = "http://localhost:{}/?expanded=1".format(servient.catalogue_port)
+
+    cold = await _fetch_timed(url)
+    warm = await _fetch_timed(url)
+
+    await servient.shutdown()
+
+    peak_rss_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+    print(
+        "{:>8} {:>12.1f} {:>12.1f} {:>12.1f} {:>12.1f} {:>14.1f}".format(
+            num_things,
+            1e3 * cold[0],
+            1e3 * cold[1],
+            1e3 * warm[0],
+            1e3 * warm[1],
+            peak_rss_mib,
+        )
+    )
+
+
+def main():
+    if len(sys.argv) > 1:
+        asyncio.run(_run(int(sys.argv[1])))
+        return
+
+    print(
+        "{:>8} {:>12} {:>12} {:>12} {:>12} {:>14}".format(
+            "things",
+            "cold ttfb ms",
+            "cold tot ms",
+            "warm ttfb ms",
+            "warm tot ms",
+            "peak rss MiB",
+        )
+    )
+
+    sys.stdout.flush()
+
+    for num_things in THING_COUNTS:
+        subprocess.check_call([sys.executable, __file__, str(num_things)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Memory and serialization benchmark of the WoT dictionaries.
+Builds the fragments of a large number of interactions and reports
+the traced memory per instance and the throughput of to_dict().
+"""
+
+import time
+import tracemalloc
+
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+
+NUMBER = 100000
+
+
+def _build_fragments():
+    """Builds a list of Property fragments."""
+
+    return [
+        PropertyFragmentDict(
+            {
+                "type": "number",
+                "observable": True,
+                "forms": [{"href": "http://localhost/prop-{}".format(idx)}],
+            }
+        )
+        for idx in range(NUMBER)
+    ]
+
+
+def main():
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    fragments = _build_fragments()
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = snapshot_end.compare_to(snapshot_start, "filename")
+    total_bytes = sum(stat.size_diff for stat in stats)
+
+    print("Interactions:      {:>10}".format(NUMBER))
+    print("Traced memory:     {:>10.2f} MiB".format(total_bytes / 1024.0**2))
+    print("Bytes/interaction: {:>10.1f}".format(total_bytes / NUMBER))
+
+    time_start = time.perf_counter()
+
+    for fragment in fragments:
+        fragment.to_dict()
+
+    elapsed = time.perf_counter() - time_start
+
+    print("to_dict():         {:>10.3f} us/op".format(1e6 * elapsed / NUMBER))
+
+
+if __name__ == "__main__":
+    main()
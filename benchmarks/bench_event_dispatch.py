@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the cost of emitting a property change versus the number of subscribers.
+Each subscriber observes a different property, so only one of them is interested in the emission.
+Compares the topic-indexed EventDispatcher with a single filtered Subject.
+"""
+
+import timeit
+
+from rx.subjects import Subject
+
+from wotpy.wot.events import PropertyChangeEmittedEvent, PropertyChangeEventInit
+from wotpy.wot.exposed.dispatcher import EventDispatcher
+
+NUMBER = 5000
+SUBSCRIBER_COUNTS = [1, 10, 100, 1000]
+
+
+def _bench_filtered_subject(num_subscribers, event):
+    """Returns the emit cost (in seconds) for a single Subject filtered by each subscriber."""
+
+    subject = Subject()
+
+    for idx in range(num_subscribers):
+        name = "prop{}".format(idx)
+        subject.filter(lambda item, name=name: item.data.name == name).subscribe(
+            lambda item: None
+        )
+
+    return timeit.timeit(lambda: subject.on_next(event), number=NUMBER) / NUMBER
+
+
+def _bench_dispatcher(num_subscribers, event):
+    """Returns the emit cost (in seconds) for the topic-indexed EventDispatcher."""
+
+    dispatcher = EventDispatcher()
+
+    for idx in range(num_subscribers):
+        topic = ("propertychange", "prop{}".format(idx))
+        dispatcher.observable(topic).subscribe(lambda item: None)
+
+    topic = ("propertychange", event.data.name)
+
+    return timeit.timeit(lambda: dispatcher.emit(topic, event), number=NUMBER) / NUMBER
+
+
+def main():
+    event_init = PropertyChangeEventInit(name="prop0", value=1.0)
+    event = PropertyChangeEmittedEvent(init=event_init)
+
+    print(
+        "{:>12} {:>20} {:>20}".format(
+            "subscribers", "filtered (us/op)", "dispatcher (us/op)"
+        )
+    )
+
+    for num_subscribers in SUBSCRIBER_COUNTS:
+        filtered = _bench_filtered_subject(num_subscribers, event)
+        dispatched = _bench_dispatcher(num_subscribers, event)
+
+        print(
+            "{:>12} {:>20.3f} {:>20.3f}".format(
+                num_subscribers, 1e6 * filtered, 1e6 * dispatched
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
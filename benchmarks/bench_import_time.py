@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Import time regression benchmark.
+Imports each target module in a new interpreter with python -X importtime and
+reports the median cumulative import time and the heaviest dependencies.
+Also checks that importing the servient and building a Servient do not pull
+in the protocol bindings or their dependencies, which are loaded on first use.
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+TOP_DEPENDENCIES = 5
+
+TARGETS = [
+    "wotpy.wot.servient",
+    "wotpy.wot.wot",
+    "wotpy.protocols.http.client",
+    "wotpy.protocols.http.server",
+    "wotpy.protocols.ws.server",
+]
+
+LAZY_PREFIXES = (
+    "tornado",
+    "jsonschema",
+    "aiocoap",
+    "aiomqtt",
+    "rx",
+    "wotpy.protocols.http",
+    "wotpy.protocols.ws",
+    "wotpy.protocols.coap",
+    "wotpy.protocols.mqtt",
+)
+
+CHECK_LAZY = """
+import sys
+from wotpy.wot.servient import Servient
+Servient(hostname="localhost", catalogue_port=None)
+print("\\n".join(sys.modules))
+"""
+
+
+def _parse_importtime(stderr):
+    """Returns a dict that maps module names to (self, cumulative) import times in ms."""
+
+    times = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us) / 1e3, int(cumulative_us) / 1e3)
+
+    return times
+
+
+def _measure(module):
+    """Returns the median cumulative import time (ms) of
+    the module and the import times of the median run."""
+
+    runs = []
+
+    for _ in range(RUNS):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import {}".format(module)],
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+
+        times = _parse_importtime(proc.stderr)
+        runs.append((times[module][1], times))
+
+    runs.sort(key=lambda item: item[0])
+
+    return runs[len(runs) // 2]
+
+
+def _check_lazy():
+    """Returns the modules that should be lazily loaded but
+    are imported when a Servient is built."""
+
+    output = subprocess.check_output(
+        [sys.executable, "-c", CHECK_LAZY], universal_newlines=True
+    )
+
+    prefixes = tuple("{}.".format(prefix) for prefix in LAZY_PREFIXES)
+
+    return sorted(
+        name
+        for name in output.split()
+        if name in LAZY_PREFIXES or name.startswith(prefixes)
+    )
+
+
+def main():
+    print(
+        "{:<32} {:>12}   {}".format(
+            "module", "median (ms)", "heaviest dependencies (self ms)"
+        )
+    )
+
+    for module in TARGETS:
+        cumulative, times = _measure(module)
+
+        deps = sorted(
+            ((name, item[0]) for name, item in times.items() if name != module),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:TOP_DEPENDENCIES]
+
+        print(
+            "{:<32} {:>12.1f}   {}".format(
+                module,
+                cumulative,
+                ", ".join("{} ({:.1f})".format(name, ms) for name, ms in deps),
+            )
+        )
+
+    eager = _check_lazy()
+
+    if eager:
+        print("Eagerly imported by Servient: {}".format(", ".join(eager)))
+        sys.exit(1)
+
+    print("Servient import and construction do not load the protocol bindings")
+
+
+if __name__ == "__main__":
+    main()
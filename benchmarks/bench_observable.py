@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the asyncio-native observables versus RxPY 1.x.
+Reports the events per second delivered by a Subject to its subscribers,
+both synchronously and through a hop to the event loop (observe_on,
+as done by the WebSockets handler), and the time to import each implementation.
+"""
+
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+from rx.concurrency import IOLoopScheduler
+from rx.subjects import Subject as RxSubject
+
+from wotpy.utils.observable import Subject
+
+NUM_EVENTS = 100000
+NUM_SUBSCRIBERS = 4
+IMPORT_RUNS = 10
+
+IMPORTS = {
+    "rx": "import rx, rx.subjects, rx.concurrency",
+    "native": "import wotpy.utils.observable",
+}
+
+
+def _bench_sync(subject_cls):
+    """Returns the events/sec delivered synchronously to the subscribers."""
+
+    subject = subject_cls()
+    counter = [0]
+
+    def on_next(item):
+        counter[0] += 1
+
+    for _ in range(NUM_SUBSCRIBERS):
+        subject.subscribe(on_next)
+
+    time_start = time.perf_counter()
+
+    for idx in range(NUM_EVENTS):
+        subject.on_next(idx)
+
+    elapsed = time.perf_counter() - time_start
+
+    assert counter[0] == NUM_EVENTS * NUM_SUBSCRIBERS
+
+    return NUM_EVENTS / elapsed
+
+
+async def _bench_observe_on(subject, scheduler):
+    """Returns the events/sec delivered to the subscribers through the event loop."""
+
+    done = asyncio.Future()
+    counter = [0]
+    total = NUM_EVENTS * NUM_SUBSCRIBERS
+
+    def on_next(item):
+        counter[0] += 1
+
+        if counter[0] == total:
+            done.set_result(True)
+
+    for _ in range(NUM_SUBSCRIBERS):
+        subject.observe_on(scheduler).subscribe(on_next)
+
+    time_start = time.perf_counter()
+
+    for idx in range(NUM_EVENTS):
+        subject.on_next(idx)
+
+    await done
+
+    return NUM_EVENTS / (time.perf_counter() - time_start)
+
+
+def _bench_import(statement):
+    """Returns the median time (ms) to run the import statement in a new interpreter.
+    The modules that are needed by the runtime anyway (asyncio, logging) are
+    imported beforehand, so that only the cost of the implementation is measured."""
+
+    code = (
+        "import asyncio, logging, time; t = time.perf_counter(); "
+        "{}; print(time.perf_counter() - t)"
+    )
+    samples = []
+
+    for _ in range(IMPORT_RUNS):
+        output = subprocess.check_output([sys.executable, "-c", code.format(statement)])
+
+        samples.append(1e3 * float(output))
+
+    return statistics.median(samples)
+
+
+def main():
+    print("Events: {} / Subscribers: {}".format(NUM_EVENTS, NUM_SUBSCRIBERS))
+    print(
+        "{:<10} {:>16} {:>20} {:>14}".format(
+            "", "sync (ev/s)", "observe_on (ev/s)", "import (ms)"
+        )
+    )
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    results = {
+        "rx": (
+            _bench_sync(RxSubject),
+            loop.run_until_complete(_bench_observe_on(RxSubject(), IOLoopScheduler())),
+        ),
+        "native": (
+            _bench_sync(Subject),
+            loop.run_until_complete(_bench_observe_on(Subject(), None)),
+        ),
+    }
+
+    loop.close()
+
+    for name, (sync_rate, hop_rate) in results.items():
+        print(
+            "{:<10} {:>16.0f} {:>20.0f} {:>14.1f}".format(
+                name, sync_rate, hop_rate, _bench_import(IMPORTS[name])
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Memory benchmark of the Property value stores.
+Simulates a large fleet of Things with numeric Properties and reports the traced
+memory used to store their values with a dict-backed store for each Thing
+and with a single array-backed store shared by all of them.
+"""
+
+import random
+import time
+import tracemalloc
+import uuid
+
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.exposed.store import ArrayPropertyStore, DictPropertyStore
+from wotpy.wot.interaction import Property
+from wotpy.wot.thing import Thing
+
+NUM_THINGS = 20000
+NUM_PROPS = 5
+
+
+def _build_properties():
+    """Builds the Properties of all the Things of the fleet."""
+
+    init = PropertyFragmentDict({"type": "number", "observable": True})
+    props = []
+
+    for _ in range(NUM_THINGS):
+        thing = Thing(id=uuid.uuid4().urn)
+
+        props.append(
+            [
+                Property(thing=thing, name="prop{}".format(idx), init_dict=init)
+                for idx in range(NUM_PROPS)
+            ]
+        )
+
+    return props
+
+
+def _fill(stores, props):
+    """Sets a random float value for each Property."""
+
+    for store, thing_props in zip(stores, props):
+        for prop in thing_props:
+            store.set(prop, random.random() * 100.0)
+
+
+def _measure(name, build_stores, props):
+    """Measures the memory used by the stores built by the given function."""
+
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    stores = build_stores()
+    _fill(stores, props)
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = snapshot_end.compare_to(snapshot_start, "filename")
+    total_bytes = sum(stat.size_diff for stat in stats)
+
+    time_start = time.perf_counter()
+
+    for store, thing_props in zip(stores, props):
+        for prop in thing_props:
+            store.set(prop, store.get(prop) + 1.0)
+
+    elapsed = time.perf_counter() - time_start
+    num_values = NUM_THINGS * NUM_PROPS
+
+    print(
+        "{:<8} {:>10.2f} MiB {:>10.1f} B/thing {:>10.3f} us/update".format(
+            name,
+            total_bytes / 1024.0**2,
+            total_bytes / NUM_THINGS,
+            1e6 * elapsed / num_values,
+        )
+    )
+
+
+def main():
+    props = _build_properties()
+
+    print("Things: {} / Properties per Thing: {}".format(NUM_THINGS, NUM_PROPS))
+
+    _measure("dict", lambda: [DictPropertyStore() for _ in props], props)
+
+    def build_shared():
+        store = ArrayPropertyStore()
+        return [store] * len(props)
+
+    _measure("array", build_shared, props)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark of the Thing and Interaction URL name accessors.
+Compares the memoized accessors with the cost of computing the names on each access.
+"""
+
+import hashlib
+import timeit
+import uuid
+
+from slugify import slugify
+
+from wotpy.wot.interaction import Property
+from wotpy.wot.thing import Thing
+
+NUMBER = 100000
+
+
+def _uncached_url_name(thing):
+    """Computes the URL name of a Thing without using the cache."""
+
+    hasher = hashlib.md5()
+    hasher.update(thing.id.encode())
+    thing_uuid = str(uuid.UUID(bytes=hasher.digest()))
+
+    return slugify("{}-{}".format(thing.title, thing_uuid))
+
+
+def main():
+    thing = Thing(id=uuid.uuid4().urn, title="Benchmark Thing")
+    prop = Property(thing=thing, name="my_property", type="number")
+    thing.add_interaction(prop)
+
+    timings = [
+        ("Thing.url_name (uncached)", lambda: _uncached_url_name(thing)),
+        ("Thing.url_name", lambda: thing.url_name),
+        ("Property.url_name (uncached)", lambda: slugify(prop.name)),
+        ("Property.url_name", lambda: prop.url_name),
+    ]
+
+    for label, func in timings:
+        elapsed = timeit.timeit(func, number=NUMBER)
+        print("{:<32} {:>10.3f} us/op".format(label, 1e6 * elapsed / NUMBER))
+
+
+if __name__ == "__main__":
+    main()
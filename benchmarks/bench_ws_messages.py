@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the throughput (messages/sec) of parsing and validating WebSockets requests.
+Compares calling jsonschema.validate on every message (as the WebSockets binding used to do)
+with the registry of compiled validators and the optional fastjsonschema checkers.
+"""
+
+import json
+import time
+
+import jsonschema
+
+from wotpy.protocols.ws.enums import WebsocketMethods
+from wotpy.protocols.ws.messages import WebsocketMessageRequest, parse_ws_message
+from wotpy.protocols.ws.schemas import SCHEMA_PARAMS_WRITE_PROPERTY, SCHEMA_REQUEST
+from wotpy.utils.validators import (
+    enable_fast_validators,
+    is_fast_validators_supported,
+    validate,
+)
+
+NUM_MESSAGES = 20000
+
+RAW_MSG = json.dumps(
+    {
+        "jsonrpc": "2.0",
+        "method": WebsocketMethods.WRITE_PROPERTY,
+        "params": {"name": "temperature", "value": 21.5},
+        "id": 1,
+    }
+)
+
+
+def _handle_uncached(raw_msg):
+    """Parses and validates a request building a new validator for each schema check."""
+
+    msg = json.loads(raw_msg)
+    jsonschema.validate(msg, SCHEMA_REQUEST)
+    req = WebsocketMessageRequest(
+        method=msg["method"], params=msg["params"], trusted=True
+    )
+    jsonschema.validate(req.to_dict(), SCHEMA_REQUEST)
+    jsonschema.validate(req.params, SCHEMA_PARAMS_WRITE_PROPERTY)
+
+
+def _handle_cached(raw_msg):
+    """Parses and validates a request using the registry of compiled validators."""
+
+    req = parse_ws_message(raw_msg)
+    validate(req.params, SCHEMA_PARAMS_WRITE_PROPERTY)
+
+
+def _messages_per_sec(func):
+    """Returns the number of messages per second processed by the given function."""
+
+    func(RAW_MSG)
+
+    start = time.perf_counter()
+
+    for _ in range(NUM_MESSAGES):
+        func(RAW_MSG)
+
+    return NUM_MESSAGES / (time.perf_counter() - start)
+
+
+def main():
+    print(
+        "{:<28} {:>12.0f} msg/s".format(
+            "jsonschema.validate", _messages_per_sec(_handle_uncached)
+        )
+    )
+    print(
+        "{:<28} {:>12.0f} msg/s".format(
+            "Compiled validators", _messages_per_sec(_handle_cached)
+        )
+    )
+
+    if not is_fast_validators_supported():
+        print("fastjsonschema is not installed: skipping fast validators")
+        return
+
+    enable_fast_validators()
+
+    try:
+        print(
+            "{:<28} {:>12.0f} msg/s".format(
+                "Fast validators", _messages_per_sec(_handle_cached)
+            )
+        )
+    finally:
+        enable_fast_validators(False)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import pytest
 from tests.protocols.helpers import (
     client_test_invoke_action_async,
     client_test_invoke_action_error_async,
+    client_test_multiple_properties_async,
     client_test_on_event_async,
     client_test_on_property_change_async,
     client_test_on_property_change_error_async,
@@ -70,3 +71,11 @@ async def test_on_property_change_error(coap_servient):
 
     async for servient in coap_servient:
         await client_test_on_property_change_error_async(servient, CoAPClient)
+
+
+@pytest.mark.asyncio
+async def test_multiple_properties(coap_servient):
+    """Multiple Properties may be read and updated with a single request using the CoAP binding client."""
+
+    async for servient in coap_servient:
+        await client_test_multiple_properties_async(servient, CoAPClient)
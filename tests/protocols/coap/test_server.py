@@ -15,6 +15,7 @@ from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.coap.server import CoAPServer
 from wotpy.protocols.enums import InteractionVerbs
 from wotpy.wot.dictionaries.interaction import ActionFragmentDict
+from wotpy.wot.exposed.cache import PropertyCachePolicy
 
 
 def _get_property_href(exp_thing, prop_name, server):
@@ -127,6 +128,27 @@ def test_property_read(coap_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_property_read_max_age(coap_server):
+    """Reads of Properties with a cache policy include the Max-Age option."""
+
+    exposed_thing = next(coap_server.exposed_things)
+    prop_name = next(iter(exposed_thing.thing.properties.keys()))
+    href = _get_property_href(exposed_thing, prop_name, coap_server)
+
+    exposed_thing.set_property_cache_policy(prop_name, PropertyCachePolicy(max_age=60))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        coap_client = yield aiocoap.Context.create_client_context()
+        request_msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code.is_successful()
+        assert 0 < response.opt.max_age <= 60
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_property_write(coap_server):
     """Properties exposed in an CoAP server can be updated with a CoAP POST request."""
 
@@ -7,7 +7,7 @@ import random
 import uuid
 
 from faker import Faker
-from rx.concurrency import IOLoopScheduler
+from mock import patch
 
 from tests.utils import run_test_coroutine
 from wotpy.wot.dictionaries.interaction import (
@@ -57,7 +57,7 @@ async def client_test_on_property_change_async(servient, protocol_client_cls):
             values_observed[prop_value].set_result(True)
 
     observable = protocol_client.on_property_change(td, prop_name)
-    subscription = observable.subscribe_on(IOLoopScheduler()).subscribe(on_next)
+    subscription = observable.subscribe_on().subscribe(on_next)
     task_write = asyncio.create_task(write_next())
     await asyncio.gather(*list(values_observed.values()))
     stop_event.set()
@@ -101,7 +101,7 @@ async def client_test_on_event_async(servient, protocol_client_cls):
             future_payloads[ev.data].set_result(True)
 
     observable = protocol_client.on_event(td, event_name)
-    subscription = observable.subscribe_on(IOLoopScheduler()).subscribe(on_next)
+    subscription = observable.subscribe_on().subscribe(on_next)
     task_emit = asyncio.create_task(emit_next())
     await asyncio.gather(*list(future_payloads.values()))
     stop_event.set()
@@ -285,9 +285,7 @@ async def client_test_on_property_change_error_async(servient, protocol_client_c
     observable = protocol_client.on_property_change(td, prop_name)
     subscribe_kwargs = {"on_next": on_next, "on_error": on_error}
 
-    subscription = observable.subscribe_on(IOLoopScheduler()).subscribe(
-        **subscribe_kwargs
-    )
+    subscription = observable.subscribe_on().subscribe(**subscribe_kwargs)
 
     observe_err = await future_err
     assert isinstance(observe_err, Exception)
@@ -299,3 +297,58 @@ def client_test_on_property_change_error(*args, **kwargs):
         await client_test_on_property_change_error_async(*args, **kwargs)
 
     run_test_coroutine(test_coroutine)
+
+
+async def client_test_multiple_properties_async(
+    servient, protocol_client_cls, timeout=None
+):
+    """Helper function to test bulk Property reads and writes on bindings clients.
+    Checks that the clients do not fall back to one request per Property."""
+
+    exposed_thing = next(servient.exposed_things)
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+    for prop_name in prop_names:
+        exposed_thing.add_property(
+            prop_name,
+            PropertyFragmentDict({"type": "string", "observable": True}),
+            value=Faker().sentence(),
+        )
+
+    servient.refresh_forms()
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    protocol_client = protocol_client_cls()
+
+    assert len(td.get_thing_forms())
+
+    values = {prop_name: Faker().sentence() for prop_name in prop_names[:2]}
+
+    with patch.object(
+        protocol_client_cls, "read_property", side_effect=Exception
+    ), patch.object(protocol_client_cls, "write_property", side_effect=Exception):
+        await protocol_client.write_multiple_properties(td, values, timeout=timeout)
+
+        for prop_name, value in values.items():
+            assert (await exposed_thing.read_property(prop_name)) == value
+
+        read_values = await protocol_client.read_multiple_properties(
+            td, list(values.keys()), timeout=timeout
+        )
+
+        assert read_values == values
+
+        all_values = await protocol_client.read_all_properties(td, timeout=timeout)
+
+        assert set(all_values.keys()) == set(exposed_thing.thing.properties.keys())
+
+        for prop_name in prop_names:
+            assert all_values[prop_name] == (
+                await exposed_thing.read_property(prop_name)
+            )
+
+
+def client_test_multiple_properties(*args, **kwargs):
+    async def test_coroutine():
+        await client_test_multiple_properties_async(*args, **kwargs)
+
+    run_test_coroutine(test_coroutine)
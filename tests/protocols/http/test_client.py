@@ -9,6 +9,7 @@ from tests.protocols.helpers import (
     client_test_invoke_action,
     client_test_invoke_action_error,
     client_test_on_property_change_error,
+    client_test_multiple_properties,
 )
 from wotpy.protocols.http.client import HTTPClient
 
@@ -54,3 +55,9 @@ def test_on_property_change_error(http_servient):
     observation are propagated to the subscription as expected."""
 
     client_test_on_property_change_error(http_servient, HTTPClient)
+
+
+def test_multiple_properties(http_servient):
+    """The HTTP client can read and write multiple properties with a single request."""
+
+    client_test_multiple_properties(http_servient, HTTPClient)
@@ -19,6 +19,9 @@ from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.http.enums import HTTPSchemes
 from wotpy.protocols.http.server import HTTPServer
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.enums import OverflowPolicy
+from wotpy.wot.exposed.admission import AdmissionPolicy
+from wotpy.wot.exposed.cache import PropertyCachePolicy
 from wotpy.wot.exposed.thing import ExposedThing
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
@@ -87,6 +90,88 @@ def test_property_get(http_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_property_get_cache_control(http_server):
+    """Reads of Properties with a cache policy include the Cache-Control header."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop_name = next(iter(exposed_thing.thing.properties.keys()))
+    href = _get_property_href(exposed_thing, prop_name, http_server)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        response = yield http_client.fetch(href)
+
+        assert "Cache-Control" not in response.headers
+
+        exposed_thing.set_property_cache_policy(
+            prop_name, PropertyCachePolicy(max_age=60, stale_while_revalidate=30)
+        )
+
+        response = yield http_client.fetch(href)
+
+        cache_control = response.headers.get("Cache-Control")
+
+        assert cache_control.startswith("max-age=")
+        assert 0 < int(cache_control.split(",")[0].split("=")[1]) <= 60
+        assert "stale-while-revalidate=30" in cache_control
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_property_get_history(http_server):
+    """The recent values of Properties with history can be retrieved with HTTP GET requests."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop_name = next(iter(exposed_thing.thing.properties.keys()))
+    href_history = "{}/history".format(
+        _get_property_href(exposed_thing, prop_name, http_server)
+    )
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        with pytest.raises(tornado.httpclient.HTTPClientError) as exc_info:
+            yield http_client.fetch(href_history)
+
+        assert exc_info.value.code == 404
+
+        exposed_thing.set_property_history_size(prop_name, 3)
+
+        prop_values = [Faker().pyint() for _ in range(5)]
+
+        for value in prop_values:
+            yield exposed_thing.properties[prop_name].write(value)
+
+        response = yield http_client.fetch(href_history)
+        history = json.loads(response.body).get("history")
+
+        assert [item["value"] for item in history] == prop_values[-3:]
+        assert all(isinstance(item["timestamp"], float) for item in history)
+
+        response = yield http_client.fetch("{}?limit=1".format(href_history))
+        history = json.loads(response.body).get("history")
+
+        assert [item["value"] for item in history] == prop_values[-1:]
+
+        response = yield http_client.fetch("{}?last=3600".format(href_history))
+
+        assert len(json.loads(response.body).get("history")) == 3
+
+        since = history[0]["timestamp"] + 1
+        response = yield http_client.fetch("{}?since={}".format(href_history, since))
+
+        assert json.loads(response.body).get("history") == []
+
+        with pytest.raises(tornado.httpclient.HTTPClientError) as exc_info:
+            yield http_client.fetch("{}?limit=abc".format(href_history))
+
+        assert exc_info.value.code == 400
+
+    run_test_coroutine(test_coroutine)
+
+
 def _test_property_set(server, body, prop_value, headers=None):
     """Helper function to test Property updates over HTTP."""
 
@@ -260,6 +345,52 @@ def test_action_run_error(http_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_action_run_rejected(http_server):
+    """Action invocations that are not admitted are rejected with a 503 response."""
+
+    exposed_thing = next(http_server.exposed_things)
+    action_name = next(iter(exposed_thing.thing.actions.keys()))
+    href = _get_action_href(exposed_thing, action_name, http_server)
+
+    action_future = Future()
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        yield action_future
+        raise tornado.gen.Return(parameters.get("input"))
+
+    exposed_thing.set_action_handler(action_name, action_handler)
+
+    exposed_thing.set_action_admission_policy(
+        action_name,
+        AdmissionPolicy(max_concurrency=1, overflow=OverflowPolicy.REJECT),
+    )
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        def build_request():
+            return tornado.httpclient.HTTPRequest(
+                href,
+                method="POST",
+                body=json.dumps({"input": Faker().pyint()}),
+                headers=JSON_HEADERS,
+            )
+
+        response = yield http_client.fetch(build_request())
+
+        assert response.code == 200
+
+        response = yield http_client.fetch(build_request(), raise_error=False)
+
+        assert response.code == 503
+
+        action_future.set_result(True)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_event_subscribe(http_server):
     """Events exposed in an HTTP server can be subscribed to with an HTTP GET request."""
 
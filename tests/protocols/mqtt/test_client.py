@@ -6,6 +6,7 @@ import pytest
 from tests.protocols.helpers import (
     client_test_invoke_action_async,
     client_test_invoke_action_error_async,
+    client_test_multiple_properties_async,
     client_test_on_event_async,
     client_test_on_property_change_async,
     client_test_read_property_async,
@@ -67,6 +68,14 @@ async def test_on_event(mqtt_servient):
         await client_test_on_event_async(servient, MQTTClient)
 
 
+@pytest.mark.asyncio
+async def test_multiple_properties(mqtt_servient):
+    """Multiple Properties may be read and updated with a single request using the MQTT binding client."""
+
+    async for servient in mqtt_servient:
+        await client_test_multiple_properties_async(servient, MQTTClient)
+
+
 @pytest.mark.skip(reason="ToDo: Implement this test")
 def test_timeout_invoke_action(mqtt_servient):
     """Timeouts can be defined on Action invocations."""
@@ -20,6 +20,7 @@ from tests.protocols.mqtt.broker import (
 )
 from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.mqtt.server import MQTTServer
 from wotpy.protocols.mqtt.utils import MQTTBrokerURL
 from wotpy.wot.dictionaries.interaction import ActionFragmentDict, PropertyFragmentDict
@@ -481,6 +482,46 @@ async def test_action_invoke_error(mqtt_server):
             assert msg_data.get("result", None) is None
 
 
+@pytest.mark.asyncio
+async def test_property_multiple_error(mqtt_server):
+    """Invalid requests to read or write multiple Properties
+    are answered with an error by the MQTT binding."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    form = mqtt_server.build_thing_forms(None, exposed_thing.thing)[0]
+    topic_req = "/".join(form.href.split("/")[3:])
+    topic_ack = PropertyMQTTHandler.to_multiple_write_ack_topic(topic_req)
+    topic_values = PropertyMQTTHandler.to_multiple_values_topic(topic_req)
+
+    requests = [
+        (
+            topic_ack,
+            "ack",
+            {"action": "writemultiple", "values": [1], "ack": uuid.uuid4().hex},
+        ),
+        (
+            topic_values,
+            "id",
+            {"action": "readmultiple", "names": ["unknown"], "id": uuid.uuid4().hex},
+        ),
+    ]
+
+    for topic_res, match_key, data in requests:
+        async with mqtt_client(topic_req) as client_req:
+            async with mqtt_client(topic_res) as client_res:
+                await client_req.publish(
+                    topic=topic_req, payload=json.dumps(data).encode(), qos=2
+                )
+
+                async with client_res.messages() as msgs:
+                    async for msg in msgs:
+                        msg_data = json.loads(msg.payload.decode())
+                        break
+
+                assert msg_data.get("error")
+                assert msg_data.get(match_key) == data[match_key]
+
+
 @pytest.mark.asyncio
 async def test_action_invoke_parallel(mqtt_server):
     """Multiple Actions can be invoked in parallel using the MQTT binding."""
@@ -9,18 +9,19 @@ import pytest
 import tornado.concurrent
 import tornado.gen
 from mock import patch
-from rx.concurrency import IOLoopScheduler
 from tornado.concurrent import Future
 
 from tests.protocols.helpers import (
     client_test_invoke_action,
     client_test_invoke_action_error,
+    client_test_multiple_properties,
     client_test_on_event,
     client_test_on_property_change_error,
     client_test_read_property,
     client_test_write_property,
 )
 from tests.utils import run_test_coroutine
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.exceptions import ClientRequestTimeout, ProtocolClientException
 from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.wot.td import ThingDescription
@@ -111,8 +112,8 @@ def test_on_property_change(websocket_servient):
         on_next_01 = build_on_next(future_conn_01, future_values_01)
         on_next_02 = build_on_next(future_conn_02, future_values_02)
 
-        subscription_01 = obsv_01.subscribe_on(IOLoopScheduler()).subscribe(on_next_01)
-        subscription_02 = obsv_02.subscribe_on(IOLoopScheduler()).subscribe(on_next_02)
+        subscription_01 = obsv_01.subscribe_on().subscribe(on_next_01)
+        subscription_02 = obsv_02.subscribe_on().subscribe(on_next_02)
 
         while not future_conn_01.done() or not future_conn_02.done():
             yield exposed_thing.write_property(prop_name_01, uuid.uuid4().hex)
@@ -148,6 +149,36 @@ def test_on_property_change_error(websocket_servient):
     client_test_on_property_change_error(websocket_servient, WebsocketClient)
 
 
+def test_multiple_properties(websocket_servient):
+    """The Websockets client can read and write multiple properties with a single request."""
+
+    client_test_multiple_properties(websocket_servient, WebsocketClient)
+
+
+def test_thing_form_op():
+    """The Websockets client only uses the Thing-level Form of the requested operation."""
+
+    td = ThingDescription(
+        {
+            "id": uuid.uuid4().urn,
+            "title": uuid.uuid4().hex,
+            "properties": {"status": {"type": "string"}},
+            "forms": [
+                {
+                    "href": "ws://localhost:9191/thing",
+                    "op": InteractionVerbs.READ_ALL_PROPERTIES,
+                }
+            ],
+        }
+    )
+
+    client = WebsocketClient()
+
+    assert client._has_thing_form(td, InteractionVerbs.READ_ALL_PROPERTIES)
+    assert not client._has_thing_form(td, InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+    assert not client._has_thing_form(td, InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+
 def _condition_coro(*args, **kwargs):
     """Coroutine mock side effect that returns a Condition that is never notified."""
 
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from tests.utils import run_test_coroutine
+from wotpy.wot.enums import OverflowPolicy
+from wotpy.wot.exposed.admission import (
+    AdmissionController,
+    AdmissionDroppedError,
+    AdmissionPolicy,
+    AdmissionRejectedError,
+)
+
+
+def test_admission_policy_validation():
+    """Invalid admission policies raise errors."""
+
+    with pytest.raises(ValueError):
+        AdmissionPolicy(max_concurrency=0)
+
+    with pytest.raises(ValueError):
+        AdmissionPolicy(max_concurrency=1, max_queue=-1)
+
+    with pytest.raises(ValueError):
+        AdmissionPolicy(max_concurrency=1, overflow="unknown")
+
+
+def test_admission_overflow_policies():
+    """Admission controllers reject, queue or drop invocations
+    depending on the overflow policy."""
+
+    async def test_coroutine():
+        reject = AdmissionController(
+            AdmissionPolicy(max_concurrency=1, overflow=OverflowPolicy.REJECT)
+        )
+
+        slot = reject.acquire()
+        assert slot.done()
+
+        with pytest.raises(AdmissionRejectedError):
+            reject.acquire()
+
+        reject.release()
+        assert reject.acquire().done()
+
+        queue = AdmissionController(
+            AdmissionPolicy(
+                max_concurrency=1, max_queue=2, overflow=OverflowPolicy.QUEUE
+            )
+        )
+
+        slots = [queue.acquire() for _ in range(3)]
+
+        assert [item.done() for item in slots] == [True, False, False]
+        assert queue.metrics()["queue_depth"] == 2
+
+        with pytest.raises(AdmissionRejectedError):
+            queue.acquire()
+
+        queue.release()
+
+        assert slots[1].done()
+        assert queue.metrics()["queue_depth"] == 1
+
+        queue.abandon(slots[2])
+        queue.release()
+
+        assert queue.metrics()["running"] == 0
+        assert queue.metrics()["rejected"] == 1
+
+        drop = AdmissionController(
+            AdmissionPolicy(
+                max_concurrency=1, max_queue=1, overflow=OverflowPolicy.DROP_OLDEST
+            )
+        )
+
+        slots = [drop.acquire() for _ in range(3)]
+
+        with pytest.raises(AdmissionDroppedError):
+            await slots[1]
+
+        assert not slots[2].done()
+
+        drop.release()
+        await slots[2]
+
+        metrics = drop.metrics()
+
+        assert metrics["dropped"] == 1
+        assert metrics["admitted"] == 2
+        assert metrics["max_queue_depth"] == 1
+
+    run_test_coroutine(test_coroutine)
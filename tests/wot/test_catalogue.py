@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import uuid
+
+import tornado.gen
+
+from tests.utils import run_test_coroutine
+from wotpy.wot.catalogue import CatalogueChangeLog
+
+
+def test_changes_since():
+    """The catalogue change log returns the Things added,
+    changed or removed since a given version."""
+
+    change_log = CatalogueChangeLog()
+    thing_ids = [uuid.uuid4().urn for _ in range(3)]
+
+    for thing_id in thing_ids:
+        change_log.record_added(thing_id)
+
+    version = change_log.version
+
+    assert version == 3
+
+    change_log.record_changed(thing_ids[0])
+    change_log.record_removed(thing_ids[1])
+    change_log.record_changed(uuid.uuid4().urn)
+
+    new_thing_id = uuid.uuid4().urn
+    change_log.record_added(new_thing_id)
+
+    changes = change_log.changes_since(version)
+
+    assert changes["version"] == change_log.version == version + 3
+    assert not changes["reset"]
+    assert changes["added"] == [new_thing_id]
+    assert changes["changed"] == [thing_ids[0]]
+    assert changes["removed"] == [thing_ids[1]]
+
+    changes_all = change_log.changes_since(0)
+
+    assert set(changes_all["added"]) == {thing_ids[0], thing_ids[2], new_thing_id}
+    assert changes_all["removed"] == [thing_ids[1]]
+
+    changes_none = change_log.changes_since(change_log.version)
+
+    assert not changes_none["added"]
+    assert not changes_none["changed"]
+    assert not changes_none["removed"]
+
+
+def test_changes_since_pruned():
+    """Clients are reset when the requested version has been pruned from the log."""
+
+    change_log = CatalogueChangeLog(max_removed=1)
+    thing_ids = [uuid.uuid4().urn for _ in range(3)]
+
+    for thing_id in thing_ids:
+        change_log.record_added(thing_id)
+
+    change_log.record_removed(thing_ids[0])
+    version = change_log.version
+    change_log.record_removed(thing_ids[1])
+
+    assert change_log.changes_since(version)["removed"] == [thing_ids[1]]
+
+    changes_pruned = change_log.changes_since(version - 1)
+
+    assert changes_pruned["reset"]
+    assert changes_pruned["added"] == [thing_ids[2]]
+
+    assert change_log.changes_since(change_log.version + 1)["reset"]
+
+
+def test_wait_for_changes():
+    """Clients may wait for the catalogue version to change."""
+
+    change_log = CatalogueChangeLog()
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        version = change_log.version
+
+        yield change_log.wait_for_changes(version, timeout=0.01)
+
+        assert change_log.version == version
+
+        future_wait = tornado.gen.convert_yielded(
+            change_log.wait_for_changes(version, timeout=10)
+        )
+
+        yield tornado.gen.moment
+
+        assert not future_wait.done()
+
+        change_log.record_added(uuid.uuid4().urn)
+
+        yield future_wait
+
+        assert change_log.changes_since(version)["added"]
+
+    run_test_coroutine(test_coroutine)
@@ -6,14 +6,16 @@ import uuid
 import tornado.gen
 import tornado.ioloop
 from faker import Faker
-from rx.concurrency import IOLoopScheduler
+from mock import AsyncMock, MagicMock
 from tornado.concurrent import Future
 
 from tests.utils import find_free_port, run_test_coroutine
+from wotpy.protocols.enums import Protocols
 from wotpy.protocols.http.client import HTTPClient
 from wotpy.protocols.http.server import HTTPServer
 from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.protocols.ws.server import WebsocketServer
+from wotpy.wot.consumed.thing import ConsumedThing
 from wotpy.wot.servient import Servient
 from wotpy.wot.td import ThingDescription
 
@@ -176,7 +178,7 @@ def test_on_event(consumed_exposed_pair):
 
     def subscribe_func(event_name, on_next):
         observable = consumed_thing.on_event(event_name)
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(on_next)
+        return observable.subscribe_on().subscribe(on_next)
 
     _test_event_emission_events(exposed_thing, subscribe_func)
 
@@ -189,7 +191,7 @@ def test_on_property_change(consumed_exposed_pair):
 
     def subscribe_func(prop_name, on_next):
         observable = consumed_thing.on_property_change(prop_name)
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(on_next)
+        return observable.subscribe_on().subscribe(on_next)
 
     _test_property_change_events(exposed_thing, subscribe_func)
 
@@ -416,3 +418,46 @@ def test_consumed_client_protocols_preference():
     assert client_02_class in client_server_map.keys()
 
     tornado.ioloop.IOLoop.current().run_sync(servient_shutdown)
+
+
+def test_multiple_properties_clients():
+    """Bulk Property reads and writes are split by the client selected for each Property."""
+
+    td = ThingDescription(
+        {
+            "id": uuid.uuid4().urn,
+            "title": uuid.uuid4().hex,
+            "properties": {
+                "prop_http": {"type": "string"},
+                "prop_ws": {"type": "string"},
+            },
+        }
+    )
+
+    client_http = MagicMock(protocol=Protocols.HTTP)
+    client_ws = MagicMock(protocol=Protocols.WEBSOCKETS)
+    clients = {"prop_http": client_http, "prop_ws": client_ws}
+
+    for client, name in [(client_http, "prop_http"), (client_ws, "prop_ws")]:
+        client.read_multiple_properties = AsyncMock(return_value={name: name})
+        client.write_multiple_properties = AsyncMock()
+
+    servient = MagicMock()
+    servient.select_client.side_effect = lambda td, name: clients[name]
+    consumed_thing = ConsumedThing(servient=servient, td=td)
+
+    async def test_coroutine():
+        values = await consumed_thing.read_multiple_properties(["prop_http", "prop_ws"])
+
+        assert values == {"prop_http": "prop_http", "prop_ws": "prop_ws"}
+        assert client_http.read_multiple_properties.call_args[0][1] == ["prop_http"]
+        assert client_ws.read_multiple_properties.call_args[0][1] == ["prop_ws"]
+
+        assert (await consumed_thing.read_all_properties()) == values
+
+        await consumed_thing.write_multiple_properties({"prop_http": 1, "prop_ws": 2})
+
+        assert client_http.write_multiple_properties.call_args[0][1] == {"prop_http": 1}
+        assert client_ws.write_multiple_properties.call_args[0][1] == {"prop_ws": 2}
+
+    run_test_coroutine(test_coroutine)
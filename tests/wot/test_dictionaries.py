@@ -243,3 +243,30 @@ def test_thing_fragment_setters():
     thing_fragment.version = version_updated
 
     assert thing_fragment.version.instance == version_updated.instance
+
+
+def test_dict_slots_and_field_maps():
+    """WoT dictionaries do not allocate a per-instance dict and
+    resolve snake_case and camelCase attributes to the same field."""
+
+    form = FormDict(href="http://localhost/prop", content_type="text/plain")
+
+    assert not hasattr(form, "__dict__")
+    assert form.content_type == form.contentType == "text/plain"
+    assert form.op is None
+    assert form.to_dict() == {
+        "href": "http://localhost/prop",
+        "contentType": "text/plain",
+    }
+
+    with pytest.raises(AttributeError):
+        getattr(form, Faker().pystr())
+
+    with pytest.raises(AttributeError):
+        form.unknown_attribute = Faker().pystr()
+
+    action_fragment = ActionFragmentDict(input={"type": DataType.NUMBER})
+    action_dict = action_fragment.to_dict()
+
+    assert action_fragment.safe is False
+    assert action_dict == {"forms": [], "input": {"type": DataType.NUMBER}}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from tests.utils import run_test_coroutine
+from wotpy.wot.enums import HandlerExecutionMode
+from wotpy.wot.executors import HandlerExecutors
+
+
+def _get_pid(value):
+    """Returns the value and the ID of the current process."""
+
+    return value, os.getpid()
+
+
+def test_executors_modes():
+    """Handlers may be executed inline, in a thread pool or in a process pool."""
+
+    executors = HandlerExecutors(thread_workers=2, process_workers=1)
+
+    async def test_coroutine():
+        async def coro_handler(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        result = await executors.run(HandlerExecutionMode.INLINE, coro_handler, 2)
+        assert result == 4
+
+        result = await executors.run(
+            HandlerExecutionMode.THREAD, lambda: threading.current_thread()
+        )
+
+        assert result is not threading.current_thread()
+
+        value, pid = await executors.run(HandlerExecutionMode.PROCESS, _get_pid, 3)
+
+        assert value == 3
+        assert pid != os.getpid()
+
+        with pytest.raises(ZeroDivisionError):
+            await executors.run(HandlerExecutionMode.THREAD, lambda: 1 / 0)
+
+        with pytest.raises(ValueError):
+            await executors.run("unknown", lambda: None)
+
+    try:
+        run_test_coroutine(test_coroutine)
+    finally:
+        executors.shutdown()
+
+    metrics = executors.metrics()
+
+    assert metrics[HandlerExecutionMode.INLINE]["count"] == 1
+    assert metrics[HandlerExecutionMode.THREAD]["count"] == 2
+    assert metrics[HandlerExecutionMode.THREAD]["errors"] == 1
+    assert metrics[HandlerExecutionMode.PROCESS]["count"] == 1
+    assert metrics[HandlerExecutionMode.PROCESS]["max_ms"] > 0
+
+
+def test_executors_thread_does_not_block_loop():
+    """Blocking handlers executed in the thread pool do not block the event loop."""
+
+    executors = HandlerExecutors(thread_workers=1)
+
+    async def test_coroutine():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        task_ticker = asyncio.ensure_future(ticker())
+
+        await executors.run(HandlerExecutionMode.THREAD, time.sleep, 0.2)
+
+        task_ticker.cancel()
+
+        assert len(ticks) > 5
+
+    try:
+        run_test_coroutine(test_coroutine)
+    finally:
+        executors.shutdown()
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import asyncio
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 
+from mock import patch
 import pytest
 import tornado.gen
 import tornado.ioloop
@@ -15,12 +17,28 @@ from tornado.concurrent import Future
 from tests.utils import run_test_coroutine
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
 from wotpy.wot.dictionaries.thing import ThingFragment
-from wotpy.wot.enums import DataType, TDChangeMethod, TDChangeType
+from wotpy.wot.enums import (
+    DataType,
+    HandlerExecutionMode,
+    OverflowPolicy,
+    TDChangeMethod,
+    TDChangeType,
+)
+from wotpy.wot.exposed.admission import AdmissionPolicy, AdmissionRejectedError
+from wotpy.wot.exposed.cache import PropertyCachePolicy
+from wotpy.wot.exposed.notification import NotificationPolicy
 from wotpy.wot.exposed.thing import ExposedThing
 from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
 from wotpy.wot.thing import Thing
 
 
+def _upper_parameters(parameters):
+    """Returns the upper case version of the Action input."""
+
+    return str(parameters.get("input")).upper()
+
+
 def _test_td_change_events(
     exposed_thing, property_fragment, event_fragment, action_fragment, subscribe_func
 ):
@@ -163,6 +181,105 @@ def test_write_non_writable_property(exposed_thing):
     run_test_coroutine(test_coroutine)
 
 
+def test_multiple_properties(exposed_thing, property_fragment):
+    """Multiple Properties may be retrieved and updated at once on ExposedThings."""
+
+    prop_init_non_writable = PropertyFragmentDict({"type": "string", "readOnly": True})
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        names = [uuid.uuid4().hex for _ in range(3)]
+        name_ro = uuid.uuid4().hex
+
+        for name in names:
+            exposed_thing.add_property(name, property_fragment, value=Faker().pystr())
+
+        exposed_thing.add_property(name_ro, prop_init_non_writable, value=None)
+
+        updated = {name: Faker().pystr() for name in names}
+
+        yield exposed_thing.write_multiple_properties(updated)
+
+        values = yield exposed_thing.read_multiple_properties(names[:2])
+
+        assert values == {name: updated[name] for name in names[:2]}
+
+        values = yield exposed_thing.read_all_properties()
+
+        assert values == dict(updated, **{name_ro: None})
+
+        with pytest.raises(TypeError):
+            yield exposed_thing.write_multiple_properties(
+                {names[0]: Faker().pystr(), name_ro: Faker().pystr()}
+            )
+
+        value = yield exposed_thing.read_property(names[0])
+
+        assert value == updated[names[0]]
+
+        with pytest.raises(ValueError):
+            yield exposed_thing.read_multiple_properties([uuid.uuid4().hex])
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_read_property_cache(exposed_thing, property_fragment):
+    """The values returned by Property read handlers may be cached."""
+
+    prop_name = Faker().pystr()
+    exposed_thing.add_property(prop_name, property_fragment)
+
+    state = {"calls": 0, "now": 1000.0}
+
+    async def read_handler():
+        state["calls"] += 1
+        await asyncio.sleep(0.01)
+        return state["calls"]
+
+    exposed_thing.set_property_read_handler(prop_name, read_handler)
+
+    exposed_thing.set_property_cache_policy(
+        prop_name, PropertyCachePolicy(max_age=10, stale_while_revalidate=5)
+    )
+
+    async def test_coroutine():
+        values = await asyncio.gather(
+            *[exposed_thing.read_property(prop_name) for _ in range(5)]
+        )
+
+        assert values == [1] * 5
+        assert state["calls"] == 1
+        assert exposed_thing.get_property_max_age(prop_name) == 10
+
+        state["now"] += 12
+
+        assert (await exposed_thing.read_property(prop_name)) == 1
+        assert (await exposed_thing.read_property(prop_name)) == 1
+
+        await asyncio.sleep(0.05)
+
+        assert state["calls"] == 2
+        assert (await exposed_thing.read_property(prop_name)) == 2
+
+        state["now"] += 20
+
+        assert (await exposed_thing.read_property(prop_name)) == 3
+
+        await exposed_thing.write_property(prop_name, Faker().pystr())
+
+        assert (await exposed_thing.read_property(prop_name)) == 4
+
+        exposed_thing.set_property_cache_policy(prop_name, None)
+
+        assert exposed_thing.get_property_max_age(prop_name) is None
+        assert (await exposed_thing.read_property(prop_name)) == 5
+        assert (await exposed_thing.read_property(prop_name)) == 6
+
+    with patch("wotpy.wot.exposed.cache.time") as time_mock:
+        time_mock.monotonic.side_effect = lambda: state["now"]
+        run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action(exposed_thing, action_fragment):
     """Actions can be invoked on ExposedThings."""
 
@@ -214,6 +331,178 @@ def test_invoke_action(exposed_thing, action_fragment):
     run_test_coroutine(test_coroutine)
 
 
+def test_handler_execution_modes(exposed_thing, property_fragment, action_fragment):
+    """Handlers may declare an execution mode to run in the executors of the servient."""
+
+    prop_name = Faker().pystr()
+    action_name = Faker().pystr()
+    state = {"value": None}
+
+    def write_handler(value):
+        time.sleep(0.01)
+        state["value"] = value
+
+    exposed_thing.add_property(prop_name, property_fragment)
+    exposed_thing.add_action(
+        action_name,
+        action_fragment,
+        _upper_parameters,
+        mode=HandlerExecutionMode.PROCESS,
+    )
+
+    exposed_thing.set_property_read_handler(
+        prop_name, lambda: state["value"], mode=HandlerExecutionMode.INLINE
+    )
+
+    exposed_thing.set_property_write_handler(
+        prop_name, write_handler, mode=HandlerExecutionMode.THREAD
+    )
+
+    executors = exposed_thing.servient.executors
+
+    async def test_coroutine():
+        value = Faker().pystr()
+
+        await exposed_thing.write_property(prop_name, value)
+
+        assert (await exposed_thing.read_property(prop_name)) == value
+        assert (await exposed_thing.invoke_action(action_name, value)) == value.upper()
+
+    try:
+        run_test_coroutine(test_coroutine)
+    finally:
+        executors.shutdown()
+
+    metrics = executors.metrics()
+
+    for mode in HandlerExecutionMode.list():
+        assert metrics[mode]["count"] == 1
+
+    assert metrics[HandlerExecutionMode.THREAD]["mean_ms"] >= 10
+
+    with pytest.raises(ValueError):
+        exposed_thing.set_property_read_handler(prop_name, lambda: None, mode="unknown")
+
+
+def test_invoke_action_admission(exposed_thing, action_fragment):
+    """Concurrent invocations of Actions may be limited per Action and per Thing."""
+
+    action_names = [uuid.uuid4().hex for _ in range(2)]
+    state = {"running": 0, "max_running": 0}
+
+    async def handler(parameters):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return parameters.get("input")
+
+    for name in action_names:
+        exposed_thing.add_action(name, action_fragment, handler)
+
+    exposed_thing.set_action_admission_policy(
+        action_names[0],
+        AdmissionPolicy(max_concurrency=1, max_queue=2, overflow=OverflowPolicy.QUEUE),
+    )
+
+    async def test_coroutine():
+        futures = [
+            exposed_thing.try_invoke_action(action_names[0], idx) for idx in range(3)
+        ]
+
+        metrics = exposed_thing.get_action_admission_metrics(action_names[0])
+
+        assert metrics["queue_depth"] == 2
+
+        with pytest.raises(AdmissionRejectedError):
+            exposed_thing.try_invoke_action(action_names[0], 3)
+
+        with pytest.raises(AdmissionRejectedError):
+            await exposed_thing.invoke_action(action_names[0], 3)
+
+        with pytest.raises(AdmissionRejectedError):
+            await exposed_thing.actions[action_names[0]].invoke(3)
+
+        assert asyncio.iscoroutinefunction(exposed_thing.invoke_action)
+        assert asyncio.iscoroutinefunction(
+            exposed_thing.actions[action_names[0]].invoke
+        )
+
+        assert (await asyncio.gather(*futures)) == [0, 1, 2]
+        assert state["max_running"] == 1
+        assert (
+            exposed_thing.get_action_admission_metrics(action_names[0])["running"] == 0
+        )
+
+        state["max_running"] = 0
+
+        exposed_thing.set_admission_policy(
+            AdmissionPolicy(max_concurrency=2, overflow=OverflowPolicy.QUEUE)
+        )
+
+        futures = [
+            exposed_thing.try_invoke_action(action_names[idx % 2], idx)
+            for idx in range(6)
+        ]
+
+        assert exposed_thing.get_admission_metrics()["queue_depth"] == 2
+        assert (await asyncio.gather(*futures)) == list(range(6))
+        assert state["max_running"] == 2
+        assert exposed_thing.get_admission_metrics()["running"] == 0
+
+        exposed_thing.set_admission_policy(None)
+        exposed_thing.set_action_admission_policy(action_names[0], None)
+
+        assert exposed_thing.get_admission_metrics() is None
+        assert exposed_thing.get_action_admission_metrics(action_names[0]) is None
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_invoke_action_admission_queued_slots(exposed_thing, action_fragment):
+    """Invocations queued by the Action policy do not hold Thing slots,
+    so that other Actions can still be admitted by the Thing policy."""
+
+    action_names = [uuid.uuid4().hex for _ in range(2)]
+    state = {"running": 0}
+
+    async def handler(parameters):
+        state["running"] += 1
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return parameters.get("input")
+
+    for name in action_names:
+        exposed_thing.add_action(name, action_fragment, handler)
+
+    exposed_thing.set_action_admission_policy(
+        action_names[0],
+        AdmissionPolicy(max_concurrency=1, overflow=OverflowPolicy.QUEUE),
+    )
+
+    exposed_thing.set_admission_policy(
+        AdmissionPolicy(max_concurrency=2, overflow=OverflowPolicy.REJECT)
+    )
+
+    async def test_coroutine():
+        futures = [
+            exposed_thing.try_invoke_action(action_names[0], 0),
+            exposed_thing.try_invoke_action(action_names[0], 1),
+        ]
+
+        assert exposed_thing.get_admission_metrics()["running"] == 1
+
+        futures.append(exposed_thing.try_invoke_action(action_names[1], 2))
+
+        assert exposed_thing.get_admission_metrics()["running"] == 2
+
+        assert (await asyncio.gather(*futures)) == [0, 1, 2]
+        assert exposed_thing.get_admission_metrics()["running"] == 0
+        assert exposed_thing.get_admission_metrics()["rejected"] == 0
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action_undefined_handler(exposed_thing, action_fragment):
     """Actions with undefined handlers return an error."""
 
@@ -270,6 +559,228 @@ def test_on_property_change(exposed_thing, property_fragment):
     run_test_coroutine(test_coroutine)
 
 
+def test_on_property_change_isolated(exposed_thing, property_fragment):
+    """Property change observers only receive the changes of their own property."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_name_01 = uuid.uuid4().hex
+        prop_name_02 = uuid.uuid4().hex
+        exposed_thing.add_property(prop_name_01, property_fragment)
+        exposed_thing.add_property(prop_name_02, property_fragment)
+
+        emitted_01 = []
+        emitted_02 = []
+
+        subscription_01 = exposed_thing.on_property_change(prop_name_01).subscribe(
+            lambda ev: emitted_01.append(ev.data.value)
+        )
+
+        subscription_02 = exposed_thing.on_property_change(prop_name_02).subscribe(
+            lambda ev: emitted_02.append(ev.data.value)
+        )
+
+        yield exposed_thing.write_property(prop_name_01, "value_01")
+        yield exposed_thing.write_property(prop_name_02, "value_02")
+        yield exposed_thing.write_property(prop_name_01, "value_03")
+
+        assert emitted_01 == ["value_01", "value_03"]
+        assert emitted_02 == ["value_02"]
+
+        subscription_01.dispose()
+
+        yield exposed_thing.write_property(prop_name_01, "value_04")
+
+        assert emitted_01 == ["value_01", "value_03"]
+
+        subscription_02.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_on_property_change_notification_policy(exposed_thing):
+    """Property change notifications can be throttled with notification policies."""
+
+    prop_name = uuid.uuid4().hex
+    prop_init = PropertyFragmentDict({"type": "number", "observable": True})
+
+    async def test_coroutine():
+        exposed_thing.add_property(prop_name, prop_init, value=0.0)
+
+        policy = NotificationPolicy(min_interval=0.1, deadband=1.0)
+        exposed_thing.set_property_notification_policy(prop_name, policy)
+
+        assert exposed_thing.get_property_notification_policy(prop_name) is policy
+
+        emitted = []
+
+        subscription = exposed_thing.on_property_change(prop_name).subscribe(
+            lambda ev: emitted.append(ev.data.value)
+        )
+
+        for value in [5.0, 5.5, 7.0, 9.0, 9.2]:
+            await exposed_thing.write_property(prop_name, value)
+
+        assert emitted == [5.0]
+
+        await asyncio.sleep(0.2)
+
+        assert emitted == [5.0, 9.2]
+        assert (await exposed_thing.read_property(prop_name)) == 9.2
+
+        exposed_thing.set_property_notification_policy(prop_name, None)
+
+        assert exposed_thing.get_property_notification_policy(prop_name) is None
+
+        await exposed_thing.write_property(prop_name, 9.3)
+
+        assert emitted == [5.0, 9.2, 9.3]
+
+        subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_on_property_change_emit_on_change_only(exposed_thing):
+    """Writes that do not modify the value of a Property are not
+    notified when the change-only mode is enabled."""
+
+    prop_name_01 = uuid.uuid4().hex
+    prop_name_02 = uuid.uuid4().hex
+    prop_init = PropertyFragmentDict({"type": "object", "observable": True})
+
+    async def test_coroutine():
+        exposed_thing.add_property(prop_name_01, prop_init, value={"a": [1, 2]})
+        exposed_thing.add_property(prop_name_02, prop_init, value=1)
+
+        exposed_thing.set_emit_on_change_only(True)
+        exposed_thing.set_property_emit_on_change_only(prop_name_02, False)
+
+        assert exposed_thing.get_property_emit_on_change_only(prop_name_01)
+        assert not exposed_thing.get_property_emit_on_change_only(prop_name_02)
+
+        emitted_01 = []
+        emitted_02 = []
+
+        subscription_01 = exposed_thing.on_property_change(prop_name_01).subscribe(
+            lambda ev: emitted_01.append(ev.data.value)
+        )
+
+        subscription_02 = exposed_thing.on_property_change(prop_name_02).subscribe(
+            lambda ev: emitted_02.append(ev.data.value)
+        )
+
+        value = {"a": [1, 2]}
+
+        await exposed_thing.write_property(prop_name_01, value)
+        await exposed_thing.write_property(prop_name_01, {"a": [1, 2]})
+
+        assert emitted_01 == []
+
+        value["a"].append(3)
+
+        await exposed_thing.write_property(prop_name_01, value)
+        await exposed_thing.write_property(prop_name_01, {"a": [1, 2, 3]})
+        await exposed_thing.write_property(prop_name_01, {"a": [1, 2, 3.5]})
+
+        assert emitted_01 == [{"a": [1, 2, 3]}, {"a": [1, 2, 3.5]}]
+
+        await exposed_thing.write_property(prop_name_02, 1)
+        await exposed_thing.write_property(prop_name_02, 1)
+
+        assert emitted_02 == [1, 1]
+
+        exposed_thing.set_property_emit_on_change_only(prop_name_02, None)
+
+        await exposed_thing.write_property(prop_name_02, 1)
+        await exposed_thing.write_property(prop_name_02, True)
+
+        assert emitted_02 == [1, 1, True]
+
+        await exposed_thing.write_property(prop_name_01, {"a": -1})
+        await exposed_thing.write_property(prop_name_01, {"a": -2})
+
+        assert emitted_01[-2:] == [{"a": -1}, {"a": -2}]
+
+        subscription_01.dispose()
+        subscription_02.dispose()
+
+        prop_name_03 = uuid.uuid4().hex
+        exposed_thing.add_property(prop_name_03, prop_init, value=5)
+
+        async def write_handler(value):
+            written.append(value)
+
+        written = []
+        emitted_03 = []
+
+        exposed_thing.set_property_write_handler(prop_name_03, write_handler)
+
+        subscription_03 = exposed_thing.on_property_change(prop_name_03).subscribe(
+            lambda ev: emitted_03.append(ev.data.value)
+        )
+
+        await exposed_thing.write_property(prop_name_03, 5)
+        await exposed_thing.write_property(prop_name_03, 6)
+        await exposed_thing.write_property(prop_name_03, 6)
+
+        assert written == [5, 6, 6]
+        assert emitted_03 == [5, 6]
+
+        subscription_03.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_property_history(exposed_thing):
+    """The recent values of Properties can be kept and retrieved by time range."""
+
+    prop_name = uuid.uuid4().hex
+    prop_init = PropertyFragmentDict({"type": "number", "observable": True})
+
+    async def test_coroutine():
+        exposed_thing.add_property(prop_name, prop_init, value=0.0)
+
+        with pytest.raises(ValueError):
+            exposed_thing.get_property_history(prop_name)
+
+        exposed_thing.set_property_history_size(prop_name, 4)
+
+        with patch("wotpy.wot.exposed.history.time") as time_mock:
+            for idx in range(6):
+                time_mock.time.return_value = 1000.0 + idx
+                await exposed_thing.write_property(prop_name, float(idx))
+
+        assert exposed_thing.get_property_history(prop_name) == [
+            (1002.0, 2.0),
+            (1003.0, 3.0),
+            (1004.0, 4.0),
+            (1005.0, 5.0),
+        ]
+
+        assert exposed_thing.get_property_history(
+            prop_name, since=1003, until=1004.5
+        ) == [(1003.0, 3.0), (1004.0, 4.0)]
+
+        assert exposed_thing.properties[prop_name].get_history(limit=1) == [
+            (1005.0, 5.0)
+        ]
+
+        exposed_thing.set_property_history_size(prop_name, 2)
+
+        assert exposed_thing.get_property_history(prop_name) == [
+            (1004.0, 4.0),
+            (1005.0, 5.0),
+        ]
+
+        exposed_thing.set_property_history_size(prop_name, None)
+
+        with pytest.raises(ValueError):
+            exposed_thing.get_property_history(prop_name)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_on_property_change_non_observable(exposed_thing):
     """Observe requests to non-observable properties are rejected."""
 
@@ -349,6 +860,67 @@ def test_on_td_change(
     )
 
 
+def test_batch_update(
+    exposed_thing, property_fragment, event_fragment, action_fragment
+):
+    """TD changes that happen inside a batch update are coalesced into one event."""
+
+    emitted = []
+
+    subscription = exposed_thing.on_td_change().subscribe(emitted.append)
+
+    with exposed_thing.batch_update():
+        exposed_thing.add_property("prop", property_fragment)
+        exposed_thing.add_event("event", event_fragment)
+
+        with exposed_thing.batch_update():
+            exposed_thing.add_action("action", action_fragment)
+
+        assert not len(emitted)
+
+        exposed_thing.remove_event("event")
+
+    assert len(emitted) == 1
+
+    event_data = emitted[0].data
+
+    assert event_data.method == TDChangeMethod.CHANGE
+    assert event_data.td_change_type is None
+    assert "prop" in event_data.description["properties"]
+    assert "action" in event_data.description["actions"]
+    assert "event" not in event_data.description.get("events", {})
+
+    assert [(item["td_change_type"], item["method"]) for item in event_data.data] == [
+        (TDChangeType.PROPERTY, TDChangeMethod.ADD),
+        (TDChangeType.EVENT, TDChangeMethod.ADD),
+        (TDChangeType.ACTION, TDChangeMethod.ADD),
+        (TDChangeType.EVENT, TDChangeMethod.REMOVE),
+    ]
+
+    with exposed_thing.batch_update():
+        exposed_thing.remove_property("prop")
+
+    assert len(emitted) == 2
+    assert emitted[1].data.method == TDChangeMethod.REMOVE
+    assert emitted[1].data.name == "prop"
+
+    subscription.dispose()
+
+
+def test_td_change_without_observers(exposed_thing, property_fragment):
+    """The TD change payload is not built if there are no TD change observers."""
+
+    with patch.object(ThingDescription, "from_thing") as from_thing:
+        exposed_thing.add_property(uuid.uuid4().hex, property_fragment)
+        assert not from_thing.called
+
+        subscription = exposed_thing.on_td_change().subscribe(lambda item: None)
+        exposed_thing.add_property(uuid.uuid4().hex, property_fragment)
+        assert from_thing.called
+
+        subscription.dispose()
+
+
 def test_thing_property_get(exposed_thing, property_fragment):
     """Property values can be retrieved on ExposedThings using the map-like interface."""
 
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from mock import patch
+
+from wotpy.protocols.enums import InteractionVerbs
+from wotpy.protocols.http.client import HTTPClient
+from wotpy.protocols.utils import pick_form
+from wotpy.wot.consumed.thing import ConsumedThing
+from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.form_table import FormTable
+from wotpy.wot.td import ThingDescription
+
+TD_FORMS = {
+    "id": "urn:wotpy:formtable",
+    "title": "Form table",
+    "base": "http://localhost:9090/",
+    "properties": {
+        "temp": {
+            "type": "number",
+            "forms": [
+                {"href": "temp", "op": "readproperty"},
+                {"href": "https://localhost:9443/temp"},
+                {"href": "mqtt://broker:1883/thing/temp/", "op": "observeproperty"},
+                {
+                    "href": "mqtt://broker:1883/thing/temp/write",
+                    "op": ["writeproperty", "readproperty"],
+                },
+            ],
+        }
+    },
+    "actions": {"reset": {"forms": [{"href": "ws://localhost:9191/ws"}]}},
+    "forms": [
+        {"href": "properties", "op": InteractionVerbs.READ_ALL_PROPERTIES},
+    ],
+}
+
+
+def test_form_table_resolve():
+    """The Forms of the TD are resolved against the base and indexed
+    by interaction, scheme and operation."""
+
+    table = FormTable(ThingDescription(TD_FORMS))
+
+    resolved = table.pick(
+        ["http"],
+        InteractionTypes.PROPERTY,
+        "temp",
+        op=InteractionVerbs.READ_PROPERTY,
+    )
+
+    assert resolved.url == "http://localhost:9090/temp"
+    assert resolved.scheme == "http"
+    assert resolved.host_key == "http://localhost:9090"
+
+    resolved = table.pick(
+        ["mqtt"],
+        InteractionTypes.PROPERTY,
+        "temp",
+        op=InteractionVerbs.OBSERVE_PROPERTY,
+    )
+
+    assert resolved.host_key == "mqtt://broker:1883"
+    assert resolved.topic == "thing/temp"
+
+    resolved = table.pick(
+        ["mqtt"],
+        InteractionTypes.PROPERTY,
+        "temp",
+        op=InteractionVerbs.WRITE_PROPERTY,
+    )
+
+    assert resolved.topic == "thing/temp/write"
+
+    assert not table.pick(
+        ["http"], InteractionTypes.PROPERTY, "temp", op=InteractionVerbs.WRITE_PROPERTY
+    )
+
+    assert not table.pick(["http"], InteractionTypes.PROPERTY, "unknown")
+
+
+def test_form_table_preferences():
+    """Schemes are tried in order of preference and the
+    first Form of each scheme in the TD is picked."""
+
+    table = FormTable(ThingDescription(TD_FORMS))
+
+    resolved_https = table.pick(["https", "http"], InteractionTypes.PROPERTY, "temp")
+    resolved_http = table.pick(["http", "https"], InteractionTypes.PROPERTY, "temp")
+    resolved_mqtt = table.pick(["mqtt"], InteractionTypes.PROPERTY, "temp")
+
+    assert resolved_https.url == "https://localhost:9443/temp"
+    assert resolved_http.url == "http://localhost:9090/temp"
+    assert resolved_mqtt.topic == "thing/temp"
+
+
+def test_form_table_thing_forms():
+    """Thing-level Forms are indexed without interaction type and name."""
+
+    table = FormTable(ThingDescription(TD_FORMS))
+
+    resolved = table.pick(["http"], op=InteractionVerbs.READ_ALL_PROPERTIES)
+
+    assert resolved.url == "http://localhost:9090/properties"
+    assert not table.pick(["http"], op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+    assert not table.pick(["ws"])
+
+
+def test_form_table_supports():
+    """The table checks if an interaction has Forms for any of the schemes."""
+
+    table = FormTable(ThingDescription(TD_FORMS))
+
+    assert table.supports("temp", ["http"])
+    assert table.supports("temp", ["coap", "mqtt"])
+    assert not table.supports("temp", ["ws"])
+    assert table.supports("reset", ["wss", "ws"])
+    assert not table.supports("unknown", ["http"])
+
+
+def test_form_table_consume():
+    """The table is built once when the TD is consumed and
+    the protocol clients pick the Forms from it."""
+
+    td = ThingDescription(TD_FORMS)
+
+    with patch("wotpy.wot.td.FormTable", wraps=FormTable) as table_mock:
+        consumed_thing = ConsumedThing(servient=None, td=td)
+
+        assert table_mock.call_count == 1
+        assert consumed_thing.form_table is td.form_table
+
+        HTTPClient.pick_http_href(td, InteractionTypes.PROPERTY, "temp")
+        HTTPClient.pick_http_href(td, op=InteractionVerbs.READ_ALL_PROPERTIES)
+
+        assert table_mock.call_count == 1
+
+    assert (
+        HTTPClient.pick_http_href(td, InteractionTypes.PROPERTY, "temp")
+        == "https://localhost:9443/temp"
+    )
+
+
+def test_pick_form_forms_list():
+    """The pick_form helper keeps taking the list of Forms to pick from."""
+
+    td = ThingDescription(TD_FORMS)
+    forms = td.get_property_forms("temp")
+
+    assert pick_form(td, forms, ["https", "http"]).href == "https://localhost:9443/temp"
+    assert pick_form(td, forms, ["mqtt"]).href == "mqtt://broker:1883/thing/temp/"
+    assert pick_form(td, forms, ["ws"]) is None
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+from faker import Faker
+
+from wotpy.wot.enums import DataType
+from wotpy.wot.exposed.history import PropertyHistory
+
+
+def test_history_validation():
+    """Invalid history lengths and limits raise errors."""
+
+    with pytest.raises(ValueError):
+        PropertyHistory(0)
+
+    with pytest.raises(ValueError):
+        PropertyHistory(3).query(limit=-1)
+
+
+@pytest.mark.parametrize(
+    "data_type", [DataType.NUMBER, DataType.INTEGER, DataType.STRING, None]
+)
+def test_history_ring_buffer(data_type):
+    """Histories keep the latest values of any type in insertion order."""
+
+    fake = Faker()
+
+    values = [
+        fake.pyfloat(),
+        fake.pyint(),
+        True,
+        2**70,
+        fake.pystr(),
+        {"nested": [1, None]},
+        None,
+    ]
+
+    history = PropertyHistory(5, data_type=data_type)
+
+    for idx, value in enumerate(values):
+        history.append(value, timestamp=float(idx))
+
+    assert len(history) == 5
+
+    items = history.query()
+
+    assert [timestamp for timestamp, _ in items] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert [value for _, value in items] == values[2:]
+    assert [type(value) for _, value in items] == [type(val) for val in values[2:]]
+
+    assert history.query(since=3.5, limit=2) == [(5.0, values[5]), (6.0, None)]
+    assert history.query(until=3.0) == [(2.0, True), (3.0, 2**70)]
+
+    history.clear()
+
+    assert len(history) == 0
+    assert history.query() == []
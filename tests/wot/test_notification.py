@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+import pytest
+
+from tests.utils import run_test_coroutine
+from wotpy.wot.exposed.notification import (
+    NotificationPolicy,
+    PropertyNotifier,
+    value_fingerprint,
+)
+
+
+def test_notification_policy_validation():
+    """Invalid notification policies raise errors."""
+
+    with pytest.raises(ValueError):
+        NotificationPolicy(min_interval=-1)
+
+    with pytest.raises(ValueError):
+        NotificationPolicy(max_interval=0)
+
+    with pytest.raises(ValueError):
+        NotificationPolicy(deadband=-0.5)
+
+
+def test_notifier_deadband():
+    """Numeric changes below the deadband are not notified."""
+
+    async def test_coroutine():
+        emitted = []
+        notifier = PropertyNotifier(NotificationPolicy(deadband=1.0), emitted.append)
+
+        for value in [10.0, 10.5, 10.9, 11.2, 11.0, "text", 9.0]:
+            notifier.push(value)
+
+        assert emitted == [10.0, 11.2, "text", 9.0]
+
+        notifier.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_notifier_min_interval():
+    """Changes within the minimum interval are suppressed and the
+    latest suppressed value is notified when the interval expires."""
+
+    async def test_coroutine():
+        emitted = []
+
+        notifier = PropertyNotifier(
+            NotificationPolicy(min_interval=0.1), emitted.append
+        )
+
+        for value in range(5):
+            notifier.push(value)
+
+        assert emitted == [0]
+
+        await asyncio.sleep(0.2)
+
+        assert emitted == [0, 4]
+
+        notifier_drop = PropertyNotifier(
+            NotificationPolicy(min_interval=0.1, coalesce=False), emitted.append
+        )
+
+        for value in range(10, 15):
+            notifier_drop.push(value)
+
+        await asyncio.sleep(0.2)
+
+        assert emitted == [0, 4, 10]
+
+        notifier.dispose()
+        notifier_drop.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_notifier_heartbeat():
+    """The latest value is notified again when the maximum interval expires."""
+
+    async def test_coroutine():
+        emitted = []
+
+        notifier = PropertyNotifier(
+            NotificationPolicy(max_interval=0.05, deadband=5), emitted.append
+        )
+
+        notifier.push(1)
+        notifier.push(2)
+
+        await asyncio.sleep(0.13)
+
+        assert emitted[0] == 1
+        assert len(emitted) >= 3
+        assert all(value == 2 for value in emitted[1:])
+
+        notifier.dispose()
+        num_emitted = len(emitted)
+
+        await asyncio.sleep(0.1)
+
+        assert len(emitted) == num_emitted
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_value_fingerprint():
+    """Structurally equal values have the same fingerprint."""
+
+    value = {"a": [1, {"b": None}], "c": "text"}
+
+    assert value_fingerprint(value) == value_fingerprint(
+        {"c": "text", "a": [1, {"b": None}]}
+    )
+
+    assert value_fingerprint(value) != value_fingerprint(
+        {"a": [1, {"b": False}], "c": "text"}
+    )
+
+    assert value_fingerprint([1, 2]) != value_fingerprint([2, 1])
+    assert value_fingerprint(1) != value_fingerprint(True)
+    assert value_fingerprint(1) != value_fingerprint(1.0)
+    assert value_fingerprint([1, 2]) != value_fingerprint((1, 2))
+    assert value_fingerprint({"a": -1}) != value_fingerprint({"a": -2})
+    assert value_fingerprint([-1]) != value_fingerprint([-2])
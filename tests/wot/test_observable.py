@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+
+import pytest
+from rx.concurrency import IOLoopScheduler
+
+from tests.utils import run_test_coroutine
+from wotpy.utils.observable import Observable, Subject
+
+
+def test_subject_multicast():
+    """Subjects emit items to all their subscribers until they are disposed."""
+
+    subject = Subject()
+    received_01 = []
+    received_02 = []
+    completed = []
+
+    subscription_01 = subject.subscribe(received_01.append)
+
+    subject.as_observable().subscribe(
+        on_next=received_02.append, on_completed=lambda: completed.append(True)
+    )
+
+    subject.on_next(1)
+    subscription_01.dispose()
+    subject.on_next(2)
+
+    assert len(subject.observers) == 1
+
+    subject.on_completed()
+    subject.on_next(3)
+
+    assert received_01 == [1]
+    assert received_02 == [1, 2]
+    assert completed == [True]
+    assert len(subject.observers) == 0
+
+
+def test_observable_errors():
+    """Errors are delivered to the on_error callback or raised if there is none."""
+
+    errors = []
+
+    Observable.throw(ValueError("error")).subscribe(on_error=errors.append)
+
+    def subscribe_fail(observer):
+        raise ValueError("subscribe error")
+
+    Observable.create(subscribe_fail).subscribe(on_error=errors.append)
+
+    assert [str(err) for err in errors] == ["error", "subscribe error"]
+
+    with pytest.raises(ValueError):
+        Observable.throw(ValueError("error")).subscribe(lambda item: None)
+
+
+def test_observable_create_disposal():
+    """Resources returned by subscribe functions are released on
+    disposal or when the sequence terminates."""
+
+    disposed = []
+
+    def subscribe(observer):
+        observer.on_next(1)
+        return lambda: disposed.append(True)
+
+    subscription = Observable.create(subscribe).subscribe(lambda item: None)
+
+    assert not disposed
+
+    subscription.dispose()
+    subscription.dispose()
+
+    assert disposed == [True]
+
+    def subscribe_complete(observer):
+        observer.on_completed()
+        return lambda: disposed.append(True)
+
+    Observable.create(subscribe_complete).subscribe(lambda item: None)
+
+    assert disposed == [True, True]
+
+
+def test_observable_merge():
+    """Merged observables emit the items of all the sources and
+    complete when all of them complete."""
+
+    received = []
+    completed = []
+    subject = Subject()
+
+    Observable.merge(Observable.of(1, 2), subject, Observable.empty()).subscribe(
+        on_next=received.append, on_completed=lambda: completed.append(True)
+    )
+
+    subject.on_next(3)
+
+    assert received == [1, 2, 3]
+    assert not completed
+
+    subject.on_completed()
+
+    assert completed == [True]
+
+
+def test_observable_schedulers():
+    """Observables can deliver items and subscribe in the event loop
+    (or in RxPY schedulers), also from other threads."""
+
+    async def test_coroutine():
+        subject = Subject()
+        received = []
+        received_rx = []
+
+        subject.observe_on().subscribe(received.append)
+        subject.observe_on(IOLoopScheduler()).subscribe(received_rx.append)
+
+        subject.on_next(1)
+
+        assert received == []
+
+        thread = threading.Thread(target=subject.on_next, args=(2,))
+        thread.start()
+        thread.join()
+
+        await asyncio.sleep(0.05)
+
+        assert received == [1, 2]
+        assert received_rx == [1, 2]
+
+        subscribed = []
+
+        subject.subscribe_on().subscribe(subscribed.append)
+        subject.on_next(3)
+
+        assert not subscribed
+
+        await asyncio.sleep(0)
+
+        subject.on_next(4)
+
+        assert subscribed == [4]
+
+    run_test_coroutine(test_coroutine)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import uuid
+
+import pytest
+import tornado.gen
+from faker import Faker
+
+from tests.utils import run_test_coroutine
+from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
+from wotpy.wot.exposed.store import ArrayPropertyStore, DictPropertyStore
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.interaction import Property
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+
+@pytest.fixture(params=[DictPropertyStore, ArrayPropertyStore])
+def property_store(request):
+    """Builds and returns an empty Property value store."""
+
+    return request.param()
+
+
+def _build_property(thing=None):
+    """Builds and returns a Property attached to a random Thing."""
+
+    thing = thing if thing else Thing(id=uuid.uuid4().urn)
+    init = PropertyFragmentDict({"type": "number", "observable": True})
+
+    return Property(thing=thing, name=uuid.uuid4().hex, init_dict=init)
+
+
+def test_property_store_values(property_store):
+    """Property value stores return the same values that were stored."""
+
+    fake = Faker()
+
+    values = [
+        fake.pyfloat(),
+        fake.pyint(),
+        True,
+        False,
+        2**70,
+        fake.pystr(),
+        {"nested": [1, 2.5, None]},
+        None,
+        0.0,
+    ]
+
+    props = [_build_property() for _ in values]
+
+    for prop, value in zip(props, values):
+        property_store.set(prop, value)
+
+    assert len(property_store) == len(props)
+
+    for prop, value in zip(props, values):
+        assert property_store.get(prop) == value
+        assert type(property_store.get(prop)) is type(value)
+
+    for prop, value in zip(props, reversed(values)):
+        property_store.set(prop, value)
+
+    for prop, value in zip(props, reversed(values)):
+        assert property_store.get(prop) == value
+        assert type(property_store.get(prop)) is type(value)
+
+    property_store.remove(props[0])
+
+    assert props[0] not in property_store
+    assert property_store.get(props[0]) is None
+    assert len(property_store) == len(props) - 1
+
+
+def test_array_property_store_reuses_rows():
+    """The array-backed store stores the values of Properties with the same name in a
+    shared column and reuses the rows of the Things without any value."""
+
+    store = ArrayPropertyStore()
+    things = [Thing(id=uuid.uuid4().urn) for _ in range(10)]
+    init = PropertyFragmentDict({"type": "number", "observable": True})
+    props = [Property(thing=thing, name="temp", init_dict=init) for thing in things]
+
+    for idx, prop in enumerate(props):
+        store.set(prop, float(idx))
+
+    for prop in props[:5]:
+        store.remove(prop)
+
+    props_new = [
+        Property(thing=Thing(id=uuid.uuid4().urn), name="temp", init_dict=init)
+        for _ in range(5)
+    ]
+
+    for idx, prop in enumerate(props_new):
+        store.set(prop, float(idx * 10))
+
+    assert len(store) == 10
+    assert len(store._columns) == 1
+    assert len(store._columns["temp"].values) == 10
+    assert not len(store._columns["temp"].overflow)
+
+    for idx, prop in enumerate(props[5:]):
+        assert store.get(prop) == float(idx + 5)
+
+    for idx, prop in enumerate(props_new):
+        assert store.get(prop) == float(idx * 10)
+
+
+def test_exposed_thing_shared_store():
+    """ExposedThings created by a servient with a
+    Property value store share said store."""
+
+    store = ArrayPropertyStore()
+    servient = Servient(catalogue_port=None, property_store=store)
+
+    exp_things = [
+        ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+        for _ in range(3)
+    ]
+
+    for exp_thing in exp_things:
+        servient.add_exposed_thing(exp_thing)
+
+    prop_init = PropertyFragmentDict({"type": "number", "observable": True})
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        for idx, exp_thing in enumerate(exp_things):
+            assert exp_thing.property_store is store
+            exp_thing.add_property("temperature", prop_init, value=float(idx))
+            exp_thing.add_property("pressure", prop_init, value=float(idx))
+
+        assert len(store) == 6
+
+        for idx, exp_thing in enumerate(exp_things):
+            yield exp_thing.write_property("pressure", idx * 2.0)
+
+        for idx, exp_thing in enumerate(exp_things):
+            value = yield exp_thing.read_property("temperature")
+            assert value == float(idx)
+            value = yield exp_thing.read_property("pressure")
+            assert value == idx * 2.0
+
+        exp_things[0].remove_property("temperature")
+
+        assert len(store) == 5
+
+        exp_things[1].destroy()
+
+        assert len(store) == 3
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_exposed_thing_default_store():
+    """ExposedThings use their own dict-backed store by default."""
+
+    servient = Servient(catalogue_port=None)
+
+    exp_thing_01 = ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+    exp_thing_02 = ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn))
+
+    assert isinstance(exp_thing_01.property_store, DictPropertyStore)
+    assert exp_thing_01.property_store is not exp_thing_02.property_store
@@ -3,6 +3,8 @@
 
 import json
 import random
+import subprocess
+import sys
 import uuid
 
 import pytest
@@ -11,14 +13,17 @@ import tornado.httpclient
 import tornado.ioloop
 import tornado.websocket
 from faker import Faker
+from mock import patch
 
 from tests.utils import find_free_port, run_test_coroutine
 from wotpy.protocols.enums import Protocols
+from wotpy.protocols.http.client import HTTPClient
 from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.protocols.ws.server import WebsocketServer
 from wotpy.wot.constants import WOT_TD_CONTEXT_URL
 from wotpy.wot.consumed.thing import ConsumedThing
-from wotpy.wot.servient import Servient
+from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.servient import DEFAULT_CLIENT_PREFERENCES, Servient
 from wotpy.wot.td import ThingDescription
 from wotpy.wot.wot import WoT
 
@@ -36,6 +41,20 @@ TD_DICT_01 = {
 
 TD_DICT_02 = {"id": uuid.uuid4().urn, "title": Faker().sentence()}
 
+TD_DICT_03 = {
+    "id": uuid.uuid4().urn,
+    "title": Faker().sentence(),
+    "properties": {
+        "status": {
+            "type": "string",
+            "forms": [
+                {"href": "http://mylamp.example.com/status"},
+                {"href": "ws://mylamp.example.com/status"},
+            ],
+        }
+    },
+}
+
 
 @tornado.gen.coroutine
 def fetch_catalogue(servient, expanded=False):
@@ -252,6 +271,103 @@ def test_clients_subset():
     assert servient_02.select_client(td, prop_name) is ws_client
 
 
+def test_select_client_cache():
+    """Selected clients are cached for each TD and Interaction
+    until the clients of the servient change."""
+
+    ws_client = WebsocketClient()
+    http_client = HTTPClient()
+    servient = Servient(catalogue_port=None, clients=[ws_client, http_client])
+    td = ThingDescription(TD_DICT_03)
+    prop_name = next(iter(TD_DICT_03["properties"].keys()))
+
+    with patch.object(
+        http_client,
+        "is_supported_interaction",
+        wraps=http_client.is_supported_interaction,
+    ) as mock_supported:
+        assert servient.select_client(td, prop_name) is http_client
+        assert servient.select_client(td, prop_name) is http_client
+        assert mock_supported.call_count == 1
+
+        servient.add_client(WebsocketClient())
+
+        assert servient.select_client(td, prop_name) is http_client
+        assert mock_supported.call_count == 2
+
+    servient.remove_client(Protocols.HTTP)
+
+    assert servient.select_client(td, prop_name).protocol == Protocols.WEBSOCKETS
+
+
+def test_select_client_swap():
+    """The clients of the servient can only be swapped with
+    add_client, which also clears the selected clients."""
+
+    http_client = HTTPClient()
+    servient = Servient(catalogue_port=None, clients=[http_client])
+    td = ThingDescription(TD_DICT_03)
+    prop_name = next(iter(TD_DICT_03["properties"].keys()))
+
+    assert servient.select_client(td, prop_name) is http_client
+
+    with pytest.raises(TypeError):
+        servient.clients[Protocols.HTTP] = HTTPClient()
+
+    with pytest.raises(TypeError):
+        del servient.clients[Protocols.HTTP]
+
+    new_http_client = HTTPClient()
+    servient.add_client(new_http_client)
+
+    assert servient.clients[Protocols.HTTP] is new_http_client
+    assert servient.select_client(td, prop_name) is new_http_client
+
+
+def test_select_client_preferences():
+    """The order of preference of the protocols may be defined for each servient."""
+
+    ws_client = WebsocketClient()
+    http_client = HTTPClient()
+    td = ThingDescription(TD_DICT_03)
+    prop_name = next(iter(TD_DICT_03["properties"].keys()))
+
+    servient = Servient(
+        catalogue_port=None,
+        clients=[ws_client, http_client],
+        client_preferences={
+            InteractionTypes.PROPERTY: [Protocols.WEBSOCKETS, Protocols.HTTP]
+        },
+    )
+
+    assert servient.select_client(td, prop_name) is ws_client
+
+    assert servient.client_preferences[InteractionTypes.ACTION][0] == (
+        Protocols.WEBSOCKETS
+    )
+
+    servient.client_preferences = [Protocols.HTTP]
+
+    assert servient.select_client(td, prop_name) is http_client
+
+    with pytest.raises(ValueError):
+        servient.client_preferences = ["unknown"]
+
+    default_servient = Servient(catalogue_port=None)
+    preferences = default_servient.client_preferences
+
+    assert preferences is not DEFAULT_CLIENT_PREFERENCES
+    assert list(preferences[InteractionTypes.PROPERTY]) == (
+        DEFAULT_CLIENT_PREFERENCES[InteractionTypes.PROPERTY]
+    )
+
+    with pytest.raises(TypeError):
+        preferences[InteractionTypes.PROPERTY] = [Protocols.HTTP]
+
+    with pytest.raises(AttributeError):
+        preferences[InteractionTypes.PROPERTY].insert(0, Protocols.MQTT)
+
+
 def test_clients_config():
     """Custom configuration arguments can be passed to the Servient default protocol clients."""
 
@@ -261,3 +377,266 @@ def test_clients_config():
     )
 
     assert servient.clients[Protocols.HTTP].connect_timeout == connect_timeout
+
+
+def test_default_clients_lazy():
+    """Servients build the default clients (and import the protocol
+    bindings) the first time they are needed."""
+
+    code = (
+        "import sys\n"
+        "from wotpy.wot.servient import Servient\n"
+        "servient = Servient(hostname='localhost', catalogue_port=None)\n"
+        "print('wotpy.protocols.http.client' in sys.modules, 'tornado' in sys.modules)\n"
+        "servient.add_client(servient.clients[{!r}])\n"
+        "print(sorted(servient.clients.keys()))\n"
+    ).format(Protocols.HTTP)
+
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], universal_newlines=True
+    ).splitlines()
+
+    assert output[0] == "False False"
+    assert Protocols.HTTP in output[1]
+    assert Protocols.WEBSOCKETS in output[1]
+
+
+def test_enable_exposed_things():
+    """ExposedThings may be enabled in bulk and only get Forms while enabled."""
+
+    ws_server = WebsocketServer(port=find_free_port())
+    servient = Servient(hostname="localhost")
+    servient.disable_td_catalogue()
+    servient.add_server(ws_server)
+
+    wot = WoT(servient=servient)
+
+    exposed_things = [
+        wot.produce(
+            json.dumps(
+                {
+                    "id": uuid.uuid4().urn,
+                    "title": Faker().sentence(),
+                    "properties": {"status": {"type": "string"}},
+                }
+            )
+        )
+        for _ in range(3)
+    ]
+
+    def count_forms(exp_thing):
+        return len(exp_thing.thing.properties["status"].forms)
+
+    with patch.object(
+        servient,
+        "_regenerate_things_forms",
+        wraps=servient._regenerate_things_forms,
+    ) as regenerate_mock:
+        servient.enable_exposed_things([item.id for item in exposed_things[:2]])
+
+        regenerate_mock.assert_called_once_with(ws_server, exposed_things[:2])
+
+    assert [item.id for item in servient.enabled_exposed_things] == [
+        item.id for item in exposed_things[:2]
+    ]
+
+    assert count_forms(exposed_things[0]) > 0
+    assert count_forms(exposed_things[1]) > 0
+    assert count_forms(exposed_things[2]) == 0
+
+    forms_before = list(exposed_things[0].thing.properties["status"].forms)
+
+    servient.enable_exposed_thing(exposed_things[2].id)
+    servient.disable_exposed_thing(exposed_things[1].id)
+
+    assert exposed_things[0].thing.properties["status"].forms == forms_before
+    assert count_forms(exposed_things[1]) == 0
+    assert count_forms(exposed_things[2]) > 0
+
+    with pytest.raises(ValueError):
+        servient.enable_exposed_things([uuid.uuid4().urn])
+
+
+def test_servient_td_catalogue_etag(servient):
+    """The servient TD catalogue serves strong ETags and
+    returns 304 when the Thing Description has not changed."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+        exposed_thing = wot.produce(json.dumps(TD_DICT_01))
+        exposed_thing.expose()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        td_url = "http://localhost:{}/{}".format(
+            servient.catalogue_port, exposed_thing.thing.url_name
+        )
+
+        expanded_url = "http://localhost:{}/?expanded=true".format(
+            servient.catalogue_port
+        )
+
+        for url in [td_url, expanded_url]:
+            res = yield http_client.fetch(url)
+            etag = res.headers["Etag"]
+
+            assert json.loads(res.body)
+
+            res_not_modified = yield http_client.fetch(
+                url, headers={"If-None-Match": etag}, raise_error=False
+            )
+
+            assert res_not_modified.code == 304
+            assert res_not_modified.headers["Etag"] == etag
+
+        res = yield http_client.fetch(td_url)
+        etag = res.headers["Etag"]
+
+        with patch.object(
+            ThingDescription, "from_thing", wraps=ThingDescription.from_thing
+        ) as mock_from_thing:
+            yield http_client.fetch(td_url)
+            assert mock_from_thing.call_count == 0
+
+            exposed_thing.add_property(
+                Faker().pystr(), {"type": "string"}, value=Faker().pystr()
+            )
+
+            res_modified = yield http_client.fetch(
+                td_url, headers={"If-None-Match": etag}, raise_error=False
+            )
+
+            assert mock_from_thing.call_count == 1
+
+        assert res_modified.code == 200
+        assert res_modified.headers["Etag"] != etag
+        assert len(json.loads(res_modified.body)["properties"]) == 2
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_catalogue_etag_reused_id():
+    """The catalogue ETag changes when a Thing is replaced
+    by a different Thing with the same ID."""
+
+    servient = Servient(hostname="localhost", catalogue_port=None)
+    wot = WoT(servient=servient)
+    thing_id = uuid.uuid4().urn
+
+    exposed_thing = wot.produce(json.dumps({"id": thing_id, "title": "one"}))
+    etag = servient.get_catalogue_etag([exposed_thing])
+
+    assert servient.get_catalogue_etag([exposed_thing]) == etag
+
+    servient.remove_exposed_thing(thing_id)
+    exposed_thing = wot.produce(json.dumps({"id": thing_id, "title": "two"}))
+
+    assert servient.get_catalogue_etag([exposed_thing]) != etag
+
+
+def test_servient_td_catalogue_pagination(servient):
+    """The servient TD catalogue can be paginated."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+
+        thing_ids = [uuid.uuid4().urn for _ in range(3)]
+
+        for thing_id in thing_ids:
+            wot.produce(json.dumps({"id": thing_id, "title": Faker().pystr()})).expose()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        base_url = "http://localhost:{}".format(servient.catalogue_port)
+
+        for expanded in [False, True]:
+            query = "limit=2&expanded=1" if expanded else "limit=2"
+            url = "{}/?{}".format(base_url, query)
+
+            res_first = yield http_client.fetch(url)
+            page_first = json.loads(res_first.body)
+
+            assert list(page_first.keys()) == thing_ids[:2]
+
+            next_link = res_first.headers["Link"]
+            next_path = next_link[next_link.index("<") + 1 : next_link.index(">")]
+
+            assert 'rel="next"' in next_link
+
+            res_second = yield http_client.fetch(base_url + next_path)
+            page_second = json.loads(res_second.body)
+
+            assert list(page_second.keys()) == thing_ids[2:]
+            assert "Link" not in res_second.headers
+
+            if expanded:
+                assert page_second[thing_ids[2]]["id"] == thing_ids[2]
+
+        res_invalid = yield http_client.fetch(
+            "{}/?limit=-1".format(base_url), raise_error=False
+        )
+
+        assert res_invalid.code == 400
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_servient_td_catalogue_changes(servient):
+    """The servient TD catalogue provides the changes since a given version."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+
+        exposed_thing_01 = wot.produce(json.dumps(TD_DICT_01))
+        exposed_thing_02 = wot.produce(json.dumps(TD_DICT_02))
+        exposed_thing_01.expose()
+
+        version = servient.catalogue_version
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        changes_url = "http://localhost:{}/changes?since={}".format(
+            servient.catalogue_port, version
+        )
+
+        res = yield http_client.fetch(changes_url)
+        changes = json.loads(res.body)
+
+        assert changes["version"] == version
+        assert not changes["added"] and not changes["removed"]
+
+        future_long_poll = http_client.fetch(changes_url + "&timeout=10")
+
+        yield tornado.gen.sleep(0.05)
+
+        assert not future_long_poll.done()
+
+        exposed_thing_02.expose()
+
+        res = yield future_long_poll
+        changes = json.loads(res.body)
+
+        assert changes["version"] > version
+        assert changes["added"] == {
+            TD_DICT_02["id"]: "/{}".format(exposed_thing_02.thing.url_name)
+        }
+
+        version = changes["version"]
+
+        exposed_thing_01.add_event(Faker().pystr(), {"type": "string"})
+        servient.remove_exposed_thing(exposed_thing_02.id)
+
+        res = yield http_client.fetch(
+            "http://localhost:{}/changes?since={}".format(
+                servient.catalogue_port, version
+            )
+        )
+
+        changes = json.loads(res.body)
+
+        assert list(changes["changed"].keys()) == [TD_DICT_01["id"]]
+        assert changes["removed"] == [TD_DICT_02["id"]]
+
+    run_test_coroutine(test_coroutine)
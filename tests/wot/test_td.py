@@ -5,10 +5,12 @@ import copy
 import uuid
 
 import pytest
+from mock import patch
 from faker import Faker
 
 from tests.td_examples import TD_EXAMPLE
 from wotpy.protocols.enums import Protocols
+from wotpy.utils.validators import enable_fast_validators, is_fast_validators_supported
 from wotpy.wot.td import ThingDescription
 from wotpy.wot.form import Form
 from wotpy.wot.interaction import Action, Property, Event
@@ -109,3 +111,44 @@ def test_build_thing():
     assert_same_keys(thing.properties, td_dict.get("properties", {}))
     assert_same_keys(thing.actions, td_dict.get("actions", {}))
     assert_same_keys(thing.events, td_dict.get("events", {}))
+
+
+def test_from_thing_trusted():
+    """TDs generated from Thing objects skip the schema validation."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    with patch.object(ThingDescription, "validate") as validate:
+        ThingDescription.from_thing(thing)
+        assert not validate.called
+
+        ThingDescription(TD_EXAMPLE)
+        assert validate.called
+
+    with pytest.raises(InvalidDescription):
+        ThingDescription({"id": uuid.uuid4().urn, "properties": [1, 2, 3]})
+
+
+@pytest.mark.skipif(
+    not is_fast_validators_supported(), reason="fastjsonschema is not installed"
+)
+def test_validate_fast_validators():
+    """TDs can be validated with the specialized checkers generated by fastjsonschema."""
+
+    enable_fast_validators()
+
+    try:
+        ThingDescription.validate(doc=TD_EXAMPLE)
+
+        td_err = copy.deepcopy(TD_EXAMPLE)
+        td_err.update({"events": {"overheating": {"forms": 0.5}}})
+
+        with pytest.raises(InvalidDescription):
+            ThingDescription.validate(doc=td_err)
+
+        td_defaults = copy.deepcopy(TD_EXAMPLE)
+        ThingDescription.validate(doc=td_defaults)
+
+        assert td_defaults == TD_EXAMPLE
+    finally:
+        enable_fast_validators(False)
@@ -178,3 +178,87 @@ def test_duplicated_forms():
 
     with pytest.raises(ValueError):
         interaction.add_form(form_06)
+
+
+def test_thing_fragment_cache():
+    """The materialized ThingFragment is cached and rebuilt after
+    the Thing, its interactions or its forms are updated."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    fragment_01 = thing.thing_fragment
+
+    assert thing.thing_fragment is fragment_01
+
+    interaction = Action(thing=thing, name="my_interaction")
+    thing.add_interaction(interaction)
+
+    fragment_02 = thing.thing_fragment
+
+    assert fragment_02 is not fragment_01
+    assert "my_interaction" in fragment_02.actions
+    assert thing.thing_fragment is fragment_02
+
+    form = Form(
+        interaction=interaction,
+        protocol=Protocols.HTTP,
+        href="/href-01",
+        content_type="application/json",
+    )
+
+    interaction.add_form(form)
+
+    fragment_03 = thing.thing_fragment
+
+    assert fragment_03 is not fragment_02
+    assert len(fragment_03.actions["my_interaction"].forms) == 1
+
+    interaction.remove_form(form)
+
+    assert len(thing.thing_fragment.actions["my_interaction"].forms) == 0
+
+    thing.title = "My Thing"
+
+    assert thing.thing_fragment.title == "My Thing"
+    assert thing.title == "My Thing"
+
+    thing.remove_interaction(interaction.name)
+
+    assert "my_interaction" not in thing.thing_fragment.actions
+
+
+def test_url_name_updated_title():
+    """The URL name of a Thing is updated when the title changes."""
+
+    thing = Thing(id=uuid.uuid4().urn, title="Original")
+    url_name_original = thing.url_name
+
+    assert thing.url_name == url_name_original
+    assert thing.url_name.endswith(thing.uuid)
+
+    thing.title = "Updated"
+
+    assert thing.url_name != url_name_original
+    assert thing.url_name == slugify("Updated-{}".format(thing.uuid))
+
+
+def test_find_normalized_interaction():
+    """Interactions may be retrieved by case-insensitive URL-safe name on a Thing."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    interaction_01 = Action(thing=thing, name="my_interaction")
+    interaction_02 = Action(thing=thing, name="AnotherInteraction")
+
+    thing.add_interaction(interaction_01)
+    thing.add_interaction(interaction_02)
+
+    assert thing.find_normalized_interaction("my_interaction") is interaction_01
+    assert thing.find_normalized_interaction("MY-INTERACTION") is interaction_01
+    assert thing.find_normalized_interaction("anotherinteraction") is interaction_02
+    assert thing.find_interaction("ANOTHERINTERACTION") is None
+
+    thing.remove_interaction("my-interaction")
+
+    assert thing.find_normalized_interaction("my_interaction") is None
+    assert thing.find_interaction("my_interaction") is None
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import uuid
+
+# noinspection PyPackageRequirements
+import pytest
+
+# noinspection PyPackageRequirements
+from faker import Faker
+
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.exposed.thing_set import ExposedThingSet
+from wotpy.wot.interaction import Action
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+
+def _build_exposed_thing(servient):
+    """Builds an ExposedThing with a random ID and title."""
+
+    thing = Thing(id=uuid.uuid4().urn, title=Faker().sentence())
+    thing.add_interaction(Action(thing=thing, name="my_action"))
+
+    return ExposedThing(servient=servient, thing=thing)
+
+
+def test_find_exposed_things():
+    """ExposedThings may be retrieved by ID, URL name and interaction."""
+
+    servient = Servient(hostname="localhost")
+    exposed_things = [_build_exposed_thing(servient) for _ in range(10)]
+    thing_set = ExposedThingSet()
+
+    for exp_thing in exposed_things:
+        thing_set.add(exp_thing)
+
+    for exp_thing in exposed_things:
+        interaction = exp_thing.thing.find_interaction("my_action")
+
+        assert thing_set.contains(exp_thing)
+        assert thing_set.find_by_thing_id(exp_thing.thing.id) is exp_thing
+        assert thing_set.find_by_thing_id(exp_thing.thing.url_name) is exp_thing
+        assert thing_set.find_by_interaction(interaction) is exp_thing
+
+    assert thing_set.find_by_thing_id(uuid.uuid4().urn) is None
+    assert thing_set.find_by_thing_id(exposed_things[0].thing.uuid) is None
+    assert not thing_set.contains(_build_exposed_thing(servient))
+
+    with pytest.raises(ValueError):
+        thing_set.add(exposed_things[0])
+
+
+def test_find_exposed_thing_updated_title():
+    """ExposedThings may be retrieved by URL name after the title is updated."""
+
+    exp_thing = _build_exposed_thing(Servient(hostname="localhost"))
+    thing_set = ExposedThingSet()
+    thing_set.add(exp_thing)
+
+    url_name_original = exp_thing.thing.url_name
+    exp_thing.title = Faker().sentence()
+
+    assert exp_thing.thing.url_name != url_name_original
+    assert thing_set.find_by_thing_id(exp_thing.thing.url_name) is exp_thing
+    assert thing_set.find_by_thing_id(url_name_original) is None
+
+
+def test_remove_exposed_thing():
+    """ExposedThings may be removed by ID or URL name."""
+
+    servient = Servient(hostname="localhost")
+    exp_thing_01 = _build_exposed_thing(servient)
+    exp_thing_02 = _build_exposed_thing(servient)
+    thing_set = ExposedThingSet()
+    thing_set.add(exp_thing_01)
+    thing_set.add(exp_thing_02)
+
+    thing_set.remove(exp_thing_01.thing.id)
+    thing_set.remove(exp_thing_02.thing.url_name)
+
+    for exp_thing in [exp_thing_01, exp_thing_02]:
+        interaction = exp_thing.thing.find_interaction("my_action")
+
+        assert not thing_set.contains(exp_thing)
+        assert thing_set.find_by_thing_id(exp_thing.thing.id) is None
+        assert thing_set.find_by_interaction(interaction) is None
+
+    with pytest.raises(ValueError):
+        thing_set.remove(exp_thing_01.thing.id)
@@ -5,6 +5,7 @@
 Class that represents the abstract client interface.
 """
 
+import asyncio
 from abc import ABCMeta, abstractmethod
 
 
@@ -50,6 +51,39 @@ class BaseProtocolClient(object):
 
         raise NotImplementedError()
 
+    async def read_multiple_properties(self, td, names, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing.
+        Returns a Future that resolves with a dict of Property names to values.
+        This default implementation issues one concurrent read per Property,
+        clients should override it when the Thing exposes a bulk read Form."""
+
+        values = await asyncio.gather(
+            *[self.read_property(td, name, timeout=timeout) for name in names]
+        )
+
+        return dict(zip(names, values))
+
+    async def read_all_properties(self, td, timeout=None):
+        """Reads the values of all the Properties on a remote Thing.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        return await self.read_multiple_properties(
+            td, list(td.properties.keys()), timeout=timeout
+        )
+
+    async def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing.
+        This default implementation issues one concurrent write per Property,
+        clients should override it when the Thing exposes a bulk write Form.
+        Returns a Future."""
+
+        await asyncio.gather(
+            *[
+                self.write_property(td, name, value, timeout=timeout)
+                for name, value in values.items()
+            ]
+        )
+
     @abstractmethod
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
@@ -12,7 +12,6 @@ import time
 from urllib.parse import urlparse
 
 import aiocoap
-from rx import Observable
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.coap.enums import CoAPSchemes
@@ -22,8 +21,9 @@ from wotpy.protocols.exceptions import (
     FormNotFoundException,
     ProtocolClientException,
 )
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.utils.observable import Observable
 from wotpy.utils.utils import handle_observer_finalization
+from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.events import (
     EmittedEvent,
     PropertyChangeEmittedEvent,
@@ -40,28 +40,18 @@ class CoAPClient(BaseProtocolClient):
         super(CoAPClient, self).__init__()
 
     @classmethod
-    def _pick_coap_href(cls, td, forms, op=None):
-        """Picks the most appropriate CoAP form href from the given list of forms."""
-
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        def find_href(scheme):
-            try:
-                return next(
-                    form.href
-                    for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form)
-                )
-            except StopIteration:
-                return None
-
-        form_coaps = find_href(CoAPSchemes.COAPS)
+    def _pick_coap_href(cls, td, interaction_type=None, name=None, op=None):
+        """Picks the most appropriate CoAP form href (CoAPS is preferred) for the
+        given interaction or the Thing-level Forms if interaction_type is None."""
+
+        resolved = td.form_table.pick(
+            [CoAPSchemes.COAPS, CoAPSchemes.COAP],
+            interaction_type=interaction_type,
+            name=name,
+            op=op,
+        )
 
-        return form_coaps if form_coaps is not None else find_href(CoAPSchemes.COAP)
+        return resolved.url if resolved else None
 
     @classmethod
     def _assert_success(cls, res):
@@ -149,13 +139,7 @@ class CoAPClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
-
-        forms_coap = [
-            form for form in forms if is_scheme_form(form, td.base, CoAPSchemes.list())
-        ]
-
-        return len(forms_coap) > 0
+        return td.form_table.supports(name, CoAPSchemes.list())
 
     async def _invocation_create(self, coap_client, href, input_value, timeout=None):
         """Creates a new action invocation by sending a POST request."""
@@ -211,7 +195,7 @@ class CoAPClient(BaseProtocolClient):
         """Invokes an Action on a remote Thing."""
 
         href = self._pick_coap_href(
-            td, td.get_action_forms(name), op=InteractionVerbs.INVOKE_ACTION
+            td, InteractionTypes.ACTION, name, op=InteractionVerbs.INVOKE_ACTION
         )
 
         if href is None:
@@ -255,7 +239,7 @@ class CoAPClient(BaseProtocolClient):
         """Updates the value of a Property on a remote Thing."""
 
         href = self._pick_coap_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.WRITE_PROPERTY
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.WRITE_PROPERTY
         )
 
         if href is None:
@@ -281,7 +265,7 @@ class CoAPClient(BaseProtocolClient):
         """Reads the value of a Property on a remote Thing."""
 
         href = self._pick_coap_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.READ_PROPERTY
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.READ_PROPERTY
         )
 
         if href is None:
@@ -306,12 +290,84 @@ class CoAPClient(BaseProtocolClient):
         finally:
             await coap_client.shutdown()
 
+    async def _request_properties(self, href, code, payload=None, timeout=None):
+        """Sends a request to the CoAP resource to read or write multiple
+        Properties and returns the decoded response payload."""
+
+        coap_client = await aiocoap.Context.create_client_context()
+
+        try:
+            msg_kwargs = {"code": code, "uri": href}
+
+            if payload is not None:
+                msg_kwargs["payload"] = json.dumps(payload).encode("utf-8")
+
+            request = coap_client.request(aiocoap.Message(**msg_kwargs))
+
+            try:
+                response = await asyncio.wait_for(request.response, timeout=timeout)
+            except asyncio.TimeoutError as ex:
+                raise ClientRequestTimeout from ex
+
+            self._assert_success(response)
+
+            return json.loads(response.payload) if response.payload else None
+        finally:
+            await coap_client.shutdown()
+
+    async def read_multiple_properties(self, td, names, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing
+        using a single request."""
+
+        href = self._pick_coap_href(td, op=InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            return await super(CoAPClient, self).read_multiple_properties(
+                td, names, timeout=timeout
+            )
+
+        res = await self._request_properties(
+            href, aiocoap.Code.FETCH, payload={"names": list(names)}, timeout=timeout
+        )
+
+        return res.get("values")
+
+    async def read_all_properties(self, td, timeout=None):
+        """Reads the values of all the Properties on a remote Thing
+        using a single request."""
+
+        href = self._pick_coap_href(td, op=InteractionVerbs.READ_ALL_PROPERTIES)
+
+        if href is None:
+            return await super(CoAPClient, self).read_all_properties(
+                td, timeout=timeout
+            )
+
+        res = await self._request_properties(href, aiocoap.Code.GET, timeout=timeout)
+
+        return res.get("values")
+
+    async def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing
+        using a single request."""
+
+        href = self._pick_coap_href(td, op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            return await super(CoAPClient, self).write_multiple_properties(
+                td, values, timeout=timeout
+            )
+
+        await self._request_properties(
+            href, aiocoap.Code.PUT, payload={"values": dict(values)}, timeout=timeout
+        )
+
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
 
         href = self._pick_coap_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.OBSERVE_PROPERTY
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.OBSERVE_PROPERTY
         )
 
         if href is None:
@@ -331,7 +387,7 @@ class CoAPClient(BaseProtocolClient):
         Returns an Observable."""
 
         href = self._pick_coap_href(
-            td, td.get_event_forms(name), op=InteractionVerbs.SUBSCRIBE_EVENT
+            td, InteractionTypes.EVENT, name, op=InteractionVerbs.SUBSCRIBE_EVENT
         )
 
         if href is None:
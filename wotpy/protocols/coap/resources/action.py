@@ -15,6 +15,7 @@ import aiocoap.error
 import aiocoap.resource
 
 from wotpy.protocols.coap.resources.utils import parse_request_opt_query
+from wotpy.wot.exposed.admission import AdmissionRejectedError
 
 JSON_CONTENT_FORMAT = 50
 
@@ -166,7 +167,13 @@ class ActionResource(aiocoap.resource.ObservableResource):
 
         input_value = request_payload.get("input")
 
-        invoke_task = asyncio.create_task(thing_action.invoke(input_value))
+        try:
+            invoke_task = thing_action.try_invoke(input_value)
+        except AdmissionRejectedError as ex:
+            return aiocoap.Message(
+                code=aiocoap.Code.SERVICE_UNAVAILABLE, payload=str(ex).encode("utf-8")
+            )
+
         invoke_task.add_done_callback(done_cb)
         self._pending_actions[invocation_id] = invoke_task
 
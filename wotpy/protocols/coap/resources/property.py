@@ -25,6 +25,12 @@ async def _build_property_value_response(thing_property):
     payload = json.dumps({"value": value}).encode("utf-8")
     response = aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
     response.opt.content_format = JSON_CONTENT_FORMAT
+
+    max_age = thing_property.get_max_age()
+
+    if max_age is not None:
+        response.opt.max_age = max_age
+
     return response
 
 
@@ -110,3 +116,88 @@ class PropertyResource(aiocoap.resource.ObservableResource):
         response = aiocoap.Message(code=aiocoap.Code.CHANGED)
 
         return response
+
+
+def get_exposed_thing(server, request):
+    """Takes a CoAP request and returns the ExposedThing
+    identified by the request arguments."""
+
+    query = parse_request_opt_query(request)
+    url_name_thing = query.get("thing")
+
+    if not url_name_thing:
+        raise aiocoap.error.BadRequest("Missing query arguments")
+
+    exposed_thing = server.exposed_thing_set.find_by_thing_id(url_name_thing)
+
+    if not exposed_thing:
+        raise aiocoap.error.NotFound("Thing not found")
+
+    return exposed_thing
+
+
+def _build_property_values_response(values):
+    """Builds the CoAP response containing the given dict of property values."""
+
+    payload = json.dumps({"values": values}).encode("utf-8")
+    response = aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
+    response.opt.content_format = JSON_CONTENT_FORMAT
+    return response
+
+
+def _parse_request_payload(request, key, value_type):
+    """Returns the value for the given key in the JSON payload of the CoAP request."""
+
+    try:
+        value = json.loads(request.payload).get(key)
+    except (ValueError, AttributeError):
+        raise aiocoap.error.BadRequest("Invalid payload") from None
+
+    if not isinstance(value, value_type):
+        raise aiocoap.error.BadRequest("Invalid payload")
+
+    return value
+
+
+class PropertiesResource(aiocoap.resource.Resource):
+    """CoAP resource that implements the verbs to read and write multiple Properties at once."""
+
+    def __init__(self, server):
+        super(PropertiesResource, self).__init__()
+        self._server = server
+
+    async def render_get(self, request):
+        """Returns a CoAP response with the values of all the properties."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        values = await exposed_thing.read_all_properties()
+        return _build_property_values_response(values)
+
+    async def render_fetch(self, request):
+        """Returns a CoAP response with the values of the
+        properties listed in the CoAP request payload."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        names = _parse_request_payload(request, "names", list)
+
+        try:
+            values = await exposed_thing.read_multiple_properties(names)
+        except ValueError as ex:
+            raise aiocoap.error.NotFound(str(ex)) from None
+
+        return _build_property_values_response(values)
+
+    async def render_put(self, request):
+        """Updates the properties with the values retrieved from the CoAP request payload."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        values = _parse_request_payload(request, "values", dict)
+
+        try:
+            await exposed_thing.write_multiple_properties(values)
+        except ValueError as ex:
+            raise aiocoap.error.NotFound(str(ex)) from None
+        except TypeError as ex:
+            raise aiocoap.error.BadRequest(str(ex)) from None
+
+        return aiocoap.Message(code=aiocoap.Code.CHANGED)
@@ -15,7 +15,10 @@ from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.coap.enums import CoAPSchemes
 from wotpy.protocols.coap.resources.action import ActionResource
 from wotpy.protocols.coap.resources.event import EventResource
-from wotpy.protocols.coap.resources.property import PropertyResource
+from wotpy.protocols.coap.resources.property import (
+    PropertiesResource,
+    PropertyResource,
+)
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.wot.enums import InteractionTypes
@@ -158,6 +161,29 @@ class CoAPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the CoAP Forms to read and write
+        multiple Properties of the given Thing at once."""
+
+        href = "{}://{}:{}/properties?thing={}".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"), self.port, thing.url_name
+        )
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=href,
+                content_type=MediaTypes.JSON,
+                op=op,
+            )
+            for op in [
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES,
+            ]
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -180,6 +206,8 @@ class CoAPServer(BaseProtocolServer):
 
         root.add_resource(("property",), PropertyResource(self))
 
+        root.add_resource(("properties",), PropertiesResource(self))
+
         root.add_resource(
             ("action",), ActionResource(self, clear_ms=self._action_clear_ms)
         )
@@ -12,15 +12,15 @@ import time
 import urllib.parse as parse
 
 import tornado.httpclient
-from rx import Observable
 from tornado.simple_httpclient import HTTPTimeoutError
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import ClientRequestTimeout, FormNotFoundException
 from wotpy.protocols.http.enums import HTTPSchemes
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.utils.observable import Observable
 from wotpy.utils.utils import handle_observer_finalization
+from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.events import (
     EmittedEvent,
     PropertyChangeEmittedEvent,
@@ -44,28 +44,18 @@ class HTTPClient(BaseProtocolClient):
         super(HTTPClient, self).__init__()
 
     @classmethod
-    def pick_http_href(cls, td, forms, op=None):
-        """Picks the most appropriate HTTP form href from the given list of forms."""
-
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        def find_href(scheme):
-            try:
-                return next(
-                    form.href
-                    for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form)
-                )
-            except StopIteration:
-                return None
-
-        form_https = find_href(HTTPSchemes.HTTPS)
+    def pick_http_href(cls, td, interaction_type=None, name=None, op=None):
+        """Picks the most appropriate HTTP form href (HTTPS is preferred) for the
+        given interaction or the Thing-level Forms if interaction_type is None."""
+
+        resolved = td.form_table.pick(
+            [HTTPSchemes.HTTPS, HTTPSchemes.HTTP],
+            interaction_type=interaction_type,
+            name=name,
+            op=op,
+        )
 
-        return form_https if form_https is not None else find_href(HTTPSchemes.HTTP)
+        return resolved.url if resolved else None
 
     @property
     def protocol(self):
@@ -90,13 +80,7 @@ class HTTPClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
-
-        forms_http = [
-            form for form in forms if is_scheme_form(form, td.base, HTTPSchemes.list())
-        ]
-
-        return len(forms_http) > 0
+        return td.form_table.supports(name, HTTPSchemes.list())
 
     async def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
@@ -107,7 +91,7 @@ class HTTPClient(BaseProtocolClient):
 
         now = time.time()
 
-        href = self.pick_http_href(td, td.get_action_forms(name))
+        href = self.pick_http_href(td, InteractionTypes.ACTION, name)
 
         if href is None:
             raise FormNotFoundException()
@@ -181,7 +165,7 @@ class HTTPClient(BaseProtocolClient):
         con_timeout = timeout if timeout else self._connect_timeout
         req_timeout = timeout if timeout else self._request_timeout
 
-        href = self.pick_http_href(td, td.get_property_forms(name))
+        href = self.pick_http_href(td, InteractionTypes.PROPERTY, name)
 
         if href is None:
             raise FormNotFoundException()
@@ -210,7 +194,7 @@ class HTTPClient(BaseProtocolClient):
         con_timeout = timeout if timeout else self._connect_timeout
         req_timeout = timeout if timeout else self._request_timeout
 
-        href = self.pick_http_href(td, td.get_property_forms(name))
+        href = self.pick_http_href(td, InteractionTypes.PROPERTY, name)
 
         if href is None:
             raise FormNotFoundException()
@@ -233,11 +217,96 @@ class HTTPClient(BaseProtocolClient):
 
         return result
 
+    async def read_multiple_properties(self, td, names, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing with a single
+        request if the Thing exposes the appropriate HTTP Form.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        href = self.pick_http_href(td, op=InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            return await super(HTTPClient, self).read_multiple_properties(
+                td, names, timeout=timeout
+            )
+
+        query = parse.urlencode([("name", name) for name in names])
+
+        return await self._read_properties("{}?{}".format(href, query), timeout=timeout)
+
+    async def read_all_properties(self, td, timeout=None):
+        """Reads the values of all the Properties on a remote Thing with a single
+        request if the Thing exposes the appropriate HTTP Form.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        href = self.pick_http_href(td, op=InteractionVerbs.READ_ALL_PROPERTIES)
+
+        if href is None:
+            return await super(HTTPClient, self).read_all_properties(
+                td, timeout=timeout
+            )
+
+        return await self._read_properties(href, timeout=timeout)
+
+    async def _read_properties(self, href, timeout=None):
+        """Sends a request to read multiple Properties to the given URL."""
+
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href,
+                method="GET",
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout,
+            )
+        except HTTPTimeoutError as ex:
+            raise ClientRequestTimeout from ex
+
+        response = await http_client.fetch(http_request)
+
+        return json.loads(response.body).get("values")
+
+    async def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing with a single
+        request if the Thing exposes the appropriate HTTP Form.
+        Returns a Future."""
+
+        href = self.pick_http_href(td, op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            await super(HTTPClient, self).write_multiple_properties(
+                td, values, timeout=timeout
+            )
+            return
+
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        body = json.dumps({"values": values})
+
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href,
+                method="PUT",
+                body=body,
+                headers=self.JSON_HEADERS,
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout,
+            )
+        except HTTPTimeoutError as ex:
+            raise ClientRequestTimeout from ex
+
+        await http_client.fetch(http_request)
+
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
 
-        href = self.pick_http_href(td, td.get_event_forms(name))
+        href = self.pick_http_href(td, InteractionTypes.EVENT, name)
 
         if href is None:
             raise FormNotFoundException()
@@ -274,7 +343,7 @@ class HTTPClient(BaseProtocolClient):
         Returns an Observable"""
 
         href = self.pick_http_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.OBSERVE_PROPERTY
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.OBSERVE_PROPERTY
         )
 
         if href is None:
@@ -13,6 +13,7 @@ import uuid
 from tornado.web import HTTPError, RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.wot.exposed.admission import AdmissionRejectedError
 
 
 class ActionInvokeHandler(RequestHandler):
@@ -26,7 +27,12 @@ class ActionInvokeHandler(RequestHandler):
 
         exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
         input_value = handler_utils.get_argument(self, "input")
-        future_result = exposed_thing.actions[name].invoke(input_value)
+
+        try:
+            future_result = exposed_thing.actions[name].try_invoke(input_value)
+        except AdmissionRejectedError as ex:
+            raise HTTPError(status_code=503, log_message=str(ex))
+
         invocation_id = uuid.uuid4().hex
         self._server.pending_actions[invocation_id] = future_result
         self.write({"invocation": "/invocation/{}".format(invocation_id)})
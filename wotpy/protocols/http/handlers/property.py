@@ -7,12 +7,33 @@ Request handler for Property interactions.
 
 import asyncio
 import logging
+import time
 
-from tornado.web import RequestHandler
+from tornado.web import HTTPError, RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
 
 
+def set_cache_control_header(handler, thing_property):
+    """Sets the Cache-Control header of the response
+    if the Property has a cache policy."""
+
+    max_age = thing_property.get_max_age()
+
+    if max_age is None:
+        return
+
+    directives = ["max-age={}".format(max_age)]
+    policy = thing_property.get_cache_policy()
+
+    if policy.stale_while_revalidate:
+        directives.append(
+            "stale-while-revalidate={}".format(int(policy.stale_while_revalidate))
+        )
+
+    handler.set_header("Cache-Control", ", ".join(directives))
+
+
 class PropertyReadWriteHandler(RequestHandler):
     """Handler for Property get/set requests."""
 
@@ -23,7 +44,9 @@ class PropertyReadWriteHandler(RequestHandler):
         """Reads and returns the Property value."""
 
         exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
-        value = await exposed_thing.properties[name].read()
+        thing_property = exposed_thing.properties[name]
+        value = await thing_property.read()
+        set_cache_control_header(self, thing_property)
         self.write({"value": value})
 
     async def put(self, thing_name, name):
@@ -34,6 +57,103 @@ class PropertyReadWriteHandler(RequestHandler):
         await exposed_thing.properties[name].write(value)
 
 
+class MultiplePropertiesHandler(RequestHandler):
+    """Handler for requests to read or write multiple Properties at once."""
+
+    def initialize(self, http_server):
+        self._server = http_server
+
+    async def get(self, thing_name):
+        """Reads and returns the values of the Properties given in the name
+        query arguments (or all the Properties if there are none)."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        names = self.get_arguments("name")
+
+        try:
+            if len(names):
+                values = await exposed_thing.read_multiple_properties(names)
+            else:
+                values = await exposed_thing.read_all_properties()
+        except ValueError as ex:
+            raise HTTPError(status_code=404, log_message=str(ex))
+
+        self.write({"values": values})
+
+    async def put(self, thing_name):
+        """Updates the values of multiple Properties."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        values = handler_utils.get_argument(self, "values")
+
+        if not isinstance(values, dict):
+            raise HTTPError(status_code=400, log_message="Invalid values")
+
+        try:
+            await exposed_thing.write_multiple_properties(values)
+        except ValueError as ex:
+            raise HTTPError(status_code=404, log_message=str(ex))
+        except TypeError as ex:
+            raise HTTPError(status_code=400, log_message=str(ex))
+
+
+class PropertyHistoryHandler(RequestHandler):
+    """Handler for requests to retrieve the recent values of a Property."""
+
+    def initialize(self, http_server):
+        self._server = http_server
+
+    def _get_number_argument(self, name, parse=float):
+        """Returns the parsed value of a numeric query argument (None if undefined)."""
+
+        value = self.get_argument(name, None)
+
+        if value is None:
+            return None
+
+        try:
+            return parse(value)
+        except ValueError:
+            raise HTTPError(
+                status_code=400, log_message="Invalid {}: {}".format(name, value)
+            )
+
+    async def get(self, thing_name, name):
+        """Returns the values written to the Property in the range defined by the
+        since and until query arguments (seconds since the epoch) or in the last
+        seconds given by the last query argument. The limit query argument
+        restricts the response to the latest values of the range."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+
+        since = self._get_number_argument("since")
+        until = self._get_number_argument("until")
+        last = self._get_number_argument("last")
+        limit = self._get_number_argument("limit", parse=int)
+
+        if last is not None:
+            since = time.time() - last
+
+        if limit is not None and limit < 0:
+            raise HTTPError(status_code=400, log_message="Invalid limit")
+
+        try:
+            items = exposed_thing.get_property_history(
+                name, since=since, until=until, limit=limit
+            )
+        except ValueError as ex:
+            raise HTTPError(status_code=404, log_message=str(ex))
+
+        self.write(
+            {
+                "history": [
+                    {"timestamp": timestamp, "value": value}
+                    for timestamp, value in items
+                ]
+            }
+        )
+
+
 class PropertyObserverHandler(RequestHandler):
     """Handler for Property subscription requests."""
 
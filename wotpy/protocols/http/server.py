@@ -17,6 +17,8 @@ from wotpy.protocols.http.handlers.action import (
 )
 from wotpy.protocols.http.handlers.event import EventObserverHandler
 from wotpy.protocols.http.handlers.property import (
+    MultiplePropertiesHandler,
+    PropertyHistoryHandler,
     PropertyObserverHandler,
     PropertyReadWriteHandler,
 )
@@ -92,11 +94,21 @@ class HTTPServer(BaseProtocolServer):
                     PropertyReadWriteHandler,
                     {"http_server": self},
                 ),
+                (
+                    r"/(?P<thing_name>[^\/]+)/properties",
+                    MultiplePropertiesHandler,
+                    {"http_server": self},
+                ),
                 (
                     r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/subscription",
                     PropertyObserverHandler,
                     {"http_server": self},
                 ),
+                (
+                    r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/history",
+                    PropertyHistoryHandler,
+                    {"http_server": self},
+                ),
                 (
                     r"/(?P<thing_name>[^\/]+)/action/(?P<name>[^\/]+)",
                     ActionInvokeHandler,
@@ -203,6 +215,28 @@ class HTTPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the HTTP Forms to read and write
+        multiple Properties of the given Thing at once."""
+
+        href_properties = "{}://{}:{}/{}/properties".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"), self.port, thing.url_name
+        )
+
+        form_properties = Form(
+            interaction=thing,
+            protocol=self.protocol,
+            href=href_properties,
+            content_type=MediaTypes.JSON,
+            op=[
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES,
+            ],
+        )
+
+        return [form_properties]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
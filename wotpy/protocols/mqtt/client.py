@@ -11,11 +11,9 @@ import json
 import logging
 import pprint
 import time
-import urllib.parse as parse
 import uuid
 
 import aiomqtt
-from rx import Observable
 from slugify import slugify
 
 from wotpy.protocols.client import BaseProtocolClient
@@ -26,8 +24,9 @@ from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.mqtt.utils import MQTTBrokerURL, aiomqtt_read_loop
 from wotpy.protocols.refs import ConnRefCounter
-from wotpy.protocols.utils import is_scheme_form
+from wotpy.utils.observable import Observable
 from wotpy.utils.utils import handle_observer_finalization
+from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.events import (
     EmittedEvent,
     PropertyChangeEmittedEvent,
@@ -399,38 +398,19 @@ class MQTTClient(BaseProtocolClient):
             )
 
     @classmethod
-    def _pick_mqtt_href(cls, td, forms, op=None):
-        """Picks the most appropriate MQTT form href from the given list of forms."""
-
-        def is_op_form(form):
-            try:
-                return op is None or op == form.op or op in form.op
-            except TypeError:
-                return False
-
-        return next(
-            (
-                form.href
-                for form in forms
-                if is_scheme_form(form, td.base, MQTTSchemes.MQTT) and is_op_form(form)
-            ),
-            None,
+    def _pick_mqtt_form(cls, td, interaction_type=None, name=None, op=None):
+        """Picks the most appropriate MQTT form for the given interaction or the
+        Thing-level Forms if interaction_type is None. The returned ResolvedForm
+        contains the MQTT broker URL (host key) and the topic separately."""
+
+        resolved = td.form_table.pick(
+            [MQTTSchemes.MQTT],
+            interaction_type=interaction_type,
+            name=name,
+            op=op,
         )
 
-    @classmethod
-    def _parse_href(cls, href):
-        """Takes an MQTT form href and returns
-        the MQTT broker URL and the topic separately."""
-
-        parsed_href = parse.urlparse(href)
-
-        # trunk-ignore(bandit/B101)
-        assert parsed_href.scheme and parsed_href.netloc and parsed_href.path
-
-        return {
-            "broker_url": "{}://{}".format(parsed_href.scheme, parsed_href.netloc),
-            "topic": parsed_href.path.lstrip("/").rstrip("/"),
-        }
+        return resolved if resolved and resolved.topic else None
 
     @property
     def protocol(self):
@@ -443,13 +423,7 @@ class MQTTClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
-
-        forms_mqtt = [
-            form for form in forms if is_scheme_form(form, td.base, MQTTSchemes.list())
-        ]
-
-        return len(forms_mqtt) > 0
+        return td.form_table.supports(name, MQTTSchemes.list())
 
     async def invoke_action(
         self,
@@ -466,15 +440,14 @@ class MQTTClient(BaseProtocolClient):
         timeout = timeout if timeout else self._timeout_default
         ref_id = uuid.uuid4().hex
 
-        href = self._pick_mqtt_href(td, td.get_action_forms(name))
+        form = self._pick_mqtt_form(td, InteractionTypes.ACTION, name)
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
-        broker_url = parsed_href["broker_url"]
+        broker_url = form.host_key
 
-        topic_invoke = parsed_href["topic"]
+        topic_invoke = form.topic
         topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
 
         try:
@@ -535,17 +508,16 @@ class MQTTClient(BaseProtocolClient):
         timeout = timeout if timeout else self._timeout_default
         ref_id = uuid.uuid4().hex
 
-        href_write = self._pick_mqtt_href(
-            td, td.get_property_forms(name), op=InteractionVerbs.WRITE_PROPERTY
+        form_write = self._pick_mqtt_form(
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.WRITE_PROPERTY
         )
 
-        if href_write is None:
+        if form_write is None:
             raise FormNotFoundException()
 
-        parsed_href_write = self._parse_href(href_write)
-        broker_url = parsed_href_write["broker_url"]
+        broker_url = form_write.host_key
 
-        topic_write = parsed_href_write["topic"]
+        topic_write = form_write.topic
         topic_ack = PropertyMQTTHandler.to_write_ack_topic(topic_write)
 
         try:
@@ -592,25 +564,22 @@ class MQTTClient(BaseProtocolClient):
         timeout = timeout if timeout else self._timeout_default
         ref_id = uuid.uuid4().hex
 
-        forms = td.get_property_forms(name)
-
-        href_read = self._pick_mqtt_href(td, forms, op=InteractionVerbs.READ_PROPERTY)
+        form_read = self._pick_mqtt_form(
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.READ_PROPERTY
+        )
 
-        href_obsv = self._pick_mqtt_href(
-            td, forms, op=InteractionVerbs.OBSERVE_PROPERTY
+        form_obsv = self._pick_mqtt_form(
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.OBSERVE_PROPERTY
         )
 
-        if href_read is None or href_obsv is None:
+        if form_read is None or form_obsv is None:
             raise FormNotFoundException()
 
-        parsed_href_read = self._parse_href(href_read)
-        parsed_href_obsv = self._parse_href(href_obsv)
-
-        topic_read = parsed_href_read["topic"]
-        topic_obsv = parsed_href_obsv["topic"]
+        topic_read = form_read.topic
+        topic_obsv = form_obsv.topic
 
-        broker_read = parsed_href_read["broker_url"]
-        broker_obsv = parsed_href_obsv["broker_url"]
+        broker_read = form_read.host_key
+        broker_obsv = form_obsv.host_key
 
         try:
             await self._init_client(broker_read, ref_id)
@@ -655,6 +624,143 @@ class MQTTClient(BaseProtocolClient):
             if broker_obsv != broker_read:
                 await self._disconnect_client(broker_obsv, ref_id)
 
+    async def _request_multiple(
+        self, form, topic_res, req_data, match_key, timeout, qos_publish, qos_subscribe
+    ):
+        """Publishes a request to the Thing-level Property requests topic and
+        waits for the response message whose match_key equals that of the request.
+        Raises an Exception if the response contains an error."""
+
+        ref_id = uuid.uuid4().hex
+        broker_url = form.host_key
+        topic_req = form.topic
+
+        try:
+            await self._init_client(broker_url, ref_id)
+            await self._subscribe(broker_url, topic_res, qos_subscribe)
+
+            req_payload = json.dumps(req_data).encode()
+
+            await self._publish(broker_url, topic_req, req_payload, qos_publish)
+
+            ini = time.time()
+
+            while True:
+                self._logr.debug("Checking response topic: {}".format(topic_res))
+
+                if timeout and (time.time() - ini) > timeout:
+                    self._logr.warning("Timeout on request: {}".format(topic_req))
+                    raise ClientRequestTimeout
+
+                msg_match = self._next_match(
+                    broker_url,
+                    topic_res,
+                    lambda item: item[1].get(match_key) == req_data[match_key],
+                )
+
+                if msg_match:
+                    if msg_match[1].get("error", None) is not None:
+                        raise Exception(msg_match[1].get("error"))
+
+                    return msg_match[1]
+
+                await self._wait_on_message(broker_url, topic_res)
+        finally:
+            await self._disconnect_client(broker_url, ref_id)
+
+    async def _read_multiple(
+        self, td, op, req_data, timeout, qos_publish, qos_subscribe
+    ):
+        """Reads the values of multiple Properties on a remote
+        Thing using the Thing-level Form for the given operation."""
+
+        form = self._pick_mqtt_form(td, op=op)
+        topic_res = PropertyMQTTHandler.to_multiple_values_topic(form.topic)
+
+        req_data.update({"id": uuid.uuid4().hex})
+
+        msg_data = await self._request_multiple(
+            form,
+            topic_res,
+            req_data,
+            "id",
+            timeout if timeout else self._timeout_default,
+            qos_publish,
+            qos_subscribe,
+        )
+
+        return msg_data.get("values")
+
+    async def read_multiple_properties(
+        self, td, names, timeout=None, qos_publish=1, qos_subscribe=1
+    ):
+        """Reads the values of multiple Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        op = InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        if self._pick_mqtt_form(td, op=op) is None:
+            return await super(MQTTClient, self).read_multiple_properties(
+                td, names, timeout=timeout
+            )
+
+        return await self._read_multiple(
+            td,
+            op,
+            {"action": "readmultiple", "names": list(names)},
+            timeout,
+            qos_publish,
+            qos_subscribe,
+        )
+
+    async def read_all_properties(
+        self, td, timeout=None, qos_publish=1, qos_subscribe=1
+    ):
+        """Reads the values of all the Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES
+
+        if self._pick_mqtt_form(td, op=op) is None:
+            return await super(MQTTClient, self).read_all_properties(
+                td, timeout=timeout
+            )
+
+        return await self._read_multiple(
+            td, op, {"action": "readall"}, timeout, qos_publish, qos_subscribe
+        )
+
+    async def write_multiple_properties(
+        self, td, values, timeout=None, qos_publish=2, qos_subscribe=1
+    ):
+        """Updates the values of multiple Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        form = self._pick_mqtt_form(td, op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if form is None:
+            return await super(MQTTClient, self).write_multiple_properties(
+                td, values, timeout=timeout
+            )
+
+        topic_ack = PropertyMQTTHandler.to_multiple_write_ack_topic(form.topic)
+
+        write_data = {
+            "action": "writemultiple",
+            "values": dict(values),
+            "ack": uuid.uuid4().hex,
+        }
+
+        await self._request_multiple(
+            form,
+            topic_ack,
+            write_data,
+            "ack",
+            timeout if timeout else self._timeout_default,
+            qos_publish,
+            qos_subscribe,
+        )
+
     def _build_subscribe(self, broker_url, topic, next_item_builder, qos):
         """Builds the subscribe function that should be passed when
         constructing an Observable to listen for messages on an MQTT topic."""
@@ -724,17 +830,15 @@ class MQTTClient(BaseProtocolClient):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
 
-        forms = td.get_property_forms(name)
-
-        href = self._pick_mqtt_href(td, forms, op=InteractionVerbs.OBSERVE_PROPERTY)
+        form = self._pick_mqtt_form(
+            td, InteractionTypes.PROPERTY, name, op=InteractionVerbs.OBSERVE_PROPERTY
+        )
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
-
-        broker_url = parsed_href["broker_url"]
-        topic = parsed_href["topic"]
+        broker_url = form.host_key
+        topic = form.topic
 
         def next_item_builder(msg_data):
             msg_value = msg_data.get("value")
@@ -754,17 +858,15 @@ class MQTTClient(BaseProtocolClient):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
 
-        forms = td.get_event_forms(name)
-
-        href = self._pick_mqtt_href(td, forms, op=InteractionVerbs.SUBSCRIBE_EVENT)
+        form = self._pick_mqtt_form(
+            td, InteractionTypes.EVENT, name, op=InteractionVerbs.SUBSCRIBE_EVENT
+        )
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
-
-        broker_url = parsed_href["broker_url"]
-        topic = parsed_href["topic"]
+        broker_url = form.host_key
+        topic = form.topic
 
         def next_item_builder(msg_data):
             return EmittedEvent(init=msg_data.get("data"), name=name)
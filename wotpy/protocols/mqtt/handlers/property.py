@@ -24,8 +24,14 @@ class PropertyMQTTHandler(BaseMQTTHandler):
     KEY_ACTION = "action"
     KEY_VALUE = "value"
     KEY_ACK = "ack"
+    KEY_NAMES = "names"
+    KEY_VALUES = "values"
+    KEY_ID = "id"
     ACTION_READ = "read"
     ACTION_WRITE = "write"
+    ACTION_READ_MULTIPLE = "readmultiple"
+    ACTION_READ_ALL = "readall"
+    ACTION_WRITE_MULTIPLE = "writemultiple"
     DEFAULT_CALLBACK_MS = 2000
     DEFAULT_JITTER = 0.2
 
@@ -83,6 +89,36 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
         return "{}/property/ack/{}/{}".format(servient_id, thing_name, prop_name)
 
+    @classmethod
+    def _split_topic(cls, topic):
+        """Returns the list of levels of the given topic."""
+
+        # ToDo: Ensure that topic is a str instead of an instance of aiomqtt.Topic
+        try:
+            return topic.value.split("/")
+        except Exception:
+            return topic.split("/")
+
+    @classmethod
+    def to_multiple_values_topic(cls, requests_topic):
+        """Takes a Thing-level Property requests topic and returns
+        the related topic where the values of multiple Properties are published."""
+
+        topic_split = cls._split_topic(requests_topic)
+        servient_id, thing_name = topic_split[-4], topic_split[-1]
+
+        return "{}/property/values/{}".format(servient_id, thing_name)
+
+    @classmethod
+    def to_multiple_write_ack_topic(cls, requests_topic):
+        """Takes a Thing-level Property requests topic and returns
+        the related topic where multiple writes are acknowledged."""
+
+        topic_split = cls._split_topic(requests_topic)
+        servient_id, thing_name = topic_split[-4], topic_split[-1]
+
+        return "{}/property/ack/{}".format(servient_id, thing_name)
+
     @property
     def topics(self):
         """List of topics that this MQTT handler wants to subscribe to."""
@@ -99,10 +135,20 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
         action = parsed_msg.get(self.KEY_ACTION, False)
 
-        if not action or action not in [self.ACTION_WRITE, self.ACTION_READ]:
+        topic_split = msg.topic.value.split("/")
+
+        if action in [
+            self.ACTION_READ_MULTIPLE,
+            self.ACTION_READ_ALL,
+            self.ACTION_WRITE_MULTIPLE,
+        ]:
+            if len(topic_split) == len(self.topic_wildcard_requests.split("/")):
+                await self._handle_multiple(msg, parsed_msg, topic_split[-1])
+
             return
 
-        topic_split = msg.topic.value.split("/")
+        if not action or action not in [self.ACTION_WRITE, self.ACTION_READ]:
+            return
 
         splits_expected_len = len(self.topic_wildcard_requests.split("/")) + 1
 
@@ -135,6 +181,68 @@ class PropertyMQTTHandler(BaseMQTTHandler):
             await exp_thing.properties[prop.name].write(parsed_msg[self.KEY_VALUE])
             await self.publish_write_ack(msg)
 
+    async def _handle_multiple(self, msg, parsed_msg, thing_url_name):
+        """Responds to the requests to read or write multiple Properties at once.
+        Failed requests are answered with an error message on the response topic."""
+
+        try:
+            exp_thing = next(
+                item
+                for item in self.mqtt_server.exposed_things
+                if item.url_name == thing_url_name
+            )
+        except StopIteration:
+            return
+
+        action = parsed_msg[self.KEY_ACTION]
+
+        if action == self.ACTION_WRITE_MULTIPLE:
+            topic_res = self.to_multiple_write_ack_topic(msg.topic)
+            match_key = self.KEY_ACK
+        else:
+            topic_res = self.to_multiple_values_topic(msg.topic)
+            match_key = self.KEY_ID
+
+        match_code = parsed_msg.get(match_key, None)
+
+        if action == self.ACTION_WRITE_MULTIPLE and not match_code:
+            return
+
+        data = {match_key: match_code}
+
+        try:
+            if action == self.ACTION_READ_ALL:
+                values = await exp_thing.read_all_properties()
+            elif action == self.ACTION_READ_MULTIPLE:
+                values = await exp_thing.read_multiple_properties(
+                    parsed_msg.get(self.KEY_NAMES, [])
+                )
+            else:
+                values = parsed_msg.get(self.KEY_VALUES, None)
+
+                if not isinstance(values, dict):
+                    raise TypeError("Invalid Property values: {}".format(values))
+
+                await exp_thing.write_multiple_properties(values)
+        except Exception as ex:
+            data.update({"error": str(ex)})
+        else:
+            if action != self.ACTION_WRITE_MULTIPLE:
+                data.update(
+                    {
+                        self.KEY_VALUES: to_json_obj(values),
+                        "timestamp": int(time.time() * 1000),
+                    }
+                )
+
+        await self.queue.put(
+            {
+                "topic": topic_res,
+                "data": json.dumps(data).encode(),
+                "qos": self._qos_rw,
+            }
+        )
+
     async def publish_write_ack(self, msg):
         """Takes a Property write request message and publishes the related write ACK message."""
 
@@ -168,6 +168,28 @@ class MQTTServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the MQTT Forms to read and write
+        multiple Properties of the given Thing at once."""
+
+        href = "{}/{}/property/requests/{}".format(
+            self._broker_url.rstrip("/"), self.servient_id, thing.url_name
+        )
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=href,
+                content_type=MediaTypes.JSON,
+                op=[
+                    InteractionVerbs.READ_ALL_PROPERTIES,
+                    InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                    InteractionVerbs.WRITE_MULTIPLE_PROPERTIES,
+                ],
+            )
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
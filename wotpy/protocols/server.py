@@ -90,6 +90,13 @@ class BaseProtocolServer(object):
 
         raise NotImplementedError()
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all the Thing-level Forms (e.g. the
+        Forms to read or write multiple Properties at once) that are linked
+        to this server for the given Thing. None are built by default."""
+
+        return []
+
     @abstractmethod
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
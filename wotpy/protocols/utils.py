@@ -5,27 +5,28 @@
 Utility functions used by client and server implementations.
 """
 
-import urllib.parse
+from wotpy.wot.form_table import resolve_form
 
 
 def is_scheme_form(form, base, scheme):
     """Returns True if the scheme of the URI for
     the given Form matches the scheme argument."""
 
-    resolved_url = form.resolve_uri(base=base)
+    resolved = resolve_form(form, base)
 
-    if not resolved_url:
+    if resolved is None:
         return False
 
-    parsed_scheme = urllib.parse.urlparse(resolved_url).scheme
-
     return (
-        parsed_scheme in scheme if isinstance(scheme, list) else parsed_scheme == scheme
+        resolved.scheme in scheme
+        if isinstance(scheme, list)
+        else resolved.scheme == scheme
     )
 
 
 def pick_form(td, forms, schemes, op=None):
-    """Picks the Form that will be used to connect to the remote Thing."""
+    """Picks the Form that will be used to connect to the remote Thing.
+    The protocol clients look up the pre-resolved td.form_table instead."""
 
     for scheme in schemes:
         scheme_forms = [form for form in forms if is_scheme_form(form, td.base, scheme)]
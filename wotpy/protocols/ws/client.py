@@ -10,13 +10,11 @@ import logging
 import uuid
 
 import tornado.websocket
-from rx import Observable
 
 from wotpy.protocols.client import BaseProtocolClient
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import ClientRequestTimeout, FormNotFoundException
 from wotpy.protocols.refs import ConnRefCounter
-from wotpy.protocols.utils import is_scheme_form, pick_form
 from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketSchemes
 from wotpy.protocols.ws.messages import (
     WebsocketMessageEmittedItem,
@@ -25,6 +23,8 @@ from wotpy.protocols.ws.messages import (
     WebsocketMessageRequest,
     WebsocketMessageResponse,
 )
+from wotpy.utils.observable import Observable
+from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.events import (
     EmittedEvent,
     PropertyChangeEmittedEvent,
@@ -284,19 +284,7 @@ class WebsocketClient(BaseProtocolClient):
         """Returns True if the any of the Forms for the Interaction
         with the given name is supported in this Protocol Binding client."""
 
-        forms = td.get_forms(name)
-
-        forms_wss = [
-            form
-            for form in forms
-            if is_scheme_form(form, td.base, WebsocketSchemes.WSS)
-        ]
-
-        forms_ws = [
-            form for form in forms if is_scheme_form(form, td.base, WebsocketSchemes.WS)
-        ]
-
-        return len(forms_wss) or len(forms_ws)
+        return td.form_table.supports(name, WebsocketSchemes.list())
 
     def _return_message(self, ws_url, msg_id):
         """Raises the error or return Exception from the message
@@ -322,12 +310,14 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.actions:
             raise FormNotFoundException()
 
-        form = pick_form(td, td.get_action_forms(name), WebsocketSchemes.list())
+        form = td.form_table.pick(
+            WebsocketSchemes.list(), InteractionTypes.ACTION, name
+        )
 
         if not form:
             raise FormNotFoundException()
 
-        ws_url = form.resolve_uri(td.base)
+        ws_url = form.url
         ref_id = uuid.uuid4().hex
 
         try:
@@ -358,12 +348,14 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.properties:
             raise FormNotFoundException()
 
-        form = pick_form(td, td.get_property_forms(name), WebsocketSchemes.list())
+        form = td.form_table.pick(
+            WebsocketSchemes.list(), InteractionTypes.PROPERTY, name
+        )
 
         if not form:
             raise FormNotFoundException()
 
-        ws_url = form.resolve_uri(td.base)
+        ws_url = form.url
         ref_id = uuid.uuid4().hex
 
         try:
@@ -394,12 +386,14 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.properties:
             raise FormNotFoundException()
 
-        form = pick_form(td, td.get_property_forms(name), WebsocketSchemes.list())
+        form = td.form_table.pick(
+            WebsocketSchemes.list(), InteractionTypes.PROPERTY, name
+        )
 
         if not form:
             raise FormNotFoundException()
 
-        ws_url = form.resolve_uri(td.base)
+        ws_url = form.url
         ref_id = uuid.uuid4().hex
 
         try:
@@ -423,6 +417,97 @@ class WebsocketClient(BaseProtocolClient):
         finally:
             await self._stop_conn(ws_url, ref_id)
 
+    async def _request_thing_form(self, td, op, method, params, timeout=None):
+        """Sends a request for the given method to the Thing-level Form for the
+        given operation of a remote Thing and returns the result. Returns None
+        if the Thing does not provide such a Thing-level WebSockets Form."""
+
+        form = td.form_table.pick(WebsocketSchemes.list(), op=op)
+
+        if not form:
+            return None
+
+        ws_url = form.url
+        ref_id = uuid.uuid4().hex
+
+        try:
+            await self._init_conn(ws_url, ref_id)
+
+            msg_req = WebsocketMessageRequest(
+                method=method, params=params, msg_id=uuid.uuid4().hex
+            )
+
+            condition = await self._send_message(ws_url, msg_req)
+
+            async with condition:
+                try:
+                    await asyncio.wait_for(condition.wait(), timeout=timeout)
+                except asyncio.TimeoutError as ex:
+                    raise ClientRequestTimeout from ex
+
+            return self._return_message(ws_url, msg_req.id)
+        finally:
+            await self._stop_conn(ws_url, ref_id)
+
+    def _has_thing_form(self, td, op):
+        """Returns True if the remote Thing provides a Thing-level
+        WebSockets Form for the given operation."""
+
+        return bool(td.form_table.pick(WebsocketSchemes.list(), op=op))
+
+    async def read_multiple_properties(self, td, names, timeout=None):
+        """Reads the values of multiple Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        op = InteractionVerbs.READ_MULTIPLE_PROPERTIES
+
+        if not self._has_thing_form(td, op):
+            return await super(WebsocketClient, self).read_multiple_properties(
+                td, names, timeout=timeout
+            )
+
+        return await self._request_thing_form(
+            td,
+            op,
+            WebsocketMethods.READ_MULTIPLE_PROPERTIES,
+            {"names": list(names)},
+            timeout=timeout,
+        )
+
+    async def read_all_properties(self, td, timeout=None):
+        """Reads the values of all the Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES
+
+        if not self._has_thing_form(td, op):
+            return await super(WebsocketClient, self).read_all_properties(
+                td, timeout=timeout
+            )
+
+        return await self._request_thing_form(
+            td, op, WebsocketMethods.READ_ALL_PROPERTIES, {}, timeout=timeout
+        )
+
+    async def write_multiple_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing
+        using a single request. Returns a Future."""
+
+        op = InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+
+        if not self._has_thing_form(td, op):
+            return await super(WebsocketClient, self).write_multiple_properties(
+                td, values, timeout=timeout
+            )
+
+        await self._request_thing_form(
+            td,
+            op,
+            WebsocketMethods.WRITE_MULTIPLE_PROPERTIES,
+            {"values": dict(values)},
+            timeout=timeout,
+        )
+
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
         Returns an Observable."""
@@ -430,12 +515,12 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.events:
             return Observable.throw(FormNotFoundException())
 
-        form = pick_form(td, td.get_event_forms(name), WebsocketSchemes.list())
+        form = td.form_table.pick(WebsocketSchemes.list(), InteractionTypes.EVENT, name)
 
         if not form:
             return Observable.throw(FormNotFoundException())
 
-        ws_url = form.resolve_uri(td.base)
+        ws_url = form.url
 
         msg_req = WebsocketMessageRequest(
             method=WebsocketMethods.ON_EVENT,
@@ -457,12 +542,14 @@ class WebsocketClient(BaseProtocolClient):
         if name not in td.properties:
             return Observable.throw(FormNotFoundException())
 
-        form = pick_form(td, td.get_property_forms(name), WebsocketSchemes.list())
+        form = td.form_table.pick(
+            WebsocketSchemes.list(), InteractionTypes.PROPERTY, name
+        )
 
         if not form:
             return Observable.throw(FormNotFoundException())
 
-        ws_url = form.resolve_uri(td.base)
+        ws_url = form.url
 
         msg_req = WebsocketMessageRequest(
             method=WebsocketMethods.ON_PROPERTY_CHANGE,
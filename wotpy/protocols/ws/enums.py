@@ -13,6 +13,9 @@ class WebsocketMethods(EnumListMixin):
 
     READ_PROPERTY = "read_property"
     WRITE_PROPERTY = "write_property"
+    READ_MULTIPLE_PROPERTIES = "read_multiple_properties"
+    READ_ALL_PROPERTIES = "read_all_properties"
+    WRITE_MULTIPLE_PROPERTIES = "write_multiple_properties"
     INVOKE_ACTION = "invoke_action"
     ON_PROPERTY_CHANGE = "on_property_change"
     ON_TD_CHANGE = "on_td_change"
@@ -7,8 +7,7 @@ Class that handles incoming WebSockets messages.
 
 import uuid
 
-from jsonschema import validate, ValidationError
-from rx.concurrency import IOLoopScheduler
+from jsonschema import ValidationError
 from tornado import websocket, gen
 
 from wotpy.protocols.ws.enums import WebsocketMethods, WebsocketErrors
@@ -22,12 +21,16 @@ from wotpy.protocols.ws.messages import (
 from wotpy.protocols.ws.schemas import (
     SCHEMA_PARAMS_READ_PROPERTY,
     SCHEMA_PARAMS_WRITE_PROPERTY,
+    SCHEMA_PARAMS_READ_MULTIPLE_PROPERTIES,
+    SCHEMA_PARAMS_READ_ALL_PROPERTIES,
+    SCHEMA_PARAMS_WRITE_MULTIPLE_PROPERTIES,
     SCHEMA_PARAMS_DISPOSE,
     SCHEMA_PARAMS_INVOKE_ACTION,
     SCHEMA_PARAMS_ON_PROPERTY_CHANGE,
     SCHEMA_PARAMS_ON_TD_CHANGE,
     SCHEMA_PARAMS_ON_EVENT,
 )
+from wotpy.utils.validators import validate
 
 
 # noinspection PyAbstractClass
@@ -41,7 +44,6 @@ class WebsocketHandler(websocket.WebSocketHandler):
 
     def __init__(self, *args, **kwargs):
         self._server = kwargs.pop("websocket_server", None)
-        self._scheduler = IOLoopScheduler()
         self._subscriptions = {}
         self._exposed_thing_name = None
         super(WebsocketHandler, self).__init__(*args, **kwargs)
@@ -119,7 +121,7 @@ class WebsocketHandler(websocket.WebSocketHandler):
     def _subscribe(self, subscription_id, observable):
         """Subscribe to the given Observable and add the subscription handler to the internal dict."""
 
-        subscription = observable.observe_on(self._scheduler).subscribe(
+        subscription = observable.observe_on().subscribe(
             on_next=lambda item: self._on_subscription_next(subscription_id, item),
             on_error=lambda err: self._on_subscription_error(subscription_id, err),
             on_completed=lambda: self._on_subscription_completed(subscription_id),
@@ -175,6 +177,77 @@ class WebsocketHandler(websocket.WebSocketHandler):
         res = WebsocketMessageResponse(result=None, msg_id=req.id)
         self.write_message(res.to_json())
 
+    @gen.coroutine
+    def _handle_read_multiple_properties(self, req):
+        """Handler for the 'read_multiple_properties' method."""
+
+        params = req.params
+
+        try:
+            validate(params, SCHEMA_PARAMS_READ_MULTIPLE_PROPERTIES)
+        except ValidationError as ex:
+            self._write_error(
+                str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id
+            )
+            return
+
+        try:
+            values = yield self.exposed_thing.read_multiple_properties(
+                names=params["names"]
+            )
+        except Exception as ex:
+            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
+            return
+
+        res = WebsocketMessageResponse(result=values, msg_id=req.id)
+        self.write_message(res.to_json())
+
+    @gen.coroutine
+    def _handle_read_all_properties(self, req):
+        """Handler for the 'read_all_properties' method."""
+
+        params = req.params
+
+        try:
+            validate(params, SCHEMA_PARAMS_READ_ALL_PROPERTIES)
+        except ValidationError as ex:
+            self._write_error(
+                str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id
+            )
+            return
+
+        try:
+            values = yield self.exposed_thing.read_all_properties()
+        except Exception as ex:
+            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
+            return
+
+        res = WebsocketMessageResponse(result=values, msg_id=req.id)
+        self.write_message(res.to_json())
+
+    @gen.coroutine
+    def _handle_write_multiple_properties(self, req):
+        """Handler for the 'write_multiple_properties' method."""
+
+        params = req.params
+
+        try:
+            validate(params, SCHEMA_PARAMS_WRITE_MULTIPLE_PROPERTIES)
+        except ValidationError as ex:
+            self._write_error(
+                str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id
+            )
+            return
+
+        try:
+            yield self.exposed_thing.write_multiple_properties(values=params["values"])
+        except Exception as ex:
+            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
+            return
+
+        res = WebsocketMessageResponse(result=None, msg_id=req.id)
+        self.write_message(res.to_json())
+
     @gen.coroutine
     def _handle_invoke_action(self, req):
         """Handler for the 'invoke_action' method."""
@@ -302,6 +375,9 @@ class WebsocketHandler(websocket.WebSocketHandler):
         handler_map = {
             WebsocketMethods.READ_PROPERTY: self._handle_get_property,
             WebsocketMethods.WRITE_PROPERTY: self._handle_set_property,
+            WebsocketMethods.READ_MULTIPLE_PROPERTIES: self._handle_read_multiple_properties,
+            WebsocketMethods.READ_ALL_PROPERTIES: self._handle_read_all_properties,
+            WebsocketMethods.WRITE_MULTIPLE_PROPERTIES: self._handle_write_multiple_properties,
             WebsocketMethods.INVOKE_ACTION: self._handle_invoke_action,
             WebsocketMethods.ON_PROPERTY_CHANGE: self._handle_on_property_change,
             WebsocketMethods.ON_TD_CHANGE: self._handle_on_td_change,
@@ -7,7 +7,7 @@ Classes that represent JSON-RPC messages exchanged over WebSockets.
 
 import json
 
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 
 from wotpy.protocols.ws.enums import WebsocketErrors
 from wotpy.protocols.ws.schemas import (
@@ -18,6 +18,7 @@ from wotpy.protocols.ws.schemas import (
     JSON_RPC_VERSION,
 )
 from wotpy.utils.utils import to_json_obj
+from wotpy.utils.validators import validate
 
 
 def parse_ws_message(raw_msg):
@@ -61,16 +62,22 @@ class WebsocketMessageRequest(object):
             validate(msg, SCHEMA_REQUEST)
 
             return WebsocketMessageRequest(
-                method=msg["method"], params=msg["params"], msg_id=msg.get("id", None)
+                method=msg["method"],
+                params=msg["params"],
+                msg_id=msg.get("id", None),
+                trusted=True,
             )
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, method, params, msg_id=None):
+    def __init__(self, method, params, msg_id=None, trusted=False):
         self.method = method
         self.params = params
         self.msg_id = msg_id
 
+        if trusted:
+            return
+
         try:
             validate(self.to_dict(), SCHEMA_REQUEST)
         except ValidationError as ex:
@@ -113,15 +120,18 @@ class WebsocketMessageResponse(object):
             validate(msg, SCHEMA_RESPONSE)
 
             return WebsocketMessageResponse(
-                result=msg["result"], msg_id=msg.get("id", None)
+                result=msg["result"], msg_id=msg.get("id", None), trusted=True
             )
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, result, msg_id=None):
+    def __init__(self, result, msg_id=None, trusted=False):
         self.result = result
         self.msg_id = msg_id
 
+        if trusted:
+            return
+
         try:
             validate(self.to_dict(), SCHEMA_RESPONSE)
         except ValidationError as ex:
@@ -163,18 +173,27 @@ class WebsocketMessageError(object):
                 code=msg["error"]["code"],
                 data=msg["error"].get("data", None),
                 msg_id=msg.get("id", None),
+                trusted=True,
             )
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
     def __init__(
-        self, message, code=WebsocketErrors.INTERNAL_ERROR, data=None, msg_id=None
+        self,
+        message,
+        code=WebsocketErrors.INTERNAL_ERROR,
+        data=None,
+        msg_id=None,
+        trusted=False,
     ):
         self.message = message
         self.msg_id = msg_id
         self.code = code
         self.data = data
 
+        if trusted:
+            return
+
         try:
             validate(self.to_dict(), SCHEMA_ERROR)
         except ValidationError as ex:
@@ -216,16 +235,22 @@ class WebsocketMessageEmittedItem(object):
             validate(msg, SCHEMA_EMITTED_ITEM)
 
             return WebsocketMessageEmittedItem(
-                subscription_id=msg["subscription"], name=msg["name"], data=msg["data"]
+                subscription_id=msg["subscription"],
+                name=msg["name"],
+                data=msg["data"],
+                trusted=True,
             )
         except Exception as ex:
             raise WebsocketMessageException(str(ex))
 
-    def __init__(self, subscription_id, name, data):
+    def __init__(self, subscription_id, name, data, trusted=False):
         self.subscription_id = subscription_id
         self.name = name
         self.data = to_json_obj(data)
 
+        if trusted:
+            return
+
         try:
             validate(self.to_dict(), SCHEMA_EMITTED_ITEM)
         except ValidationError as ex:
@@ -86,6 +86,28 @@ SCHEMA_PARAMS_WRITE_PROPERTY = {
     "required": ["name", "value"],
 }
 
+SCHEMA_PARAMS_READ_MULTIPLE_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-read-multiple-properties.json",
+    "type": "object",
+    "properties": {"names": {"type": "array", "items": {"type": "string"}}},
+    "required": ["names"],
+}
+
+SCHEMA_PARAMS_READ_ALL_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-read-all-properties.json",
+    "type": "object",
+}
+
+SCHEMA_PARAMS_WRITE_MULTIPLE_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-write-multiple-properties.json",
+    "type": "object",
+    "properties": {"values": {"type": "object"}},
+    "required": ["values"],
+}
+
 SCHEMA_PARAMS_INVOKE_ACTION = {
     "$schema": "http://json-schema.org/schema#",
     "id": "http://fundacionctic.org/schemas/wotpy-ws-params-invoke-action.json",
@@ -9,7 +9,7 @@ from tornado import web
 from tornado.httpserver import HTTPServer
 
 from wotpy.codecs.enums import MediaTypes
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.protocols.ws.enums import WebsocketSchemes
 from wotpy.protocols.ws.handler import WebsocketHandler
@@ -80,6 +80,26 @@ class WebsocketServer(BaseProtocolServer):
             )
         ]
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns the WebSockets Forms to read and write
+        multiple Properties of the given Thing at once."""
+
+        base_url = self.build_base_url(hostname=hostname, thing=thing)
+
+        return [
+            Form(
+                interaction=thing,
+                protocol=self.protocol,
+                href=base_url,
+                content_type=MediaTypes.JSON,
+                op=[
+                    InteractionVerbs.READ_ALL_PROPERTIES,
+                    InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                    InteractionVerbs.WRITE_MULTIPLE_PROPERTIES,
+                ],
+            )
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -8,5 +8,7 @@ Utility functions and classes.
     :toctree: _utils
 
     wotpy.utils.enums
+    wotpy.utils.observable
     wotpy.utils.utils
+    wotpy.utils.validators
 """
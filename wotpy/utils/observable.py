@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Lightweight asyncio-native implementation of observables and subjects.
+Exposes the same subscribe(on_next, on_error, on_completed) interface as RxPY 1.x.
+"""
+
+import asyncio
+
+
+def _dispose_resource(resource):
+    """Releases a resource returned by a subscribe function
+    (a Disposable, a plain function or None)."""
+
+    if resource is None:
+        return
+
+    dispose = getattr(resource, "dispose", None)
+
+    if callable(dispose):
+        dispose()
+    elif callable(resource):
+        resource()
+
+
+def _default_on_error(err):
+    """Error callback for subscriptions without an explicit on_error."""
+
+    raise err
+
+
+def _call_soon(loop, func):
+    """Schedules the function in the given asyncio loop. Uses the
+    thread-safe method only when called from outside the loop.
+    Returns a function that cancels the call."""
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        return loop.call_soon(func).cancel
+
+    return loop.call_soon_threadsafe(func).cancel
+
+
+def _schedule(scheduler, func):
+    """Schedules the function in the given scheduler, which may be an asyncio
+    loop or an RxPY scheduler (e.g. IOLoopScheduler).
+    Returns a function that cancels the call."""
+
+    if hasattr(scheduler, "schedule"):
+        return scheduler.schedule(lambda *args: func()).dispose
+
+    return _call_soon(scheduler, func)
+
+
+class Disposable(object):
+    """Runs an action the first time it is disposed."""
+
+    __slots__ = ("_action", "_is_disposed")
+
+    def __init__(self, action=None):
+        self._action = action
+        self._is_disposed = False
+
+    @property
+    def is_disposed(self):
+        """True if this object has already been disposed."""
+
+        return self._is_disposed
+
+    def dispose(self):
+        """Runs the action of this Disposable (only once)."""
+
+        if self._is_disposed:
+            return
+
+        self._is_disposed = True
+        action, self._action = self._action, None
+
+        if action is not None:
+            action()
+
+
+class _Subscription(object):
+    """Observer that forwards the notifications to the callbacks of a subscriber.
+    It stops forwarding and releases the resources of the
+    subscription when the sequence terminates or it is disposed."""
+
+    __slots__ = ("_on_next", "_on_error", "_on_completed", "_stopped", "_resource")
+
+    def __init__(self, on_next=None, on_error=None, on_completed=None):
+        self._on_next = on_next
+        self._on_error = on_error if on_error else _default_on_error
+        self._on_completed = on_completed
+        self._stopped = False
+        self._resource = None
+
+    @property
+    def is_disposed(self):
+        """True if the subscription does not forward notifications anymore."""
+
+        return self._stopped
+
+    def set_resource(self, resource):
+        """Sets the resource that is released when the subscription ends."""
+
+        if self._stopped:
+            _dispose_resource(resource)
+        else:
+            self._resource = resource
+
+    def on_next(self, value):
+        if not self._stopped and self._on_next is not None:
+            self._on_next(value)
+
+    def on_error(self, err):
+        if self._stopped:
+            return
+
+        try:
+            self._on_error(err)
+        finally:
+            self.dispose()
+
+    def on_completed(self):
+        if self._stopped:
+            return
+
+        try:
+            if self._on_completed is not None:
+                self._on_completed()
+        finally:
+            self.dispose()
+
+    def dispose(self):
+        """Stops the subscription and releases its resources."""
+
+        self._stopped = True
+        resource, self._resource = self._resource, None
+        _dispose_resource(resource)
+
+
+class Observable(object):
+    """Push-based sequence of items.
+    The subscribe function takes an observer (an object with on_next, on_error
+    and on_completed methods) and may return a Disposable or a function
+    that will be called to release its resources on unsubscription."""
+
+    def __init__(self, subscribe=None):
+        self._subscribe_func = subscribe
+
+    def _subscribe_core(self, observer):
+        return self._subscribe_func(observer) if self._subscribe_func else None
+
+    def subscribe(self, on_next=None, on_error=None, on_completed=None, observer=None):
+        """Subscribes to this Observable with either an observer object or callbacks.
+        Returns a subscription that can be disposed to stop receiving items."""
+
+        if hasattr(on_next, "on_next") and callable(on_next.on_next):
+            observer, on_next = on_next, None
+
+        if observer is not None:
+            on_next = observer.on_next
+            on_error = observer.on_error
+            on_completed = observer.on_completed
+
+        subscription = _Subscription(on_next, on_error, on_completed)
+
+        try:
+            subscription.set_resource(self._subscribe_core(subscription))
+        except Exception as ex:
+            if subscription.is_disposed:
+                raise
+
+            subscription.on_error(ex)
+
+        return subscription
+
+    def subscribe_on(self, scheduler=None):
+        """Returns an Observable that subscribes to this one in the given
+        scheduler (an asyncio loop or an RxPY scheduler).
+        The current event loop is used by default."""
+
+        def subscribe(observer):
+            target = scheduler if scheduler else asyncio.get_event_loop()
+            state = {"disposed": False, "subscription": None}
+
+            def do_subscribe():
+                if not state["disposed"]:
+                    state["subscription"] = self.subscribe(observer)
+
+            cancel = _schedule(target, do_subscribe)
+
+            def unsubscribe():
+                state["disposed"] = True
+                cancel()
+                _dispose_resource(state["subscription"])
+
+            return unsubscribe
+
+        return Observable(subscribe)
+
+    def observe_on(self, scheduler=None):
+        """Returns an Observable that delivers the notifications of this one
+        in the given scheduler (an asyncio loop or an RxPY scheduler).
+        The current event loop is used by default."""
+
+        def subscribe(observer):
+            target = scheduler if scheduler else asyncio.get_event_loop()
+
+            def on_next(value):
+                _schedule(target, lambda: observer.on_next(value))
+
+            def on_error(err):
+                _schedule(target, lambda: observer.on_error(err))
+
+            def on_completed():
+                _schedule(target, observer.on_completed)
+
+            return self.subscribe(on_next, on_error, on_completed)
+
+        return Observable(subscribe)
+
+    @classmethod
+    def create(cls, subscribe):
+        """Builds an Observable from the given subscribe function."""
+
+        return cls(subscribe)
+
+    @classmethod
+    def of(cls, *values):
+        """Builds an Observable that emits the given values and completes."""
+
+        def subscribe(observer):
+            for value in values:
+                observer.on_next(value)
+
+            observer.on_completed()
+
+        return cls(subscribe)
+
+    @classmethod
+    def empty(cls):
+        """Builds an Observable that completes without emitting any items."""
+
+        return cls(lambda observer: observer.on_completed())
+
+    @classmethod
+    def throw(cls, error):
+        """Builds an Observable that terminates with the given error."""
+
+        return cls(lambda observer: observer.on_error(error))
+
+    @classmethod
+    def merge(cls, *observables):
+        """Builds an Observable that emits the items of all the given Observables.
+        It completes when all of them complete and fails on the first error."""
+
+        def subscribe(observer):
+            state = {"active": len(observables)}
+            subscriptions = []
+
+            def dispose_all():
+                for subscription in subscriptions:
+                    subscription.dispose()
+
+            def on_error(err):
+                dispose_all()
+                observer.on_error(err)
+
+            def on_completed():
+                state["active"] -= 1
+
+                if state["active"] == 0:
+                    observer.on_completed()
+
+            if not observables:
+                observer.on_completed()
+
+            for observable in observables:
+                subscriptions.append(
+                    observable.subscribe(observer.on_next, on_error, on_completed)
+                )
+
+            return dispose_all
+
+        return cls(subscribe)
+
+
+class Subject(Observable):
+    """Observable that is also an observer and multicasts
+    the items it receives to all its subscribers."""
+
+    def __init__(self):
+        super(Subject, self).__init__()
+        self._observers = ()
+        self._stopped = False
+        self._error = None
+
+    @property
+    def observers(self):
+        """Tuple with the observers currently subscribed to this Subject."""
+
+        return self._observers
+
+    def _subscribe_core(self, observer):
+        if self._stopped:
+            if self._error is not None:
+                observer.on_error(self._error)
+            else:
+                observer.on_completed()
+
+            return None
+
+        self._observers = self._observers + (observer,)
+
+        def unsubscribe():
+            self._observers = tuple(
+                item for item in self._observers if item is not observer
+            )
+
+        return unsubscribe
+
+    def on_next(self, value):
+        """Emits the value to all the subscribers."""
+
+        for observer in self._observers:
+            observer.on_next(value)
+
+    def on_error(self, err):
+        """Terminates the sequence of all the subscribers with the given error."""
+
+        if self._stopped:
+            return
+
+        self._stopped = True
+        self._error = err
+        observers, self._observers = self._observers, ()
+
+        for observer in observers:
+            observer.on_error(err)
+
+    def on_completed(self):
+        """Completes the sequence of all the subscribers."""
+
+        if self._stopped:
+            return
+
+        self._stopped = True
+        observers, self._observers = self._observers, ()
+
+        for observer in observers:
+            observer.on_completed()
+
+    def as_observable(self):
+        """Returns an Observable that hides the observer side of this Subject."""
+
+        return Observable(self._subscribe_core)
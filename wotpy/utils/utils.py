@@ -9,8 +9,6 @@ import json
 import socket
 from functools import wraps
 
-import tornado.gen
-
 
 def merge_args_kwargs_dict(args, kwargs):
     """Takes a tuple of args and dict of kwargs.
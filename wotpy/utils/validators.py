@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Registry of compiled JSON Schema validators.
+Building a validator (and checking the schema itself) on every validation is
+expensive, so the validators are compiled once per schema and then reused.
+The jsonschema package is imported the first time a validator is needed.
+"""
+
+_registry = {}
+_fast_validators = False
+
+
+class _FastValidator(object):
+    """Validator based on a specialized checker generated by fastjsonschema.
+    Errors are raised as jsonschema.ValidationError to keep the same interface."""
+
+    def __init__(self, schema):
+        import fastjsonschema
+
+        self._exception_class = fastjsonschema.JsonSchemaException
+        self._check = fastjsonschema.compile(schema, use_default=False)
+
+    def validate(self, instance):
+        """Raises jsonschema.ValidationError if the instance is invalid."""
+
+        try:
+            self._check(instance)
+        except self._exception_class as ex:
+            import jsonschema
+
+            raise jsonschema.ValidationError(str(ex)) from ex
+
+
+def is_fast_validators_supported():
+    """Returns True if the optional fastjsonschema dependency is installed."""
+
+    try:
+        import fastjsonschema  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+def enable_fast_validators(enabled=True):
+    """Compile the schemas into specialized checkers using fastjsonschema
+    instead of using the generic jsonschema validators."""
+
+    global _fast_validators
+
+    if enabled and not is_fast_validators_supported():
+        raise RuntimeError("Fast validators require the fastjsonschema package")
+
+    _fast_validators = enabled
+    _registry.clear()
+
+
+def get_validator(schema):
+    """Returns the compiled validator for the given schema.
+    Schemas are expected to be module-level constants, given
+    that the registry is keyed by the identity of the schema."""
+
+    entry = _registry.get(id(schema), None)
+
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+
+    if _fast_validators:
+        validator = _FastValidator(schema)
+    else:
+        import jsonschema
+
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+
+    _registry[id(schema)] = (schema, validator)
+
+    return validator
+
+
+def validate(instance, schema):
+    """Drop-in replacement for jsonschema.validate that reuses the compiled validators.
+    Raises jsonschema.ValidationError if the instance is invalid."""
+
+    get_validator(schema).validate(instance)
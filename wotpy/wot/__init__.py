@@ -11,10 +11,14 @@ Dictionaries and classes defined under the W3C WoT Scripting API specification.
     wotpy.wot.dictionaries
     wotpy.wot.discovery
     wotpy.wot.exposed
+    wotpy.wot.catalogue
+    wotpy.wot.catalogue_handlers
     wotpy.wot.constants
     wotpy.wot.enums
     wotpy.wot.events
+    wotpy.wot.executors
     wotpy.wot.form
+    wotpy.wot.form_table
     wotpy.wot.interaction
     wotpy.wot.servient
     wotpy.wot.td
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Versioned log of the changes in the TD catalogue of a servient.
+"""
+
+import asyncio
+import collections
+from asyncio import Future
+
+DEFAULT_MAX_REMOVED = 1000
+
+
+class CatalogueChangeLog(object):
+    """Keeps a monotonically increasing catalogue version and the version of the
+    last change of each Thing, so that clients can retrieve the Things that were
+    added, changed or removed since a given version.
+    The number of removed Things that are remembered is bounded, clients that request
+    changes since a version that has been pruned from the log should be reset."""
+
+    def __init__(self, max_removed=DEFAULT_MAX_REMOVED):
+        self._version = 0
+        self._floor_version = 0
+        self._max_removed = max_removed
+        self._entries = collections.OrderedDict()
+        self._removed = collections.OrderedDict()
+        self._waiters = set()
+
+    @property
+    def version(self):
+        """Current catalogue version."""
+
+        return self._version
+
+    def _is_reset(self, since):
+        """Returns True if the changes since the given version can not be retrieved
+        from this log (i.e. the client should rebuild its view of the catalogue)."""
+
+        return since < self._floor_version or since > self._version
+
+    def _update(self, thing_id, added_version):
+        """Moves the entry of the given Thing to the end of the log."""
+
+        self._entries[thing_id] = (self._version, added_version)
+        self._entries.move_to_end(thing_id)
+
+    def _prune(self):
+        """Forgets the oldest removed Things when there are too many of them."""
+
+        while len(self._removed) > self._max_removed:
+            thing_id, version = self._removed.popitem(last=False)
+            self._entries.pop(thing_id, None)
+            self._floor_version = max(self._floor_version, version)
+
+    def _is_visible(self, thing_id):
+        """Returns True if the given Thing is currently in the catalogue."""
+
+        entry = self._entries.get(thing_id, None)
+
+        return entry is not None and entry[1] is not None
+
+    def bump(self):
+        """Increments the catalogue version and wakes up the clients waiting for changes."""
+
+        self._version += 1
+
+        for future in self._waiters:
+            if not future.done():
+                future.set_result(self._version)
+
+        self._waiters.clear()
+
+        return self._version
+
+    def record_added(self, thing_id):
+        """Records that the given Thing has been added to the catalogue.
+        Adding a Thing that is already in the catalogue is recorded as a change."""
+
+        if self._is_visible(thing_id):
+            self.record_changed(thing_id)
+            return
+
+        self.bump()
+        self._removed.pop(thing_id, None)
+        self._update(thing_id, self._version)
+
+    def record_changed(self, thing_id):
+        """Records that the TD of the given Thing has changed.
+        Changes of Things that are not in the catalogue are ignored."""
+
+        if not self._is_visible(thing_id):
+            return
+
+        added_version = self._entries[thing_id][1]
+        self.bump()
+        self._update(thing_id, added_version)
+
+    def record_removed(self, thing_id):
+        """Records that the given Thing has been removed from the catalogue."""
+
+        if not self._is_visible(thing_id):
+            return
+
+        self.bump()
+        self._update(thing_id, None)
+        self._removed[thing_id] = self._version
+        self._prune()
+
+    def changes_since(self, since):
+        """Returns a dict with the current version and the IDs of the Things that
+        were added, changed or removed since the given version.
+        If the changes can not be computed the reset flag is set and
+        all the Things in the catalogue are returned as added."""
+
+        ret = {
+            "version": self._version,
+            "reset": self._is_reset(since),
+            "added": [],
+            "changed": [],
+            "removed": [],
+        }
+
+        if ret["reset"]:
+            ret["added"] = [
+                thing_id
+                for thing_id, (_, added_version) in self._entries.items()
+                if added_version is not None
+            ]
+
+            return ret
+
+        for thing_id, (version, added_version) in reversed(self._entries.items()):
+            if version <= since:
+                break
+
+            if added_version is None:
+                ret["removed"].append(thing_id)
+            elif added_version > since:
+                ret["added"].append(thing_id)
+            else:
+                ret["changed"].append(thing_id)
+
+        return ret
+
+    async def wait_for_changes(self, since, timeout):
+        """Waits until the catalogue version is greater than the
+        given version or the timeout (in seconds) expires."""
+
+        if self._version > since or self._is_reset(since):
+            return
+
+        future = Future()
+        self._waiters.add(future)
+
+        try:
+            await asyncio.wait({future}, timeout=timeout)
+        finally:
+            self._waiters.discard(future)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Request handlers of the TD catalogue server of a servient.
+"""
+
+import asyncio
+import itertools
+import json
+import urllib.parse
+
+import tornado.web
+
+
+class TDHandler(tornado.web.RequestHandler):
+    """Handler that returns the TD document of a given Thing.
+    Serves the cached serialized TD with a strong ETag and
+    returns 304 if the client already has the current version."""
+
+    def initialize(self, servient):
+        self.servient = servient
+
+    def get(self, thing_url_name):
+        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(thing_url_name)
+
+        td_entry = self.servient.get_serialized_td(exp_thing)
+
+        self.set_header("Etag", td_entry.etag)
+
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.write(td_entry.body)
+
+
+class TDCatalogueHandler(tornado.web.RequestHandler):
+    """Handler that returns the entire catalogue of Things contained in this servient.
+    May return TDs in expanded format or URL pointers to the individual TDs.
+    The catalogue may be paginated with the limit and offset query arguments."""
+
+    def initialize(self, servient):
+        self.servient = servient
+
+    def _get_int_argument(self, name):
+        """Returns the value of a non-negative integer query argument."""
+
+        val = self.get_argument(name, None)
+
+        if val is None:
+            return None
+
+        try:
+            val = int(val)
+        except ValueError:
+            raise tornado.web.HTTPError(400, "Invalid {}: {}".format(name, val))
+
+        if val < 0:
+            raise tornado.web.HTTPError(400, "Invalid {}: {}".format(name, val))
+
+        return val
+
+    def _get_page(self):
+        """Returns the list of enabled ExposedThings in the requested page.
+        Adds a Link header pointing to the next page if there is one."""
+
+        limit = self._get_int_argument("limit")
+        offset = self._get_int_argument("offset") or 0
+
+        stop = offset + limit + 1 if limit is not None else None
+
+        exp_things = list(
+            itertools.islice(self.servient.enabled_exposed_things, offset, stop)
+        )
+
+        if limit is not None and len(exp_things) > limit:
+            exp_things = exp_things[:limit]
+
+            args = {key: self.get_argument(key) for key in self.request.query_arguments}
+
+            args.update({"offset": offset + limit})
+
+            self.set_header(
+                "Link",
+                '<{}?{}>; rel="next"'.format(
+                    self.request.path, urllib.parse.urlencode(args)
+                ),
+            )
+
+        return exp_things
+
+    async def get(self):
+        exp_things = self._get_page()
+
+        if self.get_argument("expanded", False):
+            await self._get_expanded(exp_things)
+            return
+
+        response = {}
+
+        for exp_thing in exp_things:
+            response[exp_thing.thing.id] = "/{}".format(exp_thing.thing.url_name)
+
+        self.write(response)
+
+    async def _get_expanded(self, exp_things):
+        """Streams the expanded catalogue one serialized TD at a time,
+        flushing the connection between TDs to avoid buffering the entire
+        catalogue in memory and to yield control to the event loop."""
+
+        self.set_header("Etag", self.servient.get_catalogue_etag(exp_things))
+
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.write(b"{")
+
+        for idx, exp_thing in enumerate(exp_things):
+            td_entry = self.servient.get_serialized_td(exp_thing)
+            separator = b"," if idx > 0 else b""
+            self.write(separator + json.dumps(exp_thing.thing.id).encode() + b": ")
+            self.write(td_entry.body)
+            await self.flush()
+            await asyncio.sleep(0)
+
+        self.write(b"}")
+
+
+class TDCatalogueChangesHandler(tornado.web.RequestHandler):
+    """Handler that returns the Things that have been added, changed or removed
+    from the catalogue since the version given in the since query argument.
+    If a timeout (in seconds) is given and there are no changes, the request
+    is held until a change happens or the timeout expires (long-polling)."""
+
+    def initialize(self, servient):
+        self.servient = servient
+
+    def _get_number_argument(self, name, default, klass):
+        """Returns the value of a non-negative numeric query argument."""
+
+        val = self.get_argument(name, None)
+
+        if val is None:
+            return default
+
+        try:
+            val = klass(val)
+        except ValueError:
+            raise tornado.web.HTTPError(400, "Invalid {}: {}".format(name, val))
+
+        if val < 0:
+            raise tornado.web.HTTPError(400, "Invalid {}: {}".format(name, val))
+
+        return val
+
+    async def get(self):
+        since = self._get_number_argument("since", 0, int)
+        timeout = self._get_number_argument("timeout", None, float)
+
+        if timeout:
+            await self.servient.wait_catalogue_changes(since, timeout)
+
+        changes = self.servient.get_catalogue_changes(since)
+
+        def thing_paths(thing_ids):
+            return {
+                thing_id: "/{}".format(
+                    self.servient.exposed_thing_set.find_by_thing_id(
+                        thing_id
+                    ).thing.url_name
+                )
+                for thing_id in thing_ids
+            }
+
+        changes.update(
+            {
+                "added": thing_paths(changes["added"]),
+                "changed": thing_paths(changes["changed"]),
+            }
+        )
+
+        self.write(changes)
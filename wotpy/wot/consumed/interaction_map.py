@@ -7,8 +7,7 @@ Classes that represent Interaction instances accessed on a ConsumedThing.
 
 from collections import UserDict
 
-from rx.concurrency import IOLoopScheduler
-from slugify import slugify
+from wotpy.wot.enums import InteractionTypes
 
 
 class ConsumedThingInteractionDict(UserDict):
@@ -23,13 +22,8 @@ class ConsumedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next(
-            (
-                key
-                for key in self.interaction_dict.keys()
-                if slugify(key) == slugify(name)
-            ),
-            None,
+        return self._consumed_thing.td.find_interaction_name(
+            name, self.interaction_type
         )
 
     def __getitem__(self, name):
@@ -58,6 +52,12 @@ class ConsumedThingInteractionDict(UserDict):
 
         raise NotImplementedError()
 
+    @property
+    def interaction_type(self):
+        """Returns the type of the interactions contained in this dict."""
+
+        raise NotImplementedError()
+
     @property
     def thing_interaction_class(self):
         """Returns the class that implements the
@@ -74,6 +74,10 @@ class ConsumedThingPropertyDict(ConsumedThingInteractionDict):
     def interaction_dict(self):
         return self._consumed_thing.td.properties
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.PROPERTY
+
     @property
     def thing_interaction_class(self):
         return ConsumedThingProperty
@@ -87,6 +91,10 @@ class ConsumedThingActionDict(ConsumedThingInteractionDict):
     def interaction_dict(self):
         return self._consumed_thing.td.actions
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.ACTION
+
     @property
     def thing_interaction_class(self):
         return ConsumedThingAction
@@ -100,6 +108,10 @@ class ConsumedThingEventDict(ConsumedThingInteractionDict):
     def interaction_dict(self):
         return self._consumed_thing.td.events
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.EVENT
+
     @property
     def thing_interaction_class(self):
         return ConsumedThingEvent
@@ -152,7 +164,7 @@ class ConsumedThingProperty(object):
             self._name, client_kwargs=client_kwargs
         )
 
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
 
 
 class ConsumedThingAction(object):
@@ -215,4 +227,4 @@ class ConsumedThingEvent(object):
             self._name, client_kwargs=client_kwargs
         )
 
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
@@ -5,7 +5,7 @@
 Class that represents a Thing consumed by a servient.
 """
 
-from rx.concurrency import IOLoopScheduler
+import asyncio
 
 from wotpy.wot.consumed.interaction_map import (
     ConsumedThingActionDict,
@@ -21,6 +21,7 @@ class ConsumedThing(object):
     def __init__(self, servient, td):
         self._servient = servient
         self._td = td
+        self._form_table = td.form_table
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.td.id)
@@ -44,6 +45,13 @@ class ConsumedThing(object):
 
         return self._td
 
+    @property
+    def form_table(self):
+        """Returns the FormTable with the pre-resolved Forms of the TD.
+        It is built when the Thing is consumed and used by the protocol clients."""
+
+        return self._form_table
+
     async def invoke_action(
         self, name, input_value=None, timeout=None, client_kwargs=None
     ):
@@ -99,6 +107,100 @@ class ConsumedThing(object):
 
         return value
 
+    def _group_by_client(self, names):
+        """Returns a dict that maps the Protocol Binding client selected
+        for each of the given Properties to the list of their names."""
+
+        groups = {}
+
+        for name in names:
+            client = self.servient.select_client(self.td, name)
+            groups.setdefault(client, []).append(name)
+
+        return groups
+
+    async def read_multiple_properties(self, names, timeout=None, client_kwargs=None):
+        """Takes a list of Property names, then requests from the underlying platform
+        and the Protocol Bindings to retrieve the Properties on the remote Thing
+        (using a single request per protocol client if the Thing supports it).
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        names = list(names)
+
+        if not len(names):
+            return {}
+
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        results = await asyncio.gather(
+            *[
+                client.read_multiple_properties(
+                    self.td,
+                    group,
+                    timeout=timeout,
+                    **client_kwargs.get(client.protocol, {}),
+                )
+                for client, group in self._group_by_client(names).items()
+            ]
+        )
+
+        values = {}
+
+        for result in results:
+            values.update(result)
+
+        return values
+
+    async def read_all_properties(self, timeout=None, client_kwargs=None):
+        """Requests from the underlying platform and the Protocol Bindings to
+        retrieve all the Properties on the remote Thing (using a single request
+        if the Thing supports it).
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        names = list(self.td.properties.keys())
+
+        if not len(names):
+            return {}
+
+        groups = self._group_by_client(names)
+
+        if len(groups) > 1:
+            return await self.read_multiple_properties(
+                names, timeout=timeout, client_kwargs=client_kwargs
+            )
+
+        client = next(iter(groups))
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        values = await client.read_all_properties(
+            self.td, timeout=timeout, **client_kwargs.get(client.protocol, {})
+        )
+
+        return values
+
+    async def write_multiple_properties(self, values, timeout=None, client_kwargs=None):
+        """Takes a dict of Property names to values, then requests from the underlying
+        platform and the Protocol Bindings to update the Properties on the remote Thing
+        (using a single request per protocol client if the Thing supports it).
+        Returns a Future that resolves on success or rejects with an Error."""
+
+        if not len(values):
+            return
+
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        await asyncio.gather(
+            *[
+                client.write_multiple_properties(
+                    self.td,
+                    {name: values[name] for name in group},
+                    timeout=timeout,
+                    **client_kwargs.get(client.protocol, {}),
+                )
+                for client, group in self._group_by_client(values).items()
+            ]
+        )
+
     def on_event(self, name, client_kwargs=None):
         """Returns an Observable for the Event specified in the name argument,
         allowing subscribing to and unsubscribing from notifications."""
@@ -153,4 +255,4 @@ class ConsumedThing(object):
         """Subscribes to changes on the TD of this thing."""
 
         observable = self.on_td_change()
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
@@ -8,10 +8,76 @@ Base class for WoT dictionaries.
 from wotpy.utils.utils import merge_args_kwargs_dict, to_camel, to_snake
 
 
-class WotBaseDict(object):
+def _is_list_wot_dicts(x):
+    return isinstance(x, list) and len(x) and hasattr(x[0], "to_dict")
+
+
+def _is_dict_wot_dicts(x):
+    return isinstance(x, dict) and len(x) and hasattr(next(iter(x.values())), "to_dict")
+
+
+def _is_wot_dict(x):
+    return hasattr(x, "to_dict")
+
+
+def _serialize_value(val):
+    """Returns the JSON-serializable version of a WoT dictionary field value."""
+
+    if _is_list_wot_dicts(val):
+        return [item.to_dict() for item in val]
+    elif _is_dict_wot_dicts(val):
+        return {key: item.to_dict() for key, item in val.items()}
+    elif _is_wot_dict(val):
+        return val.to_dict()
+
+    return val
+
+
+class WotDictMeta(type):
+    """Metaclass for WoT dictionaries.
+    Adds an empty __slots__ declaration to classes that do not define their own
+    (to avoid allocating a per-instance __dict__) and precomputes the field
+    metadata that is derived from the Meta inner class."""
+
+    def __new__(mcs, name, bases, namespace):
+        namespace.setdefault("__slots__", ())
+        cls = super(WotDictMeta, mcs).__new__(mcs, name, bases, namespace)
+
+        meta = cls.Meta
+        fields = frozenset(getattr(meta, "fields", set()))
+
+        cls._fields = fields
+        cls._required_fields = frozenset(getattr(meta, "required", set()))
+        cls._field_defaults = dict(getattr(meta, "defaults", None) or {})
+
+        cls._attr_fields = {}
+
+        for field in fields:
+            cls._attr_fields[field] = field
+            cls._attr_fields[to_snake(field)] = field
+
+        # Fields with a class-level attribute (i.e. a property) that overrides
+        # the plain lookup in the internal dict need to be resolved with getattr
+
+        cls._computed_fields = tuple(
+            (field, to_snake(field))
+            for field in fields
+            if hasattr(cls, to_snake(field))
+        )
+
+        cls._plain_fields = fields.difference(
+            field for field, _ in cls._computed_fields
+        )
+
+        return cls
+
+
+class WotBaseDict(object, metaclass=WotDictMeta):
     """Base class for all WoT data types represented
     as dictionaries in the Scripting API specification."""
 
+    __slots__ = ("_init",)
+
     class Meta:
         fields = set()
         required = set()
@@ -23,72 +89,59 @@ class WotBaseDict(object):
 
         init_dict = merge_args_kwargs_dict(args, kwargs)
 
-        self._init = {}
+        self._init = {to_camel(key): val for key, val in init_dict.items()}
 
-        for key, val in init_dict.items():
-            self._init.update({to_camel(key): val})
+        for field in self._required_fields:
+            if field not in self._init:
+                raise ValueError("Missing required field: {}".format(field))
+
+    @classmethod
+    def _field_name(cls, name):
+        """Returns the camelCase field name for the given attribute name
+        (or None if the attribute does not map to any field)."""
 
         try:
-            required = self.Meta.required
-        except AttributeError:
-            required = []
+            return cls._attr_fields[name]
+        except KeyError:
+            pass
 
-        for field in required:
-            if field not in self._init:
-                raise ValueError("Missing required field: {}".format(field))
+        name_camel = to_camel(name)
+        name_camel = name_camel if name_camel in cls._fields else None
+        cls._attr_fields[name] = name_camel
+
+        return name_camel
 
     def __getattr__(self, name):
         """Transforms the field name to camelCase and
         attemps to retrieve it from the internal dict."""
 
-        name_camel = to_camel(name)
+        name_camel = self._field_name(name)
 
-        if name_camel not in self.Meta.fields:
+        if name_camel is None:
             raise AttributeError(name)
 
-        if name_camel in self._init:
-            return self._init[name_camel]
-
         try:
-            return self.Meta.defaults.get(name_camel, None)
-        except AttributeError:
-            return None
+            return self._init[name_camel]
+        except KeyError:
+            return self._field_defaults.get(name_camel, None)
 
     def to_dict(self):
         """Returns the pure dict (JSON-serializable) representation of this WoT dictionary."""
 
         ret = {}
+        init = self._init
+        plain_fields = self._plain_fields
+
+        for name_camel, val in init.items():
+            if name_camel in plain_fields:
+                ret[name_camel] = _serialize_value(val)
+
+        for name_camel, name_snake in self._computed_fields:
+            val = getattr(self, name_snake)
+
+            if val is None and name_camel not in init:
+                continue
 
-        def is_list_wot_dicts(x):
-            return isinstance(x, list) and len(x) and hasattr(x[0], "to_dict")
-
-        def is_dict_wot_dicts(x):
-            return (
-                isinstance(x, dict)
-                and len(x)
-                and hasattr(next(iter(x.values())), "to_dict")
-            )
-
-        def is_wot_dict(x):
-            return hasattr(x, "to_dict")
-
-        existing_fields = [
-            f
-            for f in self.Meta.fields
-            if f in self._init
-            or (to_snake(f) in dir(self) and getattr(self, to_snake(f)) is not None)
-        ]
-
-        for name_camel in existing_fields:
-            field_val = getattr(self, to_snake(name_camel))
-
-            if is_list_wot_dicts(field_val):
-                field_val = [item.to_dict() for item in field_val]
-            elif is_dict_wot_dicts(field_val):
-                field_val = {key: val.to_dict() for key, val in field_val.items()}
-            elif is_wot_dict(field_val):
-                field_val = field_val.to_dict()
-
-            ret.update({name_camel: field_val})
+            ret[name_camel] = _serialize_value(val)
 
         return ret
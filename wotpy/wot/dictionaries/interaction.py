@@ -52,6 +52,8 @@ class InteractionFragmentDict(WotBaseDict):
 class PropertyFragmentDict(InteractionFragmentDict):
     """A dictionary wrapper class that contains data to initialize a Property."""
 
+    __slots__ = ("_data_schema",)
+
     class Meta:
         fields = InteractionFragmentDict.Meta.fields.union({"observable"})
 
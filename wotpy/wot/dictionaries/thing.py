@@ -5,14 +5,13 @@
 Wrapper class for dictionaries to represent Things.
 """
 
-from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.base import WotBaseDict
 from wotpy.wot.dictionaries.interaction import (
     ActionFragmentDict,
     EventFragmentDict,
     PropertyFragmentDict,
 )
-from wotpy.wot.dictionaries.link import LinkDict
+from wotpy.wot.dictionaries.link import FormDict, LinkDict
 from wotpy.wot.dictionaries.security import SecuritySchemeDict
 from wotpy.wot.dictionaries.version import VersioningDict
 from wotpy.wot.enums import SecuritySchemeType
@@ -38,6 +37,7 @@ class ThingFragment(WotBaseDict):
             "actions",
             "events",
             "links",
+            "forms",
             "security",
             "securityDefinitions",
         }
@@ -57,7 +57,7 @@ class ThingFragment(WotBaseDict):
 
         fields_dict = ["properties", "actions", "events", "securityDefinitions"]
 
-        fields_list = ["links", "security"]
+        fields_list = ["links", "forms", "security"]
 
         fields_instance = ["version"]
 
@@ -76,9 +76,9 @@ class ThingFragment(WotBaseDict):
         """Checks to see if the attribute that is being set is a
         Thing fragment property and updates the internal dict."""
 
-        name_camel = to_camel(name)
+        name_camel = self._field_name(name)
 
-        if name_camel not in self.Meta.fields:
+        if name_camel is None:
             return super(ThingFragment, self).__setattr__(name, value)
 
         if name_camel in self.Meta.fields_readonly:
@@ -169,6 +169,16 @@ class ThingFragment(WotBaseDict):
 
         return [LinkDict(item) for item in self._init.get("links", [])]
 
+    @property
+    def forms(self):
+        """The forms optional attribute represents an array of Form objects
+        for the operations that apply to the entire Thing (e.g. readallproperties)."""
+
+        if "forms" not in self._init:
+            return None
+
+        return [FormDict(item) for item in self._init.get("forms")]
+
     @property
     def version(self):
         """Provides version information."""
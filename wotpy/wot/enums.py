@@ -77,3 +77,21 @@ class InteractionTypes(EnumListMixin):
     PROPERTY = "Property"
     ACTION = "Action"
     EVENT = "Event"
+
+
+class HandlerExecutionMode(EnumListMixin):
+    """Enumeration of the modes in which the
+    handlers of an ExposedThing may be executed."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class OverflowPolicy(EnumListMixin):
+    """Enumeration of the policies that define what happens to the Action
+    invocations that arrive when the maximum concurrency has been reached."""
+
+    REJECT = "reject"
+    QUEUE = "queue"
+    DROP_OLDEST = "drop_oldest"
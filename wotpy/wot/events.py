@@ -89,6 +89,10 @@ class ActionInvocationEventInit(object):
 class ThingDescriptionChangeEventInit(object):
     """Represents the data contained in a thing description update event.
 
+    Changes that coalesce multiple updates (see :py:meth:`.ExposedThing.batch_update`)
+    use the ``change`` method, with no type nor name and a list of the individual
+    changes (dicts with the same keys as these args) in ``data``.
+
     Args:
         td_change_type (str): An item of enumeration :py:class:`.TDChangeType`.
         method (str): An item of enumeration :py:class:`.TDChangeMethod`.
@@ -99,7 +103,7 @@ class ThingDescriptionChangeEventInit(object):
     """
 
     def __init__(self, td_change_type, method, name, data=None, description=None):
-        assert td_change_type in TDChangeType.list()
+        assert td_change_type is None or td_change_type in TDChangeType.list()
         assert method in TDChangeMethod.list()
 
         self.td_change_type = td_change_type
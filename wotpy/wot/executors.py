@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Executors managed by a servient to run the handlers of its ExposedThings.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import time
+
+from wotpy.wot.enums import HandlerExecutionMode
+
+
+class HandlerLatencyMetrics(object):
+    """Latency metrics of the handlers executed in a given mode.
+    The latency includes the time spent waiting for a free worker."""
+
+    __slots__ = ("count", "errors", "total_secs", "max_secs")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_secs = 0.0
+        self.max_secs = 0.0
+
+    def record(self, elapsed, error=False):
+        """Records the latency of a handler execution."""
+
+        self.count += 1
+        self.errors += 1 if error else 0
+        self.total_secs += elapsed
+        self.max_secs = max(self.max_secs, elapsed)
+
+    def to_dict(self):
+        """Returns the metrics as a dict."""
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": 1e3 * self.total_secs / self.count if self.count else 0.0,
+            "max_ms": 1e3 * self.max_secs,
+        }
+
+
+class HandlerExecutors(object):
+    """Runs handlers inline in the event loop, in a pool of threads or in a pool
+    of processes. The pools are created on first use and destroyed on shutdown.
+    Handlers that run in the pools should be plain (blocking) functions, handlers
+    run in process pools must be picklable (e.g. functions defined at module level)."""
+
+    def __init__(self, thread_workers=None, process_workers=None):
+        self._thread_workers = thread_workers
+        self._process_workers = process_workers
+        self._thread_executor = None
+        self._process_executor = None
+        self._metrics = {
+            mode: HandlerLatencyMetrics() for mode in HandlerExecutionMode.list()
+        }
+
+    @property
+    def thread_workers(self):
+        """Maximum number of threads of the thread pool (None for the default)."""
+
+        return self._thread_workers
+
+    @property
+    def process_workers(self):
+        """Maximum number of processes of the process pool (None for the default)."""
+
+        return self._process_workers
+
+    def get_executor(self, mode):
+        """Returns the executor for the given mode (None for inline execution)."""
+
+        if mode == HandlerExecutionMode.INLINE:
+            return None
+
+        if mode == HandlerExecutionMode.THREAD:
+            if self._thread_executor is None:
+                self._thread_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._thread_workers
+                )
+
+            return self._thread_executor
+
+        if mode == HandlerExecutionMode.PROCESS:
+            if self._process_executor is None:
+                self._process_executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._process_workers
+                )
+
+            return self._process_executor
+
+        raise ValueError("Unknown execution mode: {}".format(mode))
+
+    async def run(self, mode, handler, *args):
+        """Runs the handler with the given arguments in the given mode
+        and returns the result. Handlers run inline may return awaitables."""
+
+        executor = self.get_executor(mode)
+        time_start = time.perf_counter()
+        error = False
+
+        try:
+            if executor is None:
+                result = handler(*args)
+
+                if isinstance(result, concurrent.futures.Future):
+                    result = await asyncio.wrap_future(result)
+                elif inspect.isawaitable(result):
+                    result = await result
+            else:
+                loop = asyncio.get_event_loop()
+                result = await loop.run_in_executor(executor, handler, *args)
+
+            return result
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._metrics[mode].record(time.perf_counter() - time_start, error=error)
+
+    def wrap(self, mode, handler):
+        """Returns a coroutine function that runs the handler in the given mode."""
+
+        if mode not in HandlerExecutionMode.list():
+            raise ValueError("Unknown execution mode: {}".format(mode))
+
+        async def wrapper(*args):
+            return await self.run(mode, handler, *args)
+
+        return wrapper
+
+    def metrics(self):
+        """Returns a dict with the latency metrics for each execution mode."""
+
+        return {mode: metrics.to_dict() for mode, metrics in self._metrics.items()}
+
+    def shutdown(self, wait=True):
+        """Shuts down the executor pools.
+        New pools are created if handlers are executed again."""
+
+        if self._thread_executor is not None:
+            self._thread_executor.shutdown(wait=wait)
+            self._thread_executor = None
+
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=wait)
+            self._process_executor = None
@@ -7,7 +7,13 @@ ExposedThing and related entities.
 .. autosummary::
     :toctree: _exposed
 
+    wotpy.wot.exposed.admission
+    wotpy.wot.exposed.cache
+    wotpy.wot.exposed.dispatcher
+    wotpy.wot.exposed.history
     wotpy.wot.exposed.interaction_map
+    wotpy.wot.exposed.notification
+    wotpy.wot.exposed.store
     wotpy.wot.exposed.thing
     wotpy.wot.exposed.thing_set
 """
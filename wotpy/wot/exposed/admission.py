@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Admission control for the Action invocations of ExposedThings.
+"""
+
+import asyncio
+import collections
+
+from wotpy.wot.enums import OverflowPolicy
+
+
+class AdmissionRejectedError(Exception):
+    """Exception raised when an Action invocation is not admitted."""
+
+    pass
+
+
+class AdmissionDroppedError(AdmissionRejectedError):
+    """Exception raised when a queued Action invocation is dropped
+    to make room for a newer invocation."""
+
+    pass
+
+
+class AdmissionPolicy(object):
+    """Limits the number of Action invocations that run at the same time.
+    When max_concurrency is reached new invocations are rejected (reject policy),
+    queued until there are at most max_queue waiting invocations (queue policy)
+    or queued dropping the oldest waiting invocation when the queue is full
+    (drop-oldest policy). A max_queue of None means that the queue is unbounded."""
+
+    def __init__(
+        self, max_concurrency=None, max_queue=None, overflow=OverflowPolicy.QUEUE
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Invalid max concurrency: {}".format(max_concurrency))
+
+        if max_queue is not None and max_queue < 0:
+            raise ValueError("Invalid max queue: {}".format(max_queue))
+
+        if overflow not in OverflowPolicy.list():
+            raise ValueError("Unknown overflow policy: {}".format(overflow))
+
+        self._max_concurrency = max_concurrency
+        self._max_queue = max_queue
+        self._overflow = overflow
+
+    @property
+    def max_concurrency(self):
+        """Maximum number of invocations running at the same time (None if unlimited)."""
+
+        return self._max_concurrency
+
+    @property
+    def max_queue(self):
+        """Maximum number of invocations waiting to run (None if unbounded)."""
+
+        return self._max_queue
+
+    @property
+    def overflow(self):
+        """Overflow policy (a member of the OverflowPolicy enum)."""
+
+        return self._overflow
+
+
+class AdmissionController(object):
+    """Grants the slots to run Action invocations according to an AdmissionPolicy.
+    Invocations are admitted in arrival order."""
+
+    def __init__(self, policy):
+        self._policy = policy
+        self._running = 0
+        self._waiters = collections.deque()
+        self._max_queue_depth = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._dropped = 0
+
+    @property
+    def policy(self):
+        """The AdmissionPolicy of this controller."""
+
+        return self._policy
+
+    @property
+    def queue_depth(self):
+        """Number of invocations waiting to run."""
+
+        return len(self._waiters)
+
+    def _is_full(self):
+        """Returns True if the maximum concurrency has been reached."""
+
+        max_concurrency = self._policy.max_concurrency
+
+        return max_concurrency is not None and self._running >= max_concurrency
+
+    def acquire(self):
+        """Requests a slot to run an invocation. Returns a Future that resolves when
+        the slot is granted. Raises AdmissionRejectedError if the invocation is rejected.
+        Each granted slot must be freed with release()."""
+
+        future = asyncio.get_event_loop().create_future()
+
+        if not self._is_full():
+            self._running += 1
+            self._admitted += 1
+            future.set_result(None)
+            return future
+
+        overflow = self._policy.overflow
+        max_queue = self._policy.max_queue
+
+        if overflow == OverflowPolicy.REJECT or max_queue == 0:
+            self._rejected += 1
+            raise AdmissionRejectedError("Maximum concurrency reached")
+
+        if max_queue is not None and len(self._waiters) >= max_queue:
+            if overflow == OverflowPolicy.QUEUE:
+                self._rejected += 1
+                raise AdmissionRejectedError("Invocation queue is full")
+
+            oldest = self._waiters.popleft()
+            self._dropped += 1
+            oldest.set_exception(AdmissionDroppedError("Dropped from invocation queue"))
+
+        self._waiters.append(future)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+
+        return future
+
+    def release(self):
+        """Frees a slot, which is granted to the oldest waiting invocation."""
+
+        while len(self._waiters):
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                self._admitted += 1
+                waiter.set_result(None)
+                return
+
+        self._running -= 1
+
+    def abandon(self, future):
+        """Gives up the slot requested with the given Future,
+        whether it has already been granted or not."""
+
+        if future in self._waiters:
+            self._waiters.remove(future)
+            future.cancel()
+        elif future.done() and not future.cancelled() and future.exception() is None:
+            self.release()
+
+    def metrics(self):
+        """Returns a dict with the current state and counters of this controller."""
+
+        return {
+            "running": self._running,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self._max_queue_depth,
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "dropped": self._dropped,
+        }
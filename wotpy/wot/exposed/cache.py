@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cache for the values returned by custom Property read handlers.
+"""
+
+import asyncio
+import logging
+import time
+
+
+class PropertyCachePolicy(object):
+    """Cache policy for the values returned by the read handler of a Property.
+    Values are fresh for max_age seconds and may be served stale for
+    stale_while_revalidate more seconds while they are refreshed in the background.
+    With single_flight enabled concurrent reads share the same handler invocation."""
+
+    def __init__(self, max_age, stale_while_revalidate=0, single_flight=True):
+        if max_age is None or max_age < 0:
+            raise ValueError("Invalid max-age: {}".format(max_age))
+
+        if stale_while_revalidate is None or stale_while_revalidate < 0:
+            raise ValueError(
+                "Invalid stale-while-revalidate: {}".format(stale_while_revalidate)
+            )
+
+        self._max_age = max_age
+        self._stale_while_revalidate = stale_while_revalidate
+        self._single_flight = single_flight
+
+    @property
+    def max_age(self):
+        """Seconds during which a cached value is considered fresh."""
+
+        return self._max_age
+
+    @property
+    def stale_while_revalidate(self):
+        """Seconds after max-age during which a stale value is
+        returned while a refresh is run in the background."""
+
+        return self._stale_while_revalidate
+
+    @property
+    def single_flight(self):
+        """True if concurrent reads should share the same handler invocation."""
+
+        return self._single_flight
+
+
+class PropertyReadCache(object):
+    """Caches the value of a Property according to a PropertyCachePolicy."""
+
+    def __init__(self, policy):
+        self._policy = policy
+        self._value = None
+        self._time = None
+        self._inflight = None
+        self._generation = 0
+        self._logr = logging.getLogger(__name__)
+
+    @property
+    def policy(self):
+        """The PropertyCachePolicy of this cache."""
+
+        return self._policy
+
+    @property
+    def age(self):
+        """Seconds since the cached value was retrieved (None if there is no value)."""
+
+        return None if self._time is None else time.monotonic() - self._time
+
+    def remaining_max_age(self):
+        """Returns the number of seconds during which the
+        current value will still be fresh (zero if it is not)."""
+
+        age = self.age
+
+        if age is None:
+            return 0
+
+        return max(0, int(self._policy.max_age - age))
+
+    def invalidate(self):
+        """Drops the cached value. The values retrieved by
+        the refreshes that are in progress are discarded."""
+
+        self._value = None
+        self._time = None
+        self._inflight = None
+        self._generation += 1
+
+    async def _fetch(self, handler):
+        """Invokes the read handler and updates the cached value."""
+
+        generation = self._generation
+        value = await handler()
+
+        if generation == self._generation:
+            self._value = value
+            self._time = time.monotonic()
+
+        return value
+
+    def _refresh(self, handler):
+        """Returns the Future of the current refresh, starting it if necessary."""
+
+        if self._inflight is not None and self._policy.single_flight:
+            return self._inflight
+
+        future = asyncio.ensure_future(self._fetch(handler))
+
+        def clear_inflight(fut):
+            if self._inflight is fut:
+                self._inflight = None
+
+        future.add_done_callback(clear_inflight)
+        self._inflight = future
+
+        return future
+
+    def _revalidate(self, handler):
+        """Refreshes the value in the background and logs eventual errors."""
+
+        def log_error(fut):
+            if not fut.cancelled() and fut.exception() is not None:
+                self._logr.warning(
+                    "Error revalidating value: {}".format(fut.exception())
+                )
+
+        self._refresh(handler).add_done_callback(log_error)
+
+    async def read(self, handler):
+        """Returns the cached value if it is fresh or the stale value if it
+        can still be revalidated in the background. Otherwise invokes the
+        read handler (or waits for the ongoing invocation) to get the value."""
+
+        age = self.age
+
+        if age is not None and age < self._policy.max_age:
+            return self._value
+
+        if (
+            age is not None
+            and age < self._policy.max_age + self._policy.stale_while_revalidate
+        ):
+            self._revalidate(handler)
+            return self._value
+
+        if not self._policy.single_flight:
+            return await self._fetch(handler)
+
+        return await asyncio.shield(self._refresh(handler))
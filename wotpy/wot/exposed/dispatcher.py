@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Class that dispatches the events emitted by an ExposedThing to the interested subscribers.
+"""
+
+from wotpy.utils.observable import Subject
+
+
+class EventDispatcher(object):
+    """Routes emitted events to one Subject per topic.
+    A topic is a (event kind, interaction name) tuple, so that an emission
+    only reaches the observers that subscribed to that specific topic."""
+
+    def __init__(self):
+        self._subjects = {}
+
+    def _get_subject(self, topic):
+        """Returns the Subject for the given topic, creating it if necessary."""
+
+        subject = self._subjects.get(topic, None)
+
+        if subject is None:
+            subject = Subject()
+            self._subjects[topic] = subject
+
+        return subject
+
+    def observable(self, topic):
+        """Returns an Observable for the events emitted on the given topic."""
+
+        return self._get_subject(topic).as_observable()
+
+    def has_observers(self, topic):
+        """Returns True if there is at least one observer subscribed to the given topic."""
+
+        subject = self._subjects.get(topic, None)
+
+        return subject is not None and len(subject.observers) > 0
+
+    def emit(self, topic, event):
+        """Pushes the event to the observers of the given topic."""
+
+        subject = self._subjects.get(topic, None)
+
+        if subject is None:
+            return
+
+        subject.on_next(event)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Bounded history of the values of the Properties of ExposedThings.
+"""
+
+import array
+import time
+
+from wotpy.wot.exposed.store import _TYPECODES
+
+
+class PropertyHistory(object):
+    """Fixed-size ring buffer that contains the latest values of a Property
+    and the times (seconds since the epoch) when they were written.
+    Values of the type that corresponds to the data type of the Property are stored
+    unboxed in an array, other values (e.g. None) are kept in an overflow dict."""
+
+    def __init__(self, max_length, data_type=None):
+        if max_length is None or max_length < 1:
+            raise ValueError("Invalid history length: {}".format(max_length))
+
+        typecode, self._value_type = _TYPECODES.get(data_type, (None, None))
+
+        self._max_length = max_length
+        self._times = array.array("d", bytes(max_length * 8))
+        self._values = array.array(typecode) if typecode else [None] * max_length
+        self._overflow = {}
+        self._start = 0
+        self._size = 0
+
+        if typecode:
+            self._values.frombytes(bytes(max_length * self._values.itemsize))
+
+    @property
+    def max_length(self):
+        """Maximum number of values kept in the history."""
+
+        return self._max_length
+
+    def __len__(self):
+        return self._size
+
+    def _index(self, pos):
+        """Returns the buffer index of the given position (0 is the oldest value)."""
+
+        return (self._start + pos) % self._max_length
+
+    def _get(self, idx):
+        """Returns the value stored in the given buffer index."""
+
+        if self._overflow and idx in self._overflow:
+            return self._overflow[idx]
+
+        value = self._values[idx]
+
+        return bool(value) if self._value_type is bool else value
+
+    def _put(self, idx, value):
+        """Stores the value in the given buffer index."""
+
+        self._overflow.pop(idx, None)
+
+        if self._value_type is None:
+            self._values[idx] = value
+            return
+
+        if type(value) is self._value_type:
+            try:
+                self._values[idx] = value
+                return
+            except OverflowError:
+                pass
+
+        self._overflow[idx] = value
+
+    def append(self, value, timestamp=None):
+        """Adds a value to the history, discarding the oldest value if it is full."""
+
+        timestamp = time.time() if timestamp is None else timestamp
+
+        if self._size < self._max_length:
+            idx = self._index(self._size)
+            self._size += 1
+        else:
+            idx = self._start
+            self._start = self._index(1)
+
+        self._times[idx] = timestamp
+        self._put(idx, value)
+
+    def clear(self):
+        """Removes all the values from the history."""
+
+        self._overflow.clear()
+        self._start = 0
+        self._size = 0
+
+        if self._value_type is None:
+            self._values = [None] * self._max_length
+
+    def query(self, since=None, until=None, limit=None):
+        """Returns a list of (timestamp, value) tuples sorted from oldest to newest
+        that contains the values written in the [since, until] time range.
+        If limit is defined only the latest limit values of the range are returned."""
+
+        if limit is not None and limit < 0:
+            raise ValueError("Invalid limit: {}".format(limit))
+
+        items = []
+
+        for pos in range(self._size - 1, -1, -1):
+            if limit is not None and len(items) >= limit:
+                break
+
+            idx = self._index(pos)
+            timestamp = self._times[idx]
+
+            if since is not None and timestamp < since:
+                break
+
+            if until is not None and timestamp > until:
+                continue
+
+            items.append((timestamp, self._get(idx)))
+
+        items.reverse()
+
+        return items
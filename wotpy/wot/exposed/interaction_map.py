@@ -7,9 +7,6 @@ Classes that represent Interaction instances accessed on a ExposedThing.
 
 from collections import UserDict
 
-from rx.concurrency import IOLoopScheduler
-from slugify import slugify
-
 
 class ExposedThingInteractionDict(UserDict):
     """A dictionary that provides lazy access to the objects that implement
@@ -23,14 +20,12 @@ class ExposedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next(
-            (
-                key
-                for key in self.interaction_dict.keys()
-                if slugify(key) == slugify(name)
-            ),
-            None,
-        )
+        interaction = self._exposed_thing.thing.find_normalized_interaction(name)
+
+        if interaction is None or interaction.name not in self.interaction_dict:
+            return None
+
+        return interaction.name
 
     def __getitem__(self, name):
         """Lazily build and return an object that implements the Interaction interface."""
@@ -129,6 +124,25 @@ class ExposedThingProperty(object):
         value = await self._exposed_thing.read_property(self._name)
         return value
 
+    def get_cache_policy(self):
+        """Returns the PropertyCachePolicy of this Property (None if undefined)."""
+
+        return self._exposed_thing.get_property_cache_policy(self._name)
+
+    def get_max_age(self):
+        """Returns the number of seconds during which the cached value of
+        this Property will still be fresh (None if the Property is not cached)."""
+
+        return self._exposed_thing.get_property_max_age(self._name)
+
+    def get_history(self, since=None, until=None, limit=None):
+        """Returns the recent values of this Property
+        as a list of (timestamp, value) tuples."""
+
+        return self._exposed_thing.get_property_history(
+            self._name, since=since, until=until, limit=limit
+        )
+
     async def write(self, value):
         """The set() method will attempt to set the value of the
         Property specified in the value argument whose type SHOULD
@@ -141,7 +155,7 @@ class ExposedThingProperty(object):
         """Subscribe to an stream of events emitted when the property value changes."""
 
         observable = self._exposed_thing.on_property_change(self._name)
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
 
 
 class ExposedThingAction(object):
@@ -170,6 +184,14 @@ class ExposedThingAction(object):
         result = await self._exposed_thing.invoke_action(self._name, input_value)
         return result
 
+    def try_invoke(self, *args):
+        """Starts the Action interaction like invoke() but decides the admission
+        synchronously (raising AdmissionRejectedError if it is rejected).
+        Returns a Future that resolves with the invocation result."""
+
+        input_value = args[0] if len(args) else None
+        return self._exposed_thing.try_invoke_action(self._name, input_value)
+
 
 class ExposedThingEvent(object):
     """The ThingEvent interface implementation for ExposedThing objects."""
@@ -193,7 +215,7 @@ class ExposedThingEvent(object):
         """Subscribe to an stream of emissions of this event."""
 
         observable = self._exposed_thing.on_event(self._name)
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
 
     def emit(self, payload):
         """Emits an event that carries data specified by the payload argument."""
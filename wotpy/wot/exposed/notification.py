@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Policies to throttle the Property change notifications of ExposedThings.
+"""
+
+import asyncio
+import numbers
+
+
+class NotificationPolicy(object):
+    """Defines which Property changes are notified to the subscribers.
+    Notifications are sent at most once every min_interval seconds
+    (when coalesce is enabled the latest suppressed value is sent when the
+    interval expires), the latest value is sent again if there has not been
+    any notification in max_interval seconds (heartbeat) and numeric values
+    are only notified if they differ from the last notified value by at
+    least the deadband."""
+
+    def __init__(
+        self, min_interval=None, max_interval=None, deadband=None, coalesce=True
+    ):
+        for name, value in [
+            ("min interval", min_interval),
+            ("max interval", max_interval),
+            ("deadband", deadband),
+        ]:
+            if value is not None and value < 0:
+                raise ValueError("Invalid {}: {}".format(name, value))
+
+        if max_interval is not None and max_interval <= 0:
+            raise ValueError("Invalid max interval: {}".format(max_interval))
+
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._deadband = deadband
+        self._coalesce = coalesce
+
+    @property
+    def min_interval(self):
+        """Minimum number of seconds between notifications (None if unlimited)."""
+
+        return self._min_interval
+
+    @property
+    def max_interval(self):
+        """Maximum number of seconds without notifications (None to disable the heartbeat)."""
+
+        return self._max_interval
+
+    @property
+    def deadband(self):
+        """Minimum change of numeric values that is notified (None to notify all changes)."""
+
+        return self._deadband
+
+    @property
+    def coalesce(self):
+        """True if the latest value suppressed by the minimum
+        interval should be notified when the interval expires."""
+
+        return self._coalesce
+
+
+def value_fingerprint(value):
+    """Returns a structural fingerprint of a Property value that can be compared
+    with == to detect changes. Nested objects are reduced to immutable tuples and
+    frozensets of their contents, so that they can be compared without keeping a
+    copy and in-place modifications of the same object are also detected."""
+
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset((key, value_fingerprint(item)) for key, item in value.items()),
+        )
+
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(value_fingerprint(item) for item in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+
+    return type(value), value
+
+
+def _is_number(value):
+    """Returns True if the value is a number (excluding booleans)."""
+
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+class PropertyNotifier(object):
+    """Applies a NotificationPolicy to the changes of a Property
+    and calls the emit function for those that should be notified."""
+
+    def __init__(self, policy, emit):
+        self._policy = policy
+        self._emit_func = emit
+        self._latest = None
+        self._pending = False
+        self._last_value = None
+        self._last_time = None
+        self._handle_trailing = None
+        self._handle_heartbeat = None
+
+    @property
+    def policy(self):
+        """The NotificationPolicy of this notifier."""
+
+        return self._policy
+
+    def _in_deadband(self, value):
+        """Returns True if the change from the last notified value is below the deadband."""
+
+        deadband = self._policy.deadband
+
+        return (
+            deadband is not None
+            and self._last_time is not None
+            and _is_number(value)
+            and _is_number(self._last_value)
+            and abs(value - self._last_value) < deadband
+        )
+
+    def _emit(self, value):
+        """Notifies the value and schedules the next heartbeat."""
+
+        loop = asyncio.get_event_loop()
+
+        self._pending = False
+        self._last_value = value
+        self._last_time = loop.time()
+
+        if self._handle_trailing is not None:
+            self._handle_trailing.cancel()
+            self._handle_trailing = None
+
+        if self._handle_heartbeat is not None:
+            self._handle_heartbeat.cancel()
+            self._handle_heartbeat = None
+
+        if self._policy.max_interval is not None:
+            self._handle_heartbeat = loop.call_later(
+                self._policy.max_interval, self._on_heartbeat
+            )
+
+        self._emit_func(value)
+
+    def _on_trailing(self):
+        """Notifies the latest value at the end of the minimum interval."""
+
+        self._handle_trailing = None
+
+        if self._pending:
+            self._emit(self._latest)
+
+    def _on_heartbeat(self):
+        """Notifies the latest value when the maximum interval expires."""
+
+        self._handle_heartbeat = None
+        self._emit(self._latest)
+
+    def push(self, value):
+        """Takes a new Property value and notifies it if allowed by the policy."""
+
+        self._latest = value
+
+        if self._in_deadband(value):
+            self._pending = False
+            return
+
+        min_interval = self._policy.min_interval
+
+        if min_interval and self._last_time is not None:
+            loop = asyncio.get_event_loop()
+            elapsed = loop.time() - self._last_time
+
+            if elapsed < min_interval:
+                if self._policy.coalesce:
+                    self._pending = True
+
+                    if self._handle_trailing is None:
+                        self._handle_trailing = loop.call_later(
+                            min_interval - elapsed, self._on_trailing
+                        )
+
+                return
+
+        self._emit(value)
+
+    def dispose(self):
+        """Cancels the scheduled notifications."""
+
+        for handle in (self._handle_trailing, self._handle_heartbeat):
+            if handle is not None:
+                handle.cancel()
+
+        self._handle_trailing = None
+        self._handle_heartbeat = None
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Storage backends for the values of the Properties of ExposedThings.
+"""
+
+import array
+from abc import ABCMeta, abstractmethod
+
+from wotpy.wot.enums import DataType
+
+_TYPECODES = {
+    DataType.NUMBER: ("d", float),
+    DataType.INTEGER: ("q", int),
+    DataType.BOOLEAN: ("b", bool),
+}
+
+
+class BasePropertyStore(object):
+    """Base class for Property value stores.
+    This is the interface used by ExposedThing to retrieve and update the
+    values of its Properties (when there are no custom handlers)."""
+
+    __metaclass__ = ABCMeta
+
+    @abstractmethod
+    def get(self, prop):
+        """Returns the value of the given Property (None if undefined)."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def set(self, prop, value):
+        """Updates the value of the given Property."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def remove(self, prop):
+        """Removes the value of the given Property from the store."""
+
+        raise NotImplementedError()
+
+    @abstractmethod
+    def __contains__(self, prop):
+        raise NotImplementedError()
+
+    @abstractmethod
+    def __len__(self):
+        raise NotImplementedError()
+
+
+class DictPropertyStore(BasePropertyStore):
+    """Property value store backed by a dict.
+    This is the default store, with one instance for each ExposedThing."""
+
+    def __init__(self):
+        self._values = {}
+
+    def get(self, prop):
+        """Returns the value of the given Property (None if undefined)."""
+
+        return self._values.get(prop, None)
+
+    def set(self, prop, value):
+        """Updates the value of the given Property."""
+
+        self._values[prop] = value
+
+    def remove(self, prop):
+        """Removes the value of the given Property from the store."""
+
+        self._values.pop(prop, None)
+
+    def __contains__(self, prop):
+        return prop in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+
+class _Column(object):
+    """Column that contains the values of the Properties with the same name
+    in all the rows (Things) of an ArrayPropertyStore.
+    Values of the type that corresponds to the data type of the Property are stored
+    unboxed in an array, other values (e.g. None) are kept in an overflow dict."""
+
+    __slots__ = ("value_type", "values", "present", "overflow")
+
+    def __init__(self, data_type):
+        typecode, self.value_type = _TYPECODES.get(data_type, (None, None))
+        self.values = array.array(typecode) if typecode else None
+        self.present = bytearray()
+        self.overflow = {}
+
+    def _grow(self, size):
+        """Extends the column so that it contains the given number of rows."""
+
+        missing = size - len(self.present)
+        self.present.extend(bytes(missing))
+
+        if self.values is not None:
+            self.values.frombytes(bytes(missing * self.values.itemsize))
+
+    def get(self, row):
+        """Returns the value of the given row."""
+
+        if row >= len(self.present) or not self.present[row]:
+            return None
+
+        if self.overflow and row in self.overflow:
+            return self.overflow[row]
+
+        value = self.values[row]
+
+        return bool(value) if self.value_type is bool else value
+
+    def set(self, row, value):
+        """Updates the value of the given row.
+        Returns True if the row did not contain a value."""
+
+        if row >= len(self.present):
+            self._grow(row + 1)
+
+        was_present = self.present[row]
+        self.present[row] = 1
+
+        if type(value) is self.value_type:
+            try:
+                self.values[row] = value
+
+                if self.overflow:
+                    self.overflow.pop(row, None)
+
+                return not was_present
+            except OverflowError:
+                pass
+
+        self.overflow[row] = value
+
+        return not was_present
+
+    def clear(self, row):
+        """Removes the value of the given row.
+        Returns True if the row contained a value."""
+
+        if row >= len(self.present) or not self.present[row]:
+            return False
+
+        self.present[row] = 0
+        self.overflow.pop(row, None)
+
+        return True
+
+
+class ArrayPropertyStore(BasePropertyStore):
+    """Property value store backed by typed arrays.
+    It is intended to be shared by many ExposedThings (e.g. by passing it to the
+    Servient) to reduce the memory used by large fleets of Things with mostly
+    numeric Properties. Each Thing is assigned a row (slot) and the values of
+    the Properties with the same name are stored in a column indexed by row, so
+    that numbers, integers and booleans are stored unboxed. The type of a column is
+    defined by the data type of the first Property with that name."""
+
+    def __init__(self):
+        self._rows = {}
+        self._row_counts = array.array("L")
+        self._free_rows = []
+        self._columns = {}
+        self._size = 0
+
+    def _allocate_row(self, thing):
+        """Assigns a row to the given Thing."""
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._row_counts)
+            self._row_counts.append(0)
+
+        self._rows[thing] = row
+
+        return row
+
+    def _release_row(self, thing, row):
+        """Frees the row of the given Thing so that it can be reused."""
+
+        del self._rows[thing]
+        self._free_rows.append(row)
+
+    def get(self, prop):
+        """Returns the value of the given Property (None if undefined)."""
+
+        row = self._rows.get(prop.thing, None)
+        column = self._columns.get(prop.name, None)
+
+        if row is None or column is None:
+            return None
+
+        return column.get(row)
+
+    def set(self, prop, value):
+        """Updates the value of the given Property."""
+
+        row = self._rows.get(prop.thing, None)
+
+        if row is None:
+            row = self._allocate_row(prop.thing)
+
+        column = self._columns.get(prop.name, None)
+
+        if column is None:
+            column = _Column(prop.type)
+            self._columns[prop.name] = column
+
+        if column.set(row, value):
+            self._row_counts[row] += 1
+            self._size += 1
+
+    def remove(self, prop):
+        """Removes the value of the given Property from the store."""
+
+        row = self._rows.get(prop.thing, None)
+        column = self._columns.get(prop.name, None)
+
+        if row is None or column is None or not column.clear(row):
+            return
+
+        self._row_counts[row] -= 1
+        self._size -= 1
+
+        if self._row_counts[row] == 0:
+            self._release_row(prop.thing, row)
+
+    def __contains__(self, prop):
+        row = self._rows.get(prop.thing, None)
+        column = self._columns.get(prop.name, None)
+
+        return (
+            row is not None
+            and column is not None
+            and row < len(column.present)
+            and bool(column.present[row])
+        )
+
+    def __len__(self):
+        return self._size
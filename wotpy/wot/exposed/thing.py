@@ -7,20 +7,24 @@ Classes that represent Things exposed by a servient.
 
 import asyncio
 import concurrent.futures
+import contextlib
+import functools
 from asyncio import Future
 
-from rx import Observable
-from rx.concurrency import IOLoopScheduler
-from rx.subjects import Subject
-
 from wotpy.utils.enums import EnumListMixin
+from wotpy.utils.observable import Observable
 from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.interaction import (
     ActionFragmentDict,
     EventFragmentDict,
     PropertyFragmentDict,
 )
-from wotpy.wot.enums import DefaultThingEvent, TDChangeMethod, TDChangeType
+from wotpy.wot.enums import (
+    DefaultThingEvent,
+    InteractionTypes,
+    TDChangeMethod,
+    TDChangeType,
+)
 from wotpy.wot.events import (
     ActionInvocationEmittedEvent,
     ActionInvocationEventInit,
@@ -30,11 +34,17 @@ from wotpy.wot.events import (
     ThingDescriptionChangeEmittedEvent,
     ThingDescriptionChangeEventInit,
 )
+from wotpy.wot.exposed.admission import AdmissionController, AdmissionRejectedError
+from wotpy.wot.exposed.cache import PropertyReadCache
+from wotpy.wot.exposed.dispatcher import EventDispatcher
+from wotpy.wot.exposed.history import PropertyHistory
+from wotpy.wot.exposed.notification import PropertyNotifier, value_fingerprint
 from wotpy.wot.exposed.interaction_map import (
     ExposedThingActionDict,
     ExposedThingEventDict,
     ExposedThingPropertyDict,
 )
+from wotpy.wot.exposed.store import DictPropertyStore
 from wotpy.wot.interaction import Action, Event, Property
 from wotpy.wot.td import ThingDescription
 from wotpy.wot.thing import Thing
@@ -57,11 +67,19 @@ class ExposedThing(object):
 
         PROPERTY_VALUES = "property_values"
 
-    def __init__(self, servient, thing):
+    def __init__(self, servient, thing, property_store=None):
         self._servient = servient
         self._thing = thing
 
-        self._interaction_states = {self.InteractionStateKeys.PROPERTY_VALUES: {}}
+        if property_store is None:
+            property_store = servient.property_store
+
+        if property_store is None:
+            property_store = DictPropertyStore()
+
+        self._interaction_states = {
+            self.InteractionStateKeys.PROPERTY_VALUES: property_store
+        }
 
         self._handlers_global = {
             self.HandlerKeys.RETRIEVE_PROPERTY: self._default_retrieve_property_handler,
@@ -75,7 +93,17 @@ class ExposedThing(object):
             self.HandlerKeys.INVOKE_ACTION: {},
         }
 
-        self._events_stream = Subject()
+        self._read_caches = {}
+        self._admission_controllers = {}
+        self._admission_controller = None
+        self._notifiers = {}
+        self._emit_on_change_only = False
+        self._change_only_props = {}
+        self._fingerprints = {}
+        self._histories = {}
+        self._dispatcher = EventDispatcher()
+        self._batch_depth = 0
+        self._batch_td_changes = []
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.id)
@@ -105,14 +133,12 @@ class ExposedThing(object):
     def _set_property_value(self, prop, value):
         """Sets a Property value."""
 
-        prop_values = self.InteractionStateKeys.PROPERTY_VALUES
-        self._interaction_states[prop_values][prop] = value
+        self.property_store.set(prop, value)
 
     def _get_property_value(self, prop):
         """Returns a Property value."""
 
-        prop_values = self.InteractionStateKeys.PROPERTY_VALUES
-        return self._interaction_states[prop_values].get(prop, None)
+        return self.property_store.get(prop)
 
     def _set_handler(self, handler_type, handler, interaction=None):
         """Sets the currently defined handler for the given handler type."""
@@ -122,6 +148,16 @@ class ExposedThing(object):
         else:
             self._handlers[handler_type][interaction] = handler
 
+    def _wrap_handler(self, handler, mode):
+        """Returns a handler that runs the given handler in the given execution mode
+        using the executors of the servient (or the same handler if there is no mode).
+        """
+
+        if mode is None:
+            return handler
+
+        return self._servient.executors.wrap(mode, handler)
+
     def _get_handler(self, handler_type, interaction=None):
         """Returns the currently defined handler for the given handler type."""
 
@@ -131,6 +167,109 @@ class ExposedThing(object):
 
         return interaction_handler or self._handlers_global[handler_type]
 
+    @classmethod
+    def _property_change_topic(cls, name):
+        """Returns the dispatcher topic for changes of the given Property."""
+
+        return DefaultThingEvent.PROPERTY_CHANGE, name
+
+    @classmethod
+    def _action_invocation_topic(cls, name):
+        """Returns the dispatcher topic for invocations of the given Action."""
+
+        return DefaultThingEvent.ACTION_INVOCATION, name
+
+    @classmethod
+    def _td_change_topic(cls):
+        """Returns the dispatcher topic for Thing Description changes."""
+
+        return DefaultThingEvent.DESCRIPTION_CHANGE, None
+
+    @classmethod
+    def _event_topic(cls, name):
+        """Returns the dispatcher topic for emissions of the given Event."""
+
+        return InteractionTypes.EVENT, name
+
+    def _emit_td_change(self, event_data):
+        """Emits a Thing Description change event."""
+
+        self._dispatcher.emit(
+            self._td_change_topic(),
+            ThingDescriptionChangeEmittedEvent(init=event_data),
+        )
+
+    def _notify_td_change(self, td_change_type, method, name, interaction_init=None):
+        """Notifies a Thing Description change to the observers.
+        Changes are deferred while a batch update is in progress, and the
+        serialized TD is only built if there is at least one observer."""
+
+        change = (td_change_type, method, name, interaction_init)
+
+        if self._batch_depth > 0:
+            self._batch_td_changes.append(change)
+            return
+
+        self._servient.notify_td_change(self)
+
+        if not self._dispatcher.has_observers(self._td_change_topic()):
+            return
+
+        description = (
+            ThingDescription.from_thing(self.thing).to_dict()
+            if method == TDChangeMethod.ADD
+            else None
+        )
+
+        event_data = ThingDescriptionChangeEventInit(
+            td_change_type=td_change_type,
+            method=method,
+            name=name,
+            data=interaction_init.to_dict() if interaction_init else None,
+            description=description,
+        )
+
+        self._emit_td_change(event_data)
+
+    def _flush_batch_td_changes(self):
+        """Emits one Thing Description change event that
+        coalesces all the changes of the last batch update."""
+
+        changes = self._batch_td_changes
+        self._batch_td_changes = []
+
+        if not len(changes):
+            return
+
+        if len(changes) == 1:
+            self._notify_td_change(*changes[0])
+            return
+
+        self._servient.notify_td_change(self)
+
+        if not self._dispatcher.has_observers(self._td_change_topic()):
+            return
+
+        changes_data = [
+            {
+                "td_change_type": td_change_type,
+                "method": method,
+                "name": name,
+                "data": interaction_init.to_dict() if interaction_init else None,
+            }
+            for td_change_type, method, name, interaction_init in changes
+        ]
+
+        event_data = ThingDescriptionChangeEventInit(
+            td_change_type=None,
+            method=TDChangeMethod.CHANGE,
+            name=None,
+            data=changes_data,
+            description=ThingDescription.from_thing(self.thing).to_dict(),
+        )
+
+        self._emit_td_change(event_data)
+
     def _find_interaction(self, name):
         """Raises ValueError if the given interaction does not exist in this Thing."""
 
@@ -141,6 +280,38 @@ class ExposedThing(object):
 
         return interaction
 
+    def _find_property(self, name):
+        """Raises ValueError if the given Property does not exist in this Thing."""
+
+        proprty = self.thing.properties.get(name, None)
+
+        if proprty is None:
+            raise ValueError("Property not found: {}".format(name))
+
+        return proprty
+
+    def _update_fingerprint(self, prop, value):
+        """Stores the fingerprint of the new value of the given Property.
+        Returns True if it differs from the fingerprint of the previous value."""
+
+        fingerprint = value_fingerprint(value)
+        changed = prop not in self._fingerprints or (
+            self._fingerprints[prop] != fingerprint
+        )
+        self._fingerprints[prop] = fingerprint
+
+        return changed
+
+    def _emit_property_change(self, prop, name, value):
+        """Notifies the subscribers of the given Property that its value has changed."""
+
+        event_init = PropertyChangeEventInit(name=name, value=value)
+
+        self._dispatcher.emit(
+            self._property_change_topic(prop.name),
+            PropertyChangeEmittedEvent(init=event_init),
+        )
+
     def _default_retrieve_property_handler(self, property_name):
         """Default handler for property reads."""
 
@@ -175,6 +346,12 @@ class ExposedThing(object):
 
         return self.thing.id
 
+    @property
+    def property_store(self):
+        """Returns the store that contains the values of the Properties of this ExposedThing."""
+
+        return self._interaction_states[self.InteractionStateKeys.PROPERTY_VALUES]
+
     @property
     def servient(self):
         """Servient that contains this ExposedThing."""
@@ -217,10 +394,15 @@ class ExposedThing(object):
             proprty, None
         )
 
-        if handler:
-            value = await handler()
-        else:
-            value = await self._default_retrieve_property_handler(name)
+        if not handler:
+            handler = functools.partial(self._default_retrieve_property_handler, name)
+
+        read_cache = self._read_caches.get(proprty, None)
+
+        if read_cache is not None:
+            return await read_cache.read(handler)
+
+        value = await handler()
 
         return value
 
@@ -239,6 +421,15 @@ class ExposedThing(object):
             proprty, None
         )
 
+        change_only = self._change_only_props.get(proprty, self._emit_on_change_only)
+
+        # The store does not hold the value of Properties with a custom handler,
+        # so their first write is always notified
+        if change_only and not handler and proprty not in self._fingerprints:
+            self._fingerprints[proprty] = value_fingerprint(
+                self.property_store.get(proprty)
+            )
+
         if handler:
             fut = handler(value)
 
@@ -249,28 +440,134 @@ class ExposedThing(object):
         else:
             await self._default_update_property_handler(name, value)
 
-        event_init = PropertyChangeEventInit(name=name, value=value)
-        self._events_stream.on_next(PropertyChangeEmittedEvent(init=event_init))
+        read_cache = self._read_caches.get(proprty, None)
+
+        if read_cache is not None:
+            read_cache.invalidate()
+
+        history = self._histories.get(proprty, None)
+
+        if history is not None:
+            history.append(value)
+
+        if change_only and not self._update_fingerprint(proprty, value):
+            return
+
+        notifier = self._notifiers.get(proprty, None)
+
+        if notifier is not None:
+            notifier.push(value)
+        else:
+            self._emit_property_change(proprty, name, value)
+
+    async def read_multiple_properties(self, names):
+        """Reads the Properties with the given names concurrently.
+        Returns a Future that resolves with a dict that maps
+        each Property name to its value or rejects with an Error."""
+
+        for name in names:
+            self._find_property(name)
+
+        values = await asyncio.gather(*[self.read_property(name) for name in names])
+
+        return dict(zip(names, values))
+
+    async def read_all_properties(self):
+        """Reads all the Properties of this Thing concurrently.
+        Returns a Future that resolves with a dict that maps
+        each Property name to its value or rejects with an Error."""
+
+        return await self.read_multiple_properties(list(self.thing.properties.keys()))
+
+    async def write_multiple_properties(self, values):
+        """Takes a dict that maps Property names to new values and updates the
+        Properties concurrently. All the Properties are checked before writing,
+        so no Property is updated if any of them does not exist or is non-writable.
+        Returns a Future that resolves on success or rejects with an Error."""
+
+        for name in values:
+            if not self._find_property(name).writable:
+                raise TypeError("Property is non-writable: {}".format(name))
+
+        await asyncio.gather(
+            *[self.write_property(name, value) for name, value in values.items()]
+        )
 
     async def invoke_action(self, name, input_value=None):
-        """Invokes an Action with the given parameters and yields with the invocation result."""
+        """Invokes an Action with the given parameters and returns the result.
+        Raises AdmissionRejectedError if the invocation is not admitted
+        according to the admission policies of the Action and the Thing."""
+
+        return await self.try_invoke_action(name, input_value)
+
+    def try_invoke_action(self, name, input_value=None):
+        """Invokes an Action with the given parameters.
+        Returns a Future that resolves with the invocation result.
+        The invocation is admitted (or rejected with AdmissionRejectedError)
+        synchronously according to the admission policies of the Action and the Thing.
+        Invocations queued by the Action policy only request a Thing slot when the
+        Action slot is granted, so they may be rejected later by the Thing policy.
+        Must be called from a running event loop.
+        """
 
         action = self.thing.actions[name]
 
-        handler = self._get_handler(
-            handler_type=self.HandlerKeys.INVOKE_ACTION, interaction=action
+        controllers = [
+            controller
+            for controller in (
+                self._admission_controllers.get(action, None),
+                self._admission_controller,
+            )
+            if controller is not None
+        ]
+
+        slots = []
+
+        try:
+            for controller in controllers:
+                slot = controller.acquire()
+                slots.append((controller, slot))
+
+                if not slot.done():
+                    break
+        except AdmissionRejectedError:
+            for controller, slot in slots:
+                controller.abandon(slot)
+
+            raise
+
+        return asyncio.ensure_future(
+            self._invoke_action(action, name, input_value, controllers, slots)
         )
 
-        fut = handler({"input": input_value})
+    async def _invoke_action(self, action, name, input_value, controllers, slots):
+        """Waits for the admission slots and invokes the Action handler.
+        Each slot is requested after the previous one has been granted."""
 
-        if isinstance(fut, concurrent.futures.Future):
-            result = await asyncio.wrap_future(fut)
-        else:
-            result = await asyncio.ensure_future(fut)
+        try:
+            for idx, controller in enumerate(controllers):
+                if idx == len(slots):
+                    slots.append((controller, controller.acquire()))
+
+                await slots[idx][1]
+
+            handler = self._get_handler(
+                handler_type=self.HandlerKeys.INVOKE_ACTION, interaction=action
+            )
+
+            fut = handler({"input": input_value})
+
+            if isinstance(fut, concurrent.futures.Future):
+                result = await asyncio.wrap_future(fut)
+            else:
+                result = await asyncio.ensure_future(fut)
+        finally:
+            for controller, slot in slots:
+                controller.abandon(slot)
 
         event_init = ActionInvocationEventInit(action_name=name, return_value=result)
         emitted_event = ActionInvocationEmittedEvent(init=event_init)
-        self._events_stream.on_next(emitted_event)
+        self._dispatcher.emit(self._action_invocation_topic(action.name), emitted_event)
 
         return result
 
@@ -281,10 +578,7 @@ class ExposedThing(object):
         if name not in self.thing.events:
             return Observable.throw(Exception("Unknown event"))
 
-        def event_filter(item):
-            return item.name == name
-
-        return self._events_stream.filter(event_filter)
+        return self._dispatcher.observable(self._event_topic(name))
 
     def on_property_change(self, name):
         """Returns an Observable for the Property specified in the name argument,
@@ -298,22 +592,15 @@ class ExposedThing(object):
         if not interaction.observable:
             return Observable.throw(Exception("Property is not observable"))
 
-        def property_change_filter(item):
-            return (
-                item.name == DefaultThingEvent.PROPERTY_CHANGE
-                and item.data.name == name
-            )
-
-        return self._events_stream.filter(property_change_filter)
+        return self._dispatcher.observable(
+            self._property_change_topic(interaction.name)
+        )
 
     def on_td_change(self):
         """Returns an Observable, allowing subscribing to and unsubscribing
         from notifications to the Thing Description."""
 
-        def td_change_filter(item):
-            return item.name == DefaultThingEvent.DESCRIPTION_CHANGE
-
-        return self._events_stream.filter(td_change_filter)
+        return self._dispatcher.observable(self._td_change_topic())
 
     def expose(self):
         """Start serving external requests for the Thing, so that
@@ -327,14 +614,42 @@ class ExposedThing(object):
 
         self._servient.remove_exposed_thing(self.thing.id)
 
+        for prop in self.thing.properties.values():
+            self.property_store.remove(prop)
+            self._dispose_notifier(prop)
+
+        self._fingerprints.clear()
+        self._histories.clear()
+
     def emit_event(self, event_name, payload):
         """Emits an the event initialized with the event name specified by
         the event_name argument and data specified by the payload argument."""
 
-        if not self.thing.find_interaction(name=event_name):
+        event = self.thing.find_interaction(name=event_name)
+
+        if not event:
             raise ValueError("Unknown event: {}".format(event_name))
 
-        self._events_stream.on_next(EmittedEvent(name=event_name, init=payload))
+        self._dispatcher.emit(
+            self._event_topic(event.name), EmittedEvent(name=event_name, init=payload)
+        )
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """Context manager to add or remove many interactions at once.
+        The Thing Description change events of the interactions updated
+        inside the block are coalesced into a single event that is emitted
+        when the (outermost) block exits."""
+
+        self._batch_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0:
+                self._flush_batch_td_changes()
 
     def add_property(self, name, property_init, value=None):
         """Adds a Property defined by the argument and updates the Thing Description.
@@ -348,33 +663,35 @@ class ExposedThing(object):
         self._thing.add_interaction(prop)
         self._set_property_value(prop, value)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.PROPERTY,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=property_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict(),
+        self._notify_td_change(
+            TDChangeType.PROPERTY,
+            TDChangeMethod.ADD,
+            name,
+            interaction_init=property_init,
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
-
     def remove_property(self, name):
         """Removes the Property specified by the name argument,
         updates the Thing Description and returns the object."""
 
+        prop = self._thing.find_interaction(name=name)
+
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.PROPERTY,
-            method=TDChangeMethod.REMOVE,
-            name=name,
-        )
+        if isinstance(prop, Property):
+            self.property_store.remove(prop)
+            self._read_caches.pop(prop, None)
+            self._dispose_notifier(prop)
+            self._change_only_props.pop(prop, None)
+            self._fingerprints.pop(prop, None)
+            self._histories.pop(prop, None)
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._notify_td_change(TDChangeType.PROPERTY, TDChangeMethod.REMOVE, name)
 
-    def add_action(self, name, action_init, action_handler=None):
+    def add_action(self, name, action_init, action_handler=None, mode=None):
         """Adds an Action to the Thing object as defined by the action
-        argument of type ThingActionInit and updates th,e Thing Description."""
+        argument of type ThingActionInit and updates th,e Thing Description.
+        The optional handler is set with the given execution mode."""
 
         if isinstance(action_init, dict):
             action_init = ActionFragmentDict(action_init)
@@ -383,30 +700,25 @@ class ExposedThing(object):
 
         self._thing.add_interaction(action)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.ACTION,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=action_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict(),
+        self._notify_td_change(
+            TDChangeType.ACTION, TDChangeMethod.ADD, name, interaction_init=action_init
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
-
         if action_handler:
-            self.set_action_handler(name, action_handler)
+            self.set_action_handler(name, action_handler, mode=mode)
 
     def remove_action(self, name):
         """Removes the Action specified by the name argument,
         updates the Thing Description and returns the object."""
 
+        action = self._thing.find_interaction(name=name)
+
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.ACTION, method=TDChangeMethod.REMOVE, name=name
-        )
+        if isinstance(action, Action):
+            self._admission_controllers.pop(action, None)
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._notify_td_change(TDChangeType.ACTION, TDChangeMethod.REMOVE, name)
 
     def add_event(self, name, event_init):
         """Adds an event to the Thing object as defined by the event argument
@@ -419,31 +731,23 @@ class ExposedThing(object):
 
         self._thing.add_interaction(event)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.EVENT,
-            method=TDChangeMethod.ADD,
-            name=name,
-            data=event_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict(),
+        self._notify_td_change(
+            TDChangeType.EVENT, TDChangeMethod.ADD, name, interaction_init=event_init
         )
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
-
     def remove_event(self, name):
         """Removes the event specified by the name argument,
         updates the Thing Description and returns the object."""
 
         self._thing.remove_interaction(name=name)
 
-        event_data = ThingDescriptionChangeEventInit(
-            td_change_type=TDChangeType.EVENT, method=TDChangeMethod.REMOVE, name=name
-        )
-
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._notify_td_change(TDChangeType.EVENT, TDChangeMethod.REMOVE, name)
 
-    def set_action_handler(self, name, action_handler):
+    def set_action_handler(self, name, action_handler, mode=None):
         """Takes name as string argument and action_handler as argument of type ActionHandler.
         Sets the handler function for the specified Action matched by name.
+        The optional mode (a HandlerExecutionMode) runs the handler in the executors of the
+        servient, in which case the handler should be a plain function.
         Throws on error. Returns a reference to the same object for supporting chaining.
         """
 
@@ -451,15 +755,59 @@ class ExposedThing(object):
 
         self._set_handler(
             handler_type=self.HandlerKeys.INVOKE_ACTION,
-            handler=action_handler,
+            handler=self._wrap_handler(action_handler, mode),
             interaction=action,
         )
 
         return self
 
-    def set_property_read_handler(self, name, read_handler):
+    def set_action_admission_policy(self, name, policy):
+        """Takes name as string argument and policy as argument of type AdmissionPolicy.
+        Sets the policy to limit the concurrent invocations of the specified Action
+        (admission control is disabled if the policy is None).
+        Returns a reference to the same object for supporting chaining."""
+
+        action = self.thing.actions[name]
+
+        if policy is None:
+            self._admission_controllers.pop(action, None)
+        else:
+            self._admission_controllers[action] = AdmissionController(policy)
+
+        return self
+
+    def set_admission_policy(self, policy):
+        """Sets the AdmissionPolicy to limit the concurrent invocations of all the
+        Actions of this Thing (admission control is disabled if the policy is None).
+        Returns a reference to the same object for supporting chaining."""
+
+        self._admission_controller = (
+            AdmissionController(policy) if policy is not None else None
+        )
+
+        return self
+
+    def get_action_admission_metrics(self, name):
+        """Returns a dict with the admission metrics (e.g. the queue depth)
+        of the specified Action (None if there is no admission policy)."""
+
+        controller = self._admission_controllers.get(self.thing.actions[name], None)
+
+        return controller.metrics() if controller is not None else None
+
+    def get_admission_metrics(self):
+        """Returns a dict with the admission metrics (e.g. the queue depth)
+        of this Thing (None if there is no admission policy)."""
+
+        controller = self._admission_controller
+
+        return controller.metrics() if controller is not None else None
+
+    def set_property_read_handler(self, name, read_handler, mode=None):
         """Takes name as string argument and read_handler as argument of type PropertyReadHandler.
         Sets the handler function for reading the specified Property matched by name.
+        The optional mode (a HandlerExecutionMode) runs the handler in the executors of the
+        servient, in which case the handler should be a plain function.
         Throws on error. Returns a reference to the same object for supporting chaining.
         """
 
@@ -467,15 +815,155 @@ class ExposedThing(object):
 
         self._set_handler(
             handler_type=self.HandlerKeys.RETRIEVE_PROPERTY,
-            handler=read_handler,
+            handler=self._wrap_handler(read_handler, mode),
             interaction=proprty,
         )
 
+        if proprty in self._read_caches:
+            self._read_caches[proprty].invalidate()
+
         return self
 
-    def set_property_write_handler(self, name, write_handler):
+    def set_property_cache_policy(self, name, policy):
+        """Takes name as string argument and policy as argument of type PropertyCachePolicy.
+        Sets the policy to cache the values retrieved by the read handler of the specified
+        Property (the cache is disabled if the policy is None).
+        Returns a reference to the same object for supporting chaining."""
+
+        proprty = self.thing.properties[name]
+
+        if policy is None:
+            self._read_caches.pop(proprty, None)
+        else:
+            self._read_caches[proprty] = PropertyReadCache(policy)
+
+        return self
+
+    def _dispose_notifier(self, prop):
+        """Removes the notifier of the given Property and cancels its scheduled notifications."""
+
+        notifier = self._notifiers.pop(prop, None)
+
+        if notifier is not None:
+            notifier.dispose()
+
+    def set_property_notification_policy(self, name, policy):
+        """Takes name as string argument and policy as argument of type NotificationPolicy.
+        Sets the policy that throttles the change notifications of the specified Property
+        (all changes are notified if the policy is None).
+        Returns a reference to the same object for supporting chaining."""
+
+        proprty = self.thing.properties[name]
+
+        self._dispose_notifier(proprty)
+
+        if policy is not None:
+            self._notifiers[proprty] = PropertyNotifier(
+                policy,
+                functools.partial(self._emit_property_change, proprty, proprty.name),
+            )
+
+        return self
+
+    def get_property_notification_policy(self, name):
+        """Returns the NotificationPolicy of the specified Property (None if undefined)."""
+
+        notifier = self._notifiers.get(self.thing.properties[name], None)
+
+        return notifier.policy if notifier is not None else None
+
+    def set_emit_on_change_only(self, enabled):
+        """Enables or disables the change-only mode for all the Properties of this Thing.
+        In this mode writes that do not modify the value of a Property are not notified.
+        Properties with their own mode (see set_property_emit_on_change_only) are not affected.
+        Properties with a custom write handler always notify their first write.
+        Returns a reference to the same object for supporting chaining."""
+
+        self._emit_on_change_only = bool(enabled)
+        self._fingerprints.clear()
+
+        return self
+
+    def set_property_emit_on_change_only(self, name, enabled):
+        """Enables or disables the change-only mode for the specified Property
+        (None to use the mode defined for the whole Thing).
+        Returns a reference to the same object for supporting chaining."""
+
+        proprty = self.thing.properties[name]
+
+        if enabled is None:
+            self._change_only_props.pop(proprty, None)
+        else:
+            self._change_only_props[proprty] = bool(enabled)
+
+        self._fingerprints.pop(proprty, None)
+
+        return self
+
+    def get_property_emit_on_change_only(self, name):
+        """Returns True if writes that do not modify the
+        value of the specified Property are not notified."""
+
+        return self._change_only_props.get(
+            self.thing.properties[name], self._emit_on_change_only
+        )
+
+    def set_property_history_size(self, name, max_length):
+        """Keeps the latest max_length values written to the specified Property
+        in a ring buffer (history is disabled if max_length is None).
+        The latest values of the current history are kept when it is resized.
+        Returns a reference to the same object for supporting chaining."""
+
+        proprty = self.thing.properties[name]
+        history_prev = self._histories.pop(proprty, None)
+
+        if max_length is None:
+            return self
+
+        history = PropertyHistory(max_length, data_type=proprty.type)
+
+        if history_prev is not None:
+            for timestamp, value in history_prev.query(limit=max_length):
+                history.append(value, timestamp=timestamp)
+
+        self._histories[proprty] = history
+
+        return self
+
+    def get_property_history(self, name, since=None, until=None, limit=None):
+        """Returns a list of (timestamp, value) tuples sorted from oldest to newest
+        with the values written to the specified Property between the since and until
+        timestamps (seconds since the epoch). If limit is defined only the latest
+        limit values are returned. Raises ValueError if history is not enabled."""
+
+        history = self._histories.get(self._find_property(name), None)
+
+        if history is None:
+            raise ValueError("History not enabled for Property: {}".format(name))
+
+        return history.query(since=since, until=until, limit=limit)
+
+    def get_property_cache_policy(self, name):
+        """Returns the PropertyCachePolicy of the specified Property (None if undefined)."""
+
+        read_cache = self._read_caches.get(self.thing.properties[name], None)
+
+        return read_cache.policy if read_cache is not None else None
+
+    def get_property_max_age(self, name):
+        """Returns the number of seconds during which the cached value of the
+        specified Property will still be fresh (None if the Property is not cached).
+        Protocol servers use this value to help downstream caches."""
+
+        read_cache = self._read_caches.get(self.thing.properties[name], None)
+
+        return read_cache.remaining_max_age() if read_cache is not None else None
+
+    def set_property_write_handler(self, name, write_handler, mode=None):
         """Takes name as string argument and write_handler as argument of type PropertyWriteHandler.
         Sets the handler function for writing the specified Property matched by name.
+        The optional mode (a HandlerExecutionMode) runs the handler in the executors of the
+        servient, in which case the handler should be a plain function.
         Throws on error. Returns a reference to the same object for supporting chaining.
         """
 
@@ -483,7 +971,7 @@ class ExposedThing(object):
 
         self._set_handler(
             handler_type=self.HandlerKeys.UPDATE_PROPERTY,
-            handler=write_handler,
+            handler=self._wrap_handler(write_handler, mode),
             interaction=proprty,
         )
 
@@ -493,4 +981,4 @@ class ExposedThing(object):
         """Subscribes to changes on the TD of this thing."""
 
         observable = self.on_td_change()
-        return observable.subscribe_on(IOLoopScheduler()).subscribe(*args, **kwargs)
+        return observable.subscribe(*args, **kwargs)
@@ -5,6 +5,8 @@
 Class that represents a group or set of ExposedThing instances that exist in the same context.
 """
 
+_UUID_LEN = 36
+
 
 class ExposedThingSet(object):
     """Represents a group of ExposedThing objects.
@@ -12,6 +14,8 @@ class ExposedThingSet(object):
 
     def __init__(self):
         self._exposed_things = {}
+        self._exposed_things_by_uuid = {}
+        self._exposed_things_by_thing = {}
 
     @property
     def exposed_things(self):
@@ -23,7 +27,9 @@ class ExposedThingSet(object):
     def contains(self, exposed_thing):
         """Returns True if this group contains the given ExposedThing."""
 
-        return exposed_thing in self._exposed_things.values()
+        found = self._exposed_things_by_thing.get(exposed_thing.thing, None)
+
+        return found is not None and found == exposed_thing
 
     def add(self, exposed_thing):
         """Add a new ExposedThing to this set."""
@@ -32,6 +38,8 @@ class ExposedThingSet(object):
             raise ValueError("Duplicate Exposed Thing: {}".format(exposed_thing.title))
 
         self._exposed_things[exposed_thing.thing.id] = exposed_thing
+        self._exposed_things_by_uuid[exposed_thing.thing.uuid] = exposed_thing
+        self._exposed_things_by_thing[exposed_thing.thing] = exposed_thing
 
     def remove(self, thing_id):
         """Removes an existing ExposedThing by ID.
@@ -43,27 +51,30 @@ class ExposedThingSet(object):
             raise ValueError("Unknown Exposed Thing: {}".format(thing_id))
 
         self._exposed_things.pop(exposed_thing.thing.id)
+        self._exposed_things_by_uuid.pop(exposed_thing.thing.uuid, None)
+        self._exposed_things_by_thing.pop(exposed_thing.thing, None)
 
     def find_by_thing_id(self, thing_id):
         """Finds an existing ExposedThing by Thing ID.
         The ID argument may be the original Thing ID or the URL-safe name
         (which is also unique and based on the ID)."""
 
-        def is_match(exp_thing):
-            return (
-                exp_thing.thing.id == thing_id or exp_thing.thing.url_name == thing_id
-            )
+        exposed_thing = self._exposed_things.get(thing_id, None)
+
+        if exposed_thing is not None:
+            return exposed_thing
+
+        # The URL name is the slugified title followed by the UUID, which
+        # is derived from the ID and stays stable if the title is updated.
 
-        return next(
-            (item for item in self._exposed_things.values() if is_match(item)), None
-        )
+        exposed_thing = self._exposed_things_by_uuid.get(thing_id[-_UUID_LEN:], None)
+
+        if exposed_thing is not None and exposed_thing.thing.url_name == thing_id:
+            return exposed_thing
+
+        return None
 
     def find_by_interaction(self, interaction):
         """Finds the ExposedThing whose Thing contains the given Interaction."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing is interaction.thing
-
-        return next(
-            (item for item in self._exposed_things.values() if is_match(item)), None
-        )
+        return self._exposed_things_by_thing.get(interaction.thing, None)
@@ -30,7 +30,8 @@ class Form(object):
 
     @property
     def interaction(self):
-        """Interaction that contains this Form."""
+        """Interaction that contains this Form.
+        This is the Thing itself for Thing-level Forms."""
 
         return self._interaction
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Table of the Forms of a Thing Description resolved against its base URI.
+"""
+
+import collections
+import urllib.parse
+
+from wotpy.wot.enums import InteractionTypes
+
+# Form with its URL resolved against the TD base. The host key (scheme://netloc)
+# identifies the server or MQTT broker and the topic is the URL path without slashes.
+ResolvedForm = collections.namedtuple(
+    "ResolvedForm", ["form", "url", "scheme", "host_key", "topic"]
+)
+
+
+def resolve_form(form, base):
+    """Resolves the URL of the given Form and returns a ResolvedForm
+    (or None if the URL cannot be resolved)."""
+
+    url = form.resolve_uri(base=base)
+
+    if not url:
+        return None
+
+    parsed = urllib.parse.urlparse(url)
+
+    return ResolvedForm(
+        form=form,
+        url=url,
+        scheme=parsed.scheme,
+        host_key="{}://{}".format(parsed.scheme, parsed.netloc),
+        topic=parsed.path.strip("/"),
+    )
+
+
+class FormTable(object):
+    """Index of the Forms of a Thing Description by interaction, URL scheme
+    and operation. URLs are resolved and parsed once when the table is built,
+    so that picking the Form for a request is a dict lookup.
+    Thing-level Forms are indexed with None as the interaction type and name."""
+
+    def __init__(self, td):
+        self._index = {}
+        self._names = {}
+
+        self._add_forms(None, None, td.get_thing_forms(), td.base)
+
+        intrct_maps = [
+            (InteractionTypes.PROPERTY, td.properties),
+            (InteractionTypes.ACTION, td.actions),
+            (InteractionTypes.EVENT, td.events),
+        ]
+
+        for intrct_type, interactions in intrct_maps:
+            for name, interaction in interactions.items():
+                self._names.setdefault(name, intrct_type)
+                self._add_forms(intrct_type, name, interaction.forms, td.base)
+
+    def _add_forms(self, intrct_type, name, forms, base):
+        """Adds the Forms of an interaction to the index. Only the first Form
+        is kept for each (scheme, operation) pair, to preserve the TD order."""
+
+        for form in forms if forms else []:
+            resolved = resolve_form(form, base)
+
+            if resolved is None:
+                continue
+
+            ops = form.op if isinstance(form.op, list) else [form.op]
+
+            for op in set([None] + ops):
+                key = (intrct_type, name, resolved.scheme, op)
+                self._index.setdefault(key, resolved)
+
+    def pick(self, schemes, interaction_type=None, name=None, op=None):
+        """Returns the first ResolvedForm of the interaction that supports the
+        operation (any operation if op is None) trying the schemes in order of
+        preference. Returns None if the interaction does not have such a Form."""
+
+        for scheme in schemes:
+            resolved = self._index.get((interaction_type, name, scheme, op))
+
+            if resolved is not None:
+                return resolved
+
+        return None
+
+    def supports(self, name, schemes):
+        """Returns True if any of the Forms of the interaction
+        with the given name uses one of the given schemes."""
+
+        intrct_type = self._names.get(name)
+
+        if intrct_type is None:
+            return False
+
+        return self.pick(schemes, interaction_type=intrct_type, name=name) is not None
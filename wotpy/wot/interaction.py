@@ -31,6 +31,7 @@ class InteractionPattern(object):
 
         self._thing = thing
         self._name = name
+        self._url_name = slugify(name)
         self._forms = []
 
     def __getattr__(self, name):
@@ -69,7 +70,7 @@ class InteractionPattern(object):
     def url_name(self):
         """URL-safe version of the name."""
 
-        return slugify(self.name)
+        return self._url_name
 
     @property
     def forms(self):
@@ -81,6 +82,7 @@ class InteractionPattern(object):
         """Removes all the Forms from this Interaction."""
 
         self._forms = []
+        self._thing.bump_revision()
 
     def add_form(self, form):
         """Add a new Form."""
@@ -93,15 +95,18 @@ class InteractionPattern(object):
             raise ValueError("Duplicate Form: {}".format(form))
 
         self._forms.append(form)
+        self._thing.bump_revision()
 
     def remove_form(self, form):
         """Remove an existing Form."""
 
         try:
             pop_idx = self._forms.index(form)
-            self._forms.pop(pop_idx)
         except ValueError:
-            pass
+            return
+
+        self._forms.pop(pop_idx)
+        self._thing.bump_revision()
 
 
 class Property(InteractionPattern):
@@ -6,63 +6,48 @@ Class that represents a WoT servient.
 """
 
 import asyncio
+import collections
 import functools
+import hashlib
+import itertools
+import json
 import re
 import socket
-
-import tornado.web
+import types
+import uuid
+import weakref
 
 from wotpy.protocols.enums import Protocols
-from wotpy.protocols.http.client import HTTPClient
-from wotpy.protocols.ws.client import WebsocketClient
 from wotpy.support import is_coap_supported, is_dnssd_supported, is_mqtt_supported
 from wotpy.utils.utils import get_main_ipv4_address
+from wotpy.wot.catalogue import CatalogueChangeLog
 from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.executors import HandlerExecutors
 from wotpy.wot.exposed.thing_set import ExposedThingSet
 from wotpy.wot.td import ThingDescription
-from wotpy.wot.wot import WoT
-
-
-class TDHandler(tornado.web.RequestHandler):
-    """Handler that returns the TD document of a given Thing."""
-
-    def initialize(self, servient):
-        self.servient = servient
-
-    def get(self, thing_url_name):
-        exp_thing = self.servient.exposed_thing_set.find_by_thing_id(thing_url_name)
-
-        td_doc = ThingDescription.from_thing(exp_thing.thing).to_dict()
-        base_url = self.servient.get_thing_base_url(exp_thing)
-
-        if base_url:
-            td_doc.update({"base": base_url})
-
-        self.write(td_doc)
-
-
-class TDCatalogueHandler(tornado.web.RequestHandler):
-    """Handler that returns the entire catalogue of Things contained in this servient.
-    May return TDs in expanded format or URL pointers to the individual TDs."""
-
-    def initialize(self, servient):
-        self.servient = servient
-
-    def get(self):
-        response = {}
-
-        for exp_thing in self.servient.enabled_exposed_things:
-            thing_id = exp_thing.thing.id
 
-            if self.get_argument("expanded", False):
-                val = ThingDescription.from_thing(exp_thing.thing).to_dict()
-                val.update({"base": self.servient.get_thing_base_url(exp_thing)})
-            else:
-                val = "/{}".format(exp_thing.thing.url_name)
-
-            response[thing_id] = val
-
-        self.write(response)
+DEFAULT_CLIENT_PREFERENCES = {
+    InteractionTypes.PROPERTY: [
+        Protocols.HTTP,
+        Protocols.COAP,
+        Protocols.WEBSOCKETS,
+        Protocols.MQTT,
+    ],
+    InteractionTypes.ACTION: [
+        Protocols.WEBSOCKETS,
+        Protocols.MQTT,
+        Protocols.COAP,
+        Protocols.HTTP,
+    ],
+    InteractionTypes.EVENT: [
+        Protocols.WEBSOCKETS,
+        Protocols.MQTT,
+        Protocols.COAP,
+        Protocols.HTTP,
+    ],
+}
+
+SerializedTD = collections.namedtuple("SerializedTD", ["key", "body", "etag"])
 
 
 class ServientStateException(Exception):
@@ -121,6 +106,10 @@ class Servient(object):
         clients_config=None,
         dnssd_enabled=False,
         dnssd_instance_name=None,
+        property_store=None,
+        thread_pool_size=None,
+        process_pool_size=None,
+        client_preferences=None,
     ):
         self._hostname = hostname if hostname is not None else _get_hostname_fallback()
 
@@ -132,6 +121,9 @@ class Servient(object):
 
         self._servers = {}
         self._clients = clients if clients else {}
+        self._default_clients_pending = not len(self._clients)
+        self._client_preferences = self._build_client_preferences(client_preferences)
+        self._selected_clients = weakref.WeakKeyDictionary()
         self._clients_config = clients_config
         self._catalogue_port = catalogue_port
         self._catalogue_server = None
@@ -146,64 +138,75 @@ class Servient(object):
         self._dnssd_instance_name = dnssd_instance_name
         self._dnssd = None
         self._enabled_exposed_thing_ids = set()
+        self._serialized_tds = {}
+        self._catalogue_log = CatalogueChangeLog()
+        self._property_store = property_store
 
-        if not len(self._clients):
-            self._build_default_clients()
+        self._executors = HandlerExecutors(
+            thread_workers=thread_pool_size, process_workers=process_pool_size
+        )
+
+    @staticmethod
+    def _build_client_preferences(preferences):
+        """Takes a list of Protocols (used for all the Interaction types) or a dict that
+        maps Interaction types to lists of Protocols and returns the complete dict of
+        client preferences (with the default preferences for the missing types).
+        The lists of Protocols are copied into tuples, so they cannot be modified."""
+
+        preferences = preferences if preferences is not None else {}
+
+        if not isinstance(preferences, dict):
+            preferences = {
+                intrct_type: preferences for intrct_type in DEFAULT_CLIENT_PREFERENCES
+            }
+
+        for intrct_type, protocols in preferences.items():
+            if intrct_type not in DEFAULT_CLIENT_PREFERENCES:
+                raise ValueError("Unknown interaction type: {}".format(intrct_type))
+
+            for protocol in protocols:
+                if protocol not in Protocols.list():
+                    raise ValueError("Unknown protocol: {}".format(protocol))
+
+        ret = {key: tuple(val) for key, val in DEFAULT_CLIENT_PREFERENCES.items()}
+        ret.update({key: tuple(val) for key, val in preferences.items()})
+
+        return ret
 
     @staticmethod
-    def _default_select_client(clients, td, name):
+    def _default_select_client(clients, td, name, preferences=None):
         """Default implementation of the function to select
         a Protocol Binding client for an Interaction."""
 
-        protocol_preference_map = {
-            InteractionTypes.PROPERTY: [
-                Protocols.HTTP,
-                Protocols.COAP,
-                Protocols.WEBSOCKETS,
-                Protocols.MQTT,
-            ],
-            InteractionTypes.ACTION: [
-                Protocols.WEBSOCKETS,
-                Protocols.MQTT,
-                Protocols.COAP,
-                Protocols.HTTP,
-            ],
-            InteractionTypes.EVENT: [
-                Protocols.WEBSOCKETS,
-                Protocols.MQTT,
-                Protocols.COAP,
-                Protocols.HTTP,
-            ],
-        }
-
-        supported_protocols = [
-            client.protocol
-            for client in clients
-            if client.is_supported_interaction(td, name)
-        ]
-
-        intrct_names = {
-            InteractionTypes.PROPERTY: td.properties.keys(),
-            InteractionTypes.ACTION: td.actions.keys(),
-            InteractionTypes.EVENT: td.events.keys(),
-        }
+        preferences = preferences if preferences else DEFAULT_CLIENT_PREFERENCES
 
-        try:
-            intrct_type = next(
-                key for key, names in intrct_names.items() if name in names
-            )
-        except StopIteration:
-            raise ValueError("Unknown interaction: {}".format(name)) from None
+        if name in td.properties:
+            intrct_type = InteractionTypes.PROPERTY
+        elif name in td.actions:
+            intrct_type = InteractionTypes.ACTION
+        elif name in td.events:
+            intrct_type = InteractionTypes.EVENT
+        else:
+            raise ValueError("Unknown interaction: {}".format(name))
+
+        clients = list(clients)
+        clients_map = {client.protocol: client for client in clients}
 
-        protocol_prefs = protocol_preference_map[intrct_type]
-        protocol_choices = set(protocol_prefs).intersection(set(supported_protocols))
+        for protocol in preferences[intrct_type]:
+            client = clients_map.get(protocol, None)
 
-        if not len(protocol_choices):
-            return list(clients)[0]
+            if client is not None and client.is_supported_interaction(td, name):
+                return client
 
-        protocol = next(proto for proto in protocol_prefs if proto in protocol_choices)
+        preferred = set(preferences[intrct_type])
 
-        return next(client for client in clients if client.protocol == protocol)
+        for client in clients:
+            if client.protocol not in preferred and client.is_supported_interaction(
+                td, name
+            ):
+                return client
+
+        return clients[0]
 
     @property
     def is_running(self):
@@ -247,9 +250,29 @@ class Servient(object):
 
     @property
     def clients(self):
-        """Returns the dict of Protocol Binding clients attached to this servient."""
+        """Returns a read-only dict of the Protocol Binding clients attached to
+        this servient (use add_client and remove_client to modify it).
+        The default clients are built the first time they are needed."""
+
+        self._ensure_default_clients()
+
+        return types.MappingProxyType(self._clients)
+
+    @property
+    def client_preferences(self):
+        """Read-only dict that maps each Interaction type to the tuple of Protocols
+        in order of preference to select the client for an Interaction.
+        Use the setter to change the preferences."""
 
-        return self._clients
+        return types.MappingProxyType(self._client_preferences)
+
+    @client_preferences.setter
+    def client_preferences(self, preferences):
+        """Sets the Protocol preferences (a list for all the Interaction types
+        or a dict with lists for some of them) to select the clients."""
+
+        self._client_preferences = self._build_client_preferences(preferences)
+        self._selected_clients.clear()
 
     @property
     def catalogue_port(self):
@@ -264,6 +287,26 @@ class Servient(object):
 
         self._catalogue_port = port
 
+    @property
+    def property_store(self):
+        """Property value store shared by the ExposedThings created by this servient.
+        None if each ExposedThing should use its own default store."""
+
+        return self._property_store
+
+    @property
+    def executors(self):
+        """HandlerExecutors that run the handlers of the
+        ExposedThings that declare a thread or process execution mode."""
+
+        return self._executors
+
+    @property
+    def catalogue_version(self):
+        """Monotonically increasing version of the TD catalogue of this servient."""
+
+        return self._catalogue_log.version
+
     @property
     def dnssd(self):
         """Returns the DNS-SD instance linked to this Servient (if enabled and started)."""
@@ -298,9 +341,19 @@ class Servient(object):
         await self._dnssd.stop()
         self._dnssd = None
 
+    def _ensure_default_clients(self):
+        """Builds the default clients if they have not been built yet."""
+
+        if self._default_clients_pending:
+            self._default_clients_pending = False
+            self._build_default_clients()
+
     def _build_default_clients(self):
         """Builds the default Protocol Binding clients."""
 
+        from wotpy.protocols.http.client import HTTPClient
+        from wotpy.protocols.ws.client import WebsocketClient
+
         self._clients = self._clients if self._clients else {}
 
         conf = self._clients_config if self._clients_config else {}
@@ -332,9 +385,18 @@ class Servient(object):
         """Returns a Tornado app that provides one endpoint to retrieve the
         entire catalogue of thing descriptions contained in this servient."""
 
+        import tornado.web
+
+        from wotpy.wot.catalogue_handlers import (
+            TDCatalogueChangesHandler,
+            TDCatalogueHandler,
+            TDHandler,
+        )
+
         return tornado.web.Application(
             [
                 (r"/", TDCatalogueHandler, dict(servient=self)),
+                (r"/changes", TDCatalogueChangesHandler, dict(servient=self)),
                 (r"/(?P<thing_url_name>[^\/]+)", TDHandler, dict(servient=self)),
             ]
         )
@@ -361,6 +423,8 @@ class Servient(object):
         """Cleans all the Forms from all the ExposedThings contained in this Servient."""
 
         for exposed_thing in self._exposed_thing_set.exposed_things:
+            exposed_thing.thing.clean_forms()
+
             for interaction in exposed_thing.thing.interactions:
                 interaction.clean_forms()
 
@@ -374,13 +438,13 @@ class Servient(object):
         if protocol not in self._servers:
             raise ValueError("Unknown protocol")
 
-        for interaction in exposed_thing.thing.interactions:
-            forms_to_remove = [
-                form for form in interaction.forms if form.protocol == protocol
-            ]
+        for item in itertools.chain(
+            [exposed_thing.thing], exposed_thing.thing.interactions
+        ):
+            forms_to_remove = [form for form in item.forms if form.protocol == protocol]
 
             for form in forms_to_remove:
-                interaction.remove_form(form)
+                item.remove_form(form)
 
     def _server_has_exposed_thing(self, server, exposed_thing):
         """Returns True if the given server contains the ExposedThing."""
@@ -408,6 +472,49 @@ class Servient(object):
             for form in forms:
                 interaction.add_form(form)
 
+        thing_forms = server.build_thing_forms(
+            hostname=self._hostname, thing=exposed_thing.thing
+        )
+
+        for form in thing_forms:
+            exposed_thing.thing.add_form(form)
+
+    def _regenerate_exposed_thing_forms(self, server, exposed_thing):
+        """Cleans and regenerates Forms for the given server in the given ExposedThing."""
+
+        self._clean_protocol_forms(exposed_thing, server.protocol)
+
+        if self._server_has_exposed_thing(server, exposed_thing):
+            self._add_interaction_forms(server, exposed_thing)
+
+    def _regenerate_things_forms(self, server, exposed_things):
+        """Adds the given ExposedThings to the server and regenerates
+        their Forms for that server in a single pass."""
+
+        if server not in self._servers.values():
+            raise ValueError("Unknown server")
+
+        for exposed_thing in exposed_things:
+            server.add_exposed_thing(exposed_thing)
+
+        for exposed_thing in exposed_things:
+            thing = exposed_thing.thing
+
+            for item in itertools.chain([thing], thing.interactions):
+                for form in [
+                    form for form in item.forms if form.protocol == server.protocol
+                ]:
+                    item.remove_form(form)
+
+            for interaction in thing.interactions:
+                for form in server.build_forms(
+                    hostname=self._hostname, interaction=interaction
+                ):
+                    interaction.add_form(form)
+
+            for form in server.build_thing_forms(hostname=self._hostname, thing=thing):
+                thing.add_form(form)
+
     def _regenerate_server_forms(self, server):
         """Cleans and regenerates Forms for the given server in all ExposedThings."""
 
@@ -415,9 +522,7 @@ class Servient(object):
             raise ValueError("Unknown server")
 
         for exp_thing in self._exposed_thing_set.exposed_things:
-            self._clean_protocol_forms(exp_thing, server.protocol)
-            if self._server_has_exposed_thing(server, exp_thing):
-                self._add_interaction_forms(server, exp_thing)
+            self._regenerate_exposed_thing_forms(server, exp_thing)
 
     def get_thing_base_url(self, exposed_thing):
         """Return the base URL for the given ExposedThing
@@ -442,23 +547,83 @@ class Servient(object):
 
         return server.build_base_url(hostname=self.hostname, thing=exposed_thing.thing)
 
+    def get_serialized_td(self, exposed_thing):
+        """Returns the serialized TD document (including the base URL) of the given
+        ExposedThing together with a strong ETag. The serialized document is cached
+        and only rebuilt when the revision of the Thing or the base URL change."""
+
+        base_url = self.get_thing_base_url(exposed_thing)
+        key = (exposed_thing.thing.revision, base_url)
+        td_entry = self._serialized_tds.get(exposed_thing.thing.id)
+
+        if td_entry is not None and td_entry.key == key:
+            return td_entry
+
+        td_doc = ThingDescription.from_thing(exposed_thing.thing).to_dict()
+
+        if base_url:
+            td_doc.update({"base": base_url})
+
+        body = json.dumps(td_doc).encode()
+        etag = '"{}"'.format(hashlib.sha1(body).hexdigest())
+        td_entry = SerializedTD(key=key, body=body, etag=etag)
+        self._serialized_tds[exposed_thing.thing.id] = td_entry
+
+        return td_entry
+
+    def get_catalogue_etag(self, exposed_things):
+        """Returns a strong ETag for the serialized TDs of the given ExposedThings.
+        The ETag is derived from the content hashes of the cached serialized TDs,
+        so it can be computed before any of them is written to the client."""
+
+        hasher = hashlib.sha1()
+
+        for exp_thing in exposed_things:
+            td_entry = self.get_serialized_td(exp_thing)
+            hasher.update(json.dumps(exp_thing.thing.id).encode())
+            hasher.update(td_entry.etag.encode())
+
+        return '"{}"'.format(hasher.hexdigest())
+
     def select_client(self, td, name):
         """Returns the Protocol Binding client instance to
-        communicate with the given Interaction."""
+        communicate with the given Interaction.
+        The selected client is cached for each TD object and Interaction
+        until the clients or the preferences of the servient change."""
 
-        return Servient._default_select_client(self.clients.values(), td, name)
+        clients = self.clients
+
+        try:
+            td_clients = self._selected_clients.setdefault(td, {})
+        except TypeError:
+            td_clients = {}
+
+        client = td_clients.get(name, None)
+
+        if client is None:
+            client = Servient._default_select_client(
+                clients.values(), td, name, preferences=self._client_preferences
+            )
+
+            td_clients[name] = client
+
+        return client
 
     @_stopped_servient_only
     def add_client(self, client):
         """Adds a new Protocol Binding client to this servient."""
 
+        self._ensure_default_clients()
         self._clients[client.protocol] = client
+        self._selected_clients.clear()
 
     @_stopped_servient_only
     def remove_client(self, protocol):
         """Removes the Protocol Binding client with the given protocol from this servient."""
 
+        self._ensure_default_clients()
         self._clients.pop(protocol, None)
+        self._selected_clients.clear()
 
     @_stopped_servient_only
     def add_server(self, server):
@@ -481,17 +646,29 @@ class Servient(object):
         for server in self._servers.values():
             self._regenerate_server_forms(server)
 
+        for thing_id in self._enabled_exposed_thing_ids:
+            self._catalogue_log.record_changed(thing_id)
+
     def enable_exposed_thing(self, thing_id):
         """Enables the ExposedThing with the given ID.
         This is, the servers will listen for requests for this thing."""
 
-        exposed_thing = self.get_exposed_thing(thing_id)
+        self.enable_exposed_things([thing_id])
+
+    def enable_exposed_things(self, thing_ids):
+        """Enables the ExposedThings with the given IDs.
+        This is, the servers will listen for requests for these things.
+        Only the Forms of the given things are regenerated."""
+
+        exposed_things = [self.get_exposed_thing(thing_id) for thing_id in thing_ids]
 
         for server in self._servers.values():
-            server.add_exposed_thing(exposed_thing)
-            self._regenerate_server_forms(server)
+            self._regenerate_things_forms(server, exposed_things)
+
+        self._enabled_exposed_thing_ids.update(item.id for item in exposed_things)
 
-        self._enabled_exposed_thing_ids.add(exposed_thing.id)
+        for exposed_thing in exposed_things:
+            self._catalogue_log.record_added(exposed_thing.id)
 
     def disable_exposed_thing(self, thing_id):
         """Disables the ExposedThing with the given ID.
@@ -504,15 +681,17 @@ class Servient(object):
 
         for server in self._servers.values():
             server.remove_exposed_thing(exposed_thing.id)
-            self._regenerate_server_forms(server)
+            self._regenerate_exposed_thing_forms(server, exposed_thing)
 
         self._enabled_exposed_thing_ids.remove(exposed_thing.id)
+        self._catalogue_log.record_removed(exposed_thing.id)
 
     def add_exposed_thing(self, exposed_thing):
         """Adds an ExposedThing to this Servient.
         ExposedThings are disabled by default."""
 
         self._exposed_thing_set.add(exposed_thing)
+        self._catalogue_log.bump()
 
     def remove_exposed_thing(self, thing_id):
         """Disables and removes an ExposedThing from this Servient."""
@@ -520,7 +699,34 @@ class Servient(object):
         if thing_id in self._enabled_exposed_thing_ids:
             self.disable_exposed_thing(thing_id)
 
+        exp_thing = self._exposed_thing_set.find_by_thing_id(thing_id)
+
+        if exp_thing is not None:
+            self._serialized_tds.pop(exp_thing.thing.id, None)
+
         self._exposed_thing_set.remove(thing_id)
+        self._catalogue_log.bump()
+
+    def notify_td_change(self, exposed_thing):
+        """Notifies the servient that the TD of the given ExposedThing has changed.
+        The catalogue version is only bumped if the ExposedThing is enabled."""
+
+        if not self._exposed_thing_set.contains(exposed_thing):
+            return
+
+        self._catalogue_log.record_changed(exposed_thing.id)
+
+    def get_catalogue_changes(self, since):
+        """Returns the IDs of the Things that have been added,
+        changed or removed from the catalogue since the given version."""
+
+        return self._catalogue_log.changes_since(since)
+
+    async def wait_catalogue_changes(self, since, timeout):
+        """Waits until the catalogue version is greater than the
+        given version or the timeout (in seconds) expires."""
+
+        await self._catalogue_log.wait_for_changes(since, timeout)
 
     def get_exposed_thing(self, thing_id):
         """Finds and returns an ExposedThing contained in this servient by Thing ID.
@@ -542,6 +748,8 @@ class Servient(object):
     async def start(self):
         """Starts the servers and returns an instance of the WoT object."""
 
+        from wotpy.wot.wot import WoT
+
         async with self._servient_lock:
             self.refresh_forms()
             await asyncio.gather(*[server.start() for server in self._servers.values()])
@@ -558,4 +766,5 @@ class Servient(object):
             await asyncio.gather(*[server.stop() for server in self._servers.values()])
             self._stop_catalogue()
             await self._stop_dnssd()
+            self._executors.shutdown(wait=False)
             self._is_running = False
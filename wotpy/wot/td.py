@@ -7,9 +7,12 @@ Classes that represent the JSON and JSON-LD serialization formats of a Thing Des
 
 import json
 
-import jsonschema
+from slugify import slugify
 
+from wotpy.utils.validators import validate
 from wotpy.wot.dictionaries.thing import ThingFragment
+from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.form_table import FormTable
 from wotpy.wot.thing import Thing
 from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
 
@@ -19,30 +22,38 @@ class ThingDescription(object):
     Contains logic to validate and transform a Thing to a serialized TD and vice versa.
     """
 
-    def __init__(self, doc):
+    def __init__(self, doc, trusted=False):
         """Constructor.
-        Validates that the document conforms to the TD schema."""
+        Validates that the document conforms to the TD schema.
+        Validation is skipped for trusted documents
+        (i.e. those that have been generated by this runtime)."""
 
         self._doc = json.loads(doc) if isinstance(doc, (str, bytes)) else doc
         self._thing_fragment = ThingFragment(self._doc)
+        self._url_names = None
+        self._form_table = None
 
-        self.validate(doc=self._thing_fragment.to_dict())
+        if not trusted:
+            self.validate(doc=self._thing_fragment.to_dict())
 
     @classmethod
     def validate(cls, doc):
         """Validates the given Thing Description document against its schema.
         Raises ValidationError if validation fails."""
 
+        import jsonschema
+
         try:
-            jsonschema.validate(doc, SCHEMA_THING)
+            validate(doc, SCHEMA_THING)
         except (jsonschema.ValidationError, TypeError) as ex:
             raise InvalidDescription(str(ex)) from ex
 
     @classmethod
     def from_thing(cls, thing):
-        """Builds an instance of a JSON-serialized Thing Description from a Thing object."""
+        """Builds an instance of a JSON-serialized Thing Description from a Thing object.
+        The TD is trusted given that it has been generated by this runtime."""
 
-        return ThingDescription(thing.thing_fragment.to_dict())
+        return ThingDescription(thing.thing_fragment.to_dict(), trusted=True)
 
     def __getattr__(self, name):
         """Search for members that raised an AttributeError in
@@ -50,6 +61,16 @@ class ThingDescription(object):
 
         return getattr(self._thing_fragment, name)
 
+    @property
+    def form_table(self):
+        """FormTable with the Forms of this TD resolved against its base URI.
+        It is built on first access and reused afterwards."""
+
+        if self._form_table is None:
+            self._form_table = FormTable(self)
+
+        return self._form_table
+
     def to_dict(self):
         """Returns the JSON Thing Description as a dict."""
 
@@ -70,6 +91,25 @@ class ThingDescription(object):
 
         return Thing(thing_fragment=self.to_thing_fragment())
 
+    def find_interaction_name(self, name, interaction_type):
+        """Takes a case-insensitive URL-safe interaction name and returns the
+        actual name of the interaction of the given type (or None if not found)."""
+
+        if self._url_names is None:
+            intrct_names = {
+                InteractionTypes.PROPERTY: self.properties.keys(),
+                InteractionTypes.ACTION: self.actions.keys(),
+                InteractionTypes.EVENT: self.events.keys(),
+            }
+
+            self._url_names = {intrct_type: {} for intrct_type in intrct_names}
+
+            for intrct_type, names in intrct_names.items():
+                for key in names:
+                    self._url_names[intrct_type].setdefault(slugify(key), key)
+
+        return self._url_names[interaction_type].get(slugify(name), None)
+
     def get_forms(self, name):
         """Returns a list of FormDict for the interaction that matches the given name."""
 
@@ -84,6 +124,13 @@ class ThingDescription(object):
 
         return []
 
+    def get_thing_forms(self):
+        """Returns a list of FormDict for the operations that apply to the entire Thing."""
+
+        forms = self._thing_fragment.forms
+
+        return forms if forms else []
+
     def get_property_forms(self, name):
         """Returns a list of FormDict for the property that matches the given name."""
 
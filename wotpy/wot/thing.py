@@ -41,6 +41,13 @@ class Thing(object):
         self._properties = {}
         self._actions = {}
         self._events = {}
+        self._forms = []
+        self._interactions_by_name = {}
+        self._interactions_by_url_name = {}
+        self._revision = 0
+        self._thing_fragment_cache = None
+        self._uuid_cache = None
+        self._url_name_cache = None
         self._init_fragment_interactions()
 
     def __getattr__(self, name):
@@ -57,7 +64,8 @@ class Thing(object):
         if name_camel not in self.THING_FRAGMENT_WRITABLE_FIELDS:
             return super(Thing, self).__setattr__(name, value)
 
-        return self._thing_fragment.__setattr__(name, value)
+        self._thing_fragment.__setattr__(name, value)
+        self.bump_revision()
 
     def _init_fragment_interactions(self):
         """Adds the interactions declared in the ThingFragment to the instance private dicts."""
@@ -74,9 +82,29 @@ class Thing(object):
             event = Event(thing=self, name=name, init_dict=event_fragment)
             self.add_interaction(event)
 
+    @property
+    def revision(self):
+        """Counter that is increased every time the metadata, the
+        interactions or the forms of this Thing are updated."""
+
+        return self._revision
+
+    def bump_revision(self):
+        """Marks the materialized ThingFragment of this Thing as outdated.
+        Should be called whenever the Thing or its interactions are updated."""
+
+        self._revision += 1
+
     @property
     def thing_fragment(self):
-        """The ThingFragment dictionary of this Thing."""
+        """The ThingFragment dictionary of this Thing.
+        The fragment is cached until the next revision of this Thing
+        and shared between callers, so it should be treated as read-only."""
+
+        cache = self._thing_fragment_cache
+
+        if cache is not None and cache[0] == self._revision:
+            return cache[1]
 
         def interaction_to_json(intrct):
             """Returns the JSON serialization of an Interaction instance."""
@@ -114,19 +142,27 @@ class Thing(object):
             }
         )
 
-        return ThingFragment(doc)
+        if len(self._forms):
+            doc.update({"forms": [form.form_dict.to_dict() for form in self._forms]})
+        else:
+            doc.pop("forms", None)
+
+        fragment = ThingFragment(doc)
+        self._thing_fragment_cache = (self._revision, fragment)
+
+        return fragment
 
     @property
     def id(self):
         """Thing ID."""
 
-        return self.thing_fragment.id
+        return self._thing_fragment.id
 
     @property
     def title(self):
         """Thing title."""
 
-        return self.thing_fragment.title
+        return self._thing_fragment.title
 
     @property
     def uuid(self):
@@ -134,12 +170,21 @@ class Thing(object):
         This value is deterministic and derived from the Thing ID.
         It may be of use when URL-unsafe chars are not acceptable."""
 
+        thing_id = self.id
+        cache = self._uuid_cache
+
+        if cache is not None and cache[0] == thing_id:
+            return cache[1]
+
         # trunk-ignore(bandit/B324)
         hasher = hashlib.md5()
-        hasher.update(self.id.encode())
+        hasher.update(thing_id.encode())
         bytes_id_hash = hasher.digest()
 
-        return str(uuid.UUID(bytes=bytes_id_hash))
+        thing_uuid = str(uuid.UUID(bytes=bytes_id_hash))
+        self._uuid_cache = (thing_id, thing_uuid)
+
+        return thing_uuid
 
     @property
     def url_name(self):
@@ -147,7 +192,16 @@ class Thing(object):
         The URL name of a Thing is always unique and stable as long as the ID is unique.
         """
 
-        return slugify("{}-{}".format(self.title, self.uuid))
+        key = (self.id, self.title)
+        cache = self._url_name_cache
+
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
+        url_name = slugify("{}-{}".format(self.title, self.uuid))
+        self._url_name_cache = (key, url_name)
+
+        return url_name
 
     @property
     def properties(self):
@@ -175,14 +229,65 @@ class Thing(object):
             self._properties.values(), self._actions.values(), self._events.values()
         )
 
+    @property
+    def forms(self):
+        """Sequence of Forms for the operations that apply
+        to the entire Thing (e.g. reading all Properties)."""
+
+        return self._forms
+
+    def clean_forms(self):
+        """Removes all the Thing-level Forms."""
+
+        self._forms = []
+        self.bump_revision()
+
+    def add_form(self, form):
+        """Add a new Thing-level Form."""
+
+        assert form.interaction is self
+
+        existing = next((True for item in self._forms if item.id == form.id), False)
+
+        if existing:
+            raise ValueError("Duplicate Form: {}".format(form))
+
+        self._forms.append(form)
+        self.bump_revision()
+
+    def remove_form(self, form):
+        """Remove an existing Thing-level Form."""
+
+        try:
+            pop_idx = self._forms.index(form)
+        except ValueError:
+            return
+
+        self._forms.pop(pop_idx)
+        self.bump_revision()
+
     def find_interaction(self, name):
         """Finds an existing Interaction by name.
         The name argument may be the original name or the URL-safe version."""
 
-        def is_match(intrct):
-            return intrct.name == name or intrct.url_name == name
+        interaction = self._interactions_by_name.get(name, None)
+
+        if interaction is not None:
+            return interaction
+
+        return self._interactions_by_url_name.get(name, None)
+
+    def find_normalized_interaction(self, name):
+        """Finds an existing Interaction by name.
+        The name argument is normalized to its URL-safe version before the search,
+        so the lookup is case-insensitive."""
+
+        interaction = self._interactions_by_name.get(name, None)
+
+        if interaction is not None:
+            return interaction
 
-        return next((intrct for intrct in self.interactions if is_match(intrct)), None)
+        return self._interactions_by_url_name.get(slugify(name), None)
 
     def add_interaction(self, interaction):
         """Add a new Interaction."""
@@ -211,6 +316,9 @@ class Thing(object):
         )
 
         interaction_dict_map[interaction_class][interaction.name] = interaction
+        self._interactions_by_name[interaction.name] = interaction
+        self._interactions_by_url_name[interaction.url_name] = interaction
+        self.bump_revision()
 
     def remove_interaction(self, name):
         """Removes an existing Interaction by name.
@@ -224,3 +332,6 @@ class Thing(object):
         self._properties.pop(interaction.name, None)
         self._actions.pop(interaction.name, None)
         self._events.pop(interaction.name, None)
+        self._interactions_by_name.pop(interaction.name, None)
+        self._interactions_by_url_name.pop(interaction.url_name, None)
+        self.bump_revision()
@@ -177,6 +177,7 @@ SCHEMA_THING = {
             "additionalProperties": False,
         },
         "links": {"type": "array", "items": SCHEMA_LINK},
+        "forms": {"type": "array", "items": SCHEMA_FORM},
         "security": {"type": "array", "items": {"type": "string"}},
         "securityDefinitions": {
             "type": "object",
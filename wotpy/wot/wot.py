@@ -10,11 +10,8 @@ import json
 import logging
 import warnings
 
-import tornado.gen
-from rx import Observable
-from tornado.httpclient import AsyncHTTPClient, HTTPRequest
-
 from wotpy.support import is_dnssd_supported
+from wotpy.utils.observable import Observable
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.consumed.thing import ConsumedThing
 from wotpy.wot.dictionaries.thing import ThingFragment
@@ -93,6 +90,9 @@ class WoT(object):
         def subscribe(observer):
             """Browses the Servient services using DNS-SD and retrieves the TDs that match the filters."""
 
+            import tornado.gen
+            from tornado.httpclient import AsyncHTTPClient
+
             state = {"stop": False}
 
             @handle_observer_finalization(observer)
@@ -191,19 +191,29 @@ class WoT(object):
         return Observable.merge(*observables)
 
     @classmethod
-    async def fetch(cls, url, timeout_secs=None):
-        """Accepts an url argument and returns a Future
-        that resolves with a Thing Description string."""
+    async def _fetch_td(cls, url, timeout_secs=None):
+        """Retrieves and validates the Thing Description
+        in the given URL and returns a ThingDescription."""
 
         timeout_secs = timeout_secs or DEFAULT_FETCH_TIMEOUT_SECS
 
+        from tornado.httpclient import AsyncHTTPClient, HTTPRequest
+
         http_client = AsyncHTTPClient()
         http_request = HTTPRequest(url, request_timeout=timeout_secs)
 
         http_response = await http_client.fetch(http_request)
 
         td_doc = json.loads(http_response.body)
-        td = ThingDescription(td_doc)
+
+        return ThingDescription(td_doc)
+
+    @classmethod
+    async def fetch(cls, url, timeout_secs=None):
+        """Accepts an url argument and returns a Future
+        that resolves with a Thing Description string."""
+
+        td = await cls._fetch_td(url, timeout_secs=timeout_secs)
 
         return td.to_str()
 
@@ -248,8 +258,8 @@ class WoT(object):
         """Return a Future that resolves to an ExposedThing created
         from the thing description retrieved from the given URL."""
 
-        td_str = await self.fetch(url, timeout_secs=timeout_secs)
-        exposed_thing = self.produce(td_str)
+        td = await self._fetch_td(url, timeout_secs=timeout_secs)
+        exposed_thing = self.produce(td.to_thing_fragment())
 
         return exposed_thing
 
@@ -257,8 +267,8 @@ class WoT(object):
         """Return a Future that resolves to a ConsumedThing created
         from the thing description retrieved from the given URL."""
 
-        td_str = await self.fetch(url, timeout_secs=timeout_secs)
-        consumed_thing = self.consume(td_str)
+        td = await self._fetch_td(url, timeout_secs=timeout_secs)
+        consumed_thing = ConsumedThing(servient=self._servient, td=td)
 
         return consumed_thing
 